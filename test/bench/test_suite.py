@@ -0,0 +1,66 @@
+import os
+import tempfile
+import unittest
+
+from understandingbitcoin.bench import suite
+from understandingbitcoin.hash import backend
+
+
+class TestSuite(unittest.TestCase):
+
+    """Unit test for the benchmark suite"""
+
+    def test_cases(self):
+        actual_result: dict = suite.cases([0, 64])
+
+        self.assertTrue({f'sha256.hash[{name}]/{size}' for name in backend.available_backends()
+                         for size in (0, 64)} <= set(actual_result))
+        self.assertIn('bytebuffer.get_word32[little_endian]', actual_result)
+        self.assertIn('bitstream.rotate_right', actual_result)
+
+    def test_run(self):
+        actual_result: dict = suite.run({'case': lambda: None}, min_seconds=0)
+
+        self.assertEqual(['case'], list(actual_result['seconds']))
+
+    def test_compare(self):
+        baseline: dict = {'seconds': {'equal': 1.0, 'tolerated': 1.0, 'slower': 1.0, 'faster': 1.0}}
+        results: dict = {'seconds': {'equal': 1.0, 'tolerated': 1.2, 'slower': 2.0, 'faster': 0.5, 'new': 9.0}}
+
+        actual_result: dict = suite.compare(results, baseline, tolerance=0.25)
+
+        self.assertEqual({'slower': 2.0}, actual_result)
+
+    def test_compare_negative_tolerance(self):
+        self.assertRaises(ValueError, suite.compare, {'seconds': {}}, {'seconds': {}}, -1)
+
+    def test_save_and_load(self):
+        results: dict = suite.run({'case': lambda: None}, min_seconds=0)
+        with tempfile.TemporaryDirectory() as directory:
+            path: str = os.path.join(directory, 'baseline.json')
+            suite.save(results, path)
+
+            actual_result: dict = suite.load(path)
+
+        self.assertEqual(results, actual_result)
+
+    def test_account(self):
+        actual_result: dict = suite.account([0])
+
+        self.assertEqual({f'sha256.hash[{name}]/0' for name in suite.ALLOCATION_BUDGETS}, set(actual_result))
+        self.assertEqual({}, suite.check_budgets(actual_result))
+
+    def test_account_large_message(self):
+        actual_result: dict = suite.account([suite.MAX_ACCOUNTED_SIZE + 1])
+
+        self.assertEqual({}, actual_result)
+
+    def test_check_budgets(self):
+        allocations: dict = {
+            'sha256.hash[didactic]/64': {'bitstreams': 2000.0, 'bytebuffers': 2.0, 'peak_bytes': 9000},
+            'sha256.hash[hashlib]/64': {'bitstreams': 1.0, 'bytebuffers': 0.0, 'peak_bytes': 100},
+        }
+
+        actual_result: dict = suite.check_budgets(allocations)
+
+        self.assertEqual({'sha256.hash[hashlib]/64': {'bitstreams': (1.0, 0)}}, actual_result)
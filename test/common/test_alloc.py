@@ -0,0 +1,58 @@
+import unittest
+
+from understandingbitcoin.common import alloc
+from understandingbitcoin.common.bit import BitStream
+from understandingbitcoin.common.byte import ByteBuffer, ByteOrder
+from understandingbitcoin.hash.sha256 import Sha256
+
+
+class TestAlloc(unittest.TestCase):
+
+    """Unit test for the accounting mode of allocations"""
+
+    def test_accounting(self):
+        retained: list = []
+        with alloc.accounting() as counters:
+            bitstream: BitStream = BitStream('1010')
+            for _ in range(10):
+                bitstream = bitstream ^ BitStream.from_unsigned_int(5, zfill=4)
+            retained.append(bitstream)
+            byte_buffer: ByteBuffer = ByteBuffer(ByteOrder.LITTLE_ENDIAN)
+            byte_buffer.put_byte(1)
+            retained.append(byte_buffer[0])
+            del bitstream, byte_buffer
+
+        self.assertEqual((21, 1, 2, 1), (counters.bitstreams, counters.retained_bitstreams,
+                                         counters.bytebuffers, counters.retained_bytebuffers))
+        self.assertEqual(20, counters.temporary_bitstreams)
+        self.assertEqual(1, counters.temporary_bytebuffers)
+        self.assertGreaterEqual(counters.peak_bytes, counters.retained_bytes)
+
+    def test_constructors_restored(self):
+        with self.assertRaises(ZeroDivisionError), alloc.accounting() as counters:
+            _ = 1 / 0
+        # the operators and the slices create objects without __init__
+        _ = BitStream('1') ^ BitStream('1')
+        _ = ByteBuffer.from_bytes(b'ab', ByteOrder.BIG_ENDIAN)[1:]
+
+        self.assertEqual((0, 0), (counters.bitstreams, counters.bytebuffers))
+
+    def test_per_call(self):
+        with alloc.accounting() as counters:
+            Sha256.hash(b'abc', 'didactic')
+            Sha256.hash(b'abc', 'didactic')
+
+        actual_result: dict = counters.per_call(2)
+
+        self.assertEqual(counters.bitstreams / 2, actual_result['bitstreams'])
+        self.assertEqual(counters.temporary_bytebuffers / 2, actual_result['temporary_bytebuffers'])
+        self.assertRaises(ValueError, counters.per_call, 0)
+
+    def test_report(self):
+        with alloc.accounting() as counters:
+            Sha256.hash(b'abc', 'didactic')
+
+        actual_result: str = alloc.report(counters)
+
+        self.assertIn('bitstreams', actual_result)
+        self.assertIn('peak_bytes', actual_result)
@@ -12,7 +12,21 @@ class TestBitStream(unittest.TestCase):
 
         actual_result: BitStream = BitStream.from_bytes(bytes_value)
 
-        self.assertEqual('100110101111', actual_result)
+        self.assertEqual('0000100110101111', actual_result)
+
+    def test_from_bytes_leading_zeros(self):
+        bytes_value: bytes = bytes.fromhex('0000ff')
+
+        actual_result: BitStream = BitStream.from_bytes(bytes_value)
+
+        self.assertEqual(('0000ff', 24), (actual_result.hex(), len(actual_result)))
+
+    def test_from_buffer(self):
+        buffer: memoryview = memoryview(bytearray.fromhex('00f731'))
+
+        actual_result: BitStream = BitStream.from_buffer(buffer)
+
+        self.assertEqual('000000001111011100110001', actual_result)
 
     def test_from_char(self):
         char: str = 'a'
@@ -49,6 +63,22 @@ class TestBitStream(unittest.TestCase):
 
         self.assertEqual('1111011100110001', actual_result)
 
+    def test_from_hex_leading_zeros(self):
+        hex_value: str = '00F'
+
+        actual_result: BitStream = BitStream.from_hex(hex_value)
+
+        self.assertEqual('000000001111', actual_result)
+
+    def test_from_hex_empty(self):
+        actual_result: BitStream = BitStream.from_hex('')
+
+        self.assertEqual(0, len(actual_result))
+
+    def test_from_hex_invalid(self):
+        self.assertRaises(ValueError, BitStream.from_hex, '0x1f')
+        self.assertRaises(ValueError, BitStream.from_hex, ' 1f')
+
     def test_from_int(self):
         integer: int = 2
 
@@ -127,6 +157,25 @@ class TestBitStream(unittest.TestCase):
 
         self.assertEqual('10', actual_result)
 
+    def test_getitem_slice_leading_zeros(self):
+        bitstream: BitStream = BitStream.parse_str('00010110')
+
+        actual_result: BitStream = bitstream[:4]
+
+        self.assertEqual('0001', actual_result)
+
+    def test_getitem_step_slice(self):
+        bitstream: BitStream = BitStream.parse_str('00010110')
+
+        actual_result: tuple = (bitstream[::2], bitstream[::-1], bitstream[1:1:2])
+
+        self.assertEqual(('0001', '01101000', ''), actual_result)
+
+    def test_getitem_out_of_range(self):
+        bitstream: BitStream = BitStream.parse_str('01')
+
+        self.assertRaises(IndexError, lambda: bitstream[2])
+
     def test_add(self):
         bitstream1: BitStream = BitStream.from_unsigned_int(1)
         bitstream2: BitStream = BitStream.from_unsigned_int(2)
@@ -135,6 +184,22 @@ class TestBitStream(unittest.TestCase):
 
         self.assertEqual('11', actual_result)
 
+    def test_add_carry(self):
+        bitstream1: BitStream = BitStream.parse_str('0011')
+        bitstream2: BitStream = BitStream.parse_str('1101')
+
+        actual_result: BitStream = bitstream1 + bitstream2
+
+        self.assertEqual('10000', actual_result)
+
+    def test_add_leading_zeros(self):
+        bitstream1: BitStream = BitStream.parse_str('0001')
+        bitstream2: BitStream = BitStream.parse_str('01')
+
+        actual_result: BitStream = bitstream1 + bitstream2
+
+        self.assertEqual('0010', actual_result)
+
     def test_add_empty_first(self):
         bitstream1: BitStream = BitStream()
         bitstream2: BitStream = BitStream.from_unsigned_int(2)
@@ -206,6 +271,13 @@ class TestBitStream(unittest.TestCase):
 
         self.assertEqual('01', actual_result)
 
+    def test_invert_leading_zeros(self):
+        bitstream: BitStream = BitStream.parse_str('0011')
+
+        actual_result: BitStream = ~bitstream
+
+        self.assertEqual('1100', actual_result)
+
     def test_radd_int(self):
         integer: int = 2
         bitstream: BitStream = BitStream('01')
@@ -269,6 +341,18 @@ class TestBitStream(unittest.TestCase):
 
         self.assertEqual('001', actual_result)
 
+    def test_reverse_bytes(self):
+        bitstream: BitStream = BitStream.from_unsigned_int(0x00010203, zfill=32)
+
+        actual_result: BitStream = bitstream.reverse_bytes()
+
+        self.assertEqual('03020100', actual_result.hex())
+
+    def test_reverse_bytes_not_multiple_of_eight(self):
+        bitstream: BitStream = BitStream.parse_str('101')
+
+        self.assertRaises(ValueError, bitstream.reverse_bytes)
+
     def test_rotate_left(self):
         bitstream: BitStream = BitStream.parse_str('001')
 
@@ -283,6 +367,20 @@ class TestBitStream(unittest.TestCase):
 
         self.assertEqual('010', actual_result)
 
+    def test_rotate_right(self):
+        bitstream: BitStream = BitStream.parse_str('0011')
+
+        actual_result: BitStream = bitstream.rotate_right(1)
+
+        self.assertEqual('1001', actual_result)
+
+    def test_rotate_right_shifts_multiple_of_bitstream_length(self):
+        bitstream: BitStream = BitStream.parse_str('001')
+
+        actual_result: BitStream = bitstream.rotate_right(6)
+
+        self.assertEqual('001', actual_result)
+
     def test_rotate_right_shifts_greater_than_bitstream_length(self):
         bitstream: BitStream = BitStream.parse_str('001')
 
@@ -297,6 +395,13 @@ class TestBitStream(unittest.TestCase):
 
         self.assertEqual('10110', actual_result)
 
+    def test_mod_shorter_than_divisor(self):
+        bitstream: BitStream = BitStream.parse_str('101')
+
+        actual_result: BitStream = bitstream.mod(5)
+
+        self.assertEqual('101', actual_result)
+
     def test_len(self):
         bitstream: BitStream = BitStream.parse_str('01')
 
@@ -304,6 +409,20 @@ class TestBitStream(unittest.TestCase):
 
         self.assertEqual(2, actual_result)
 
+    def test_int(self):
+        bitstream: BitStream = BitStream.parse_str('00001010')
+
+        actual_result: int = int(bitstream)
+
+        self.assertEqual(10, actual_result)
+
+    def test_str_leading_zeros(self):
+        bitstream: BitStream = BitStream.from_unsigned_int(5, zfill=8)
+
+        actual_result: str = str(bitstream)
+
+        self.assertEqual('00000101', actual_result)
+
     def test_hex_int(self):
         integer: int = 0x0f731
 
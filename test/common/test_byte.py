@@ -25,6 +25,28 @@ class TestByteBuffer(unittest.TestCase):
 
         self.assertEqual('09af', actual_result)
 
+    def test_from_hex_invalid(self):
+        self.assertRaises(ValueError, ByteBuffer.from_hex, '09 af')
+        self.assertRaises(ValueError, ByteBuffer.from_hex, '09a')
+
+    def test_from_bytes(self):
+        byte_buffer = ByteBuffer.from_bytes(bytearray.fromhex('0009af'), order=ByteOrder.LITTLE_ENDIAN)
+        byte_buffer.put_byte(0xee)
+
+        actual_result: tuple = (byte_buffer.hex(), byte_buffer.get_word16().hex())
+
+        self.assertEqual(('0009afee', '0900'), actual_result)
+
+    def test_from_buffer(self):
+        data: bytearray = bytearray.fromhex('0009af')
+        byte_buffer = ByteBuffer.from_buffer(data)
+        data[0] = 0xee
+
+        actual_result: str = byte_buffer.hex()
+
+        self.assertEqual('ee09af', actual_result)
+        self.assertRaises(ValueError, byte_buffer.put_byte, 0xee)
+
     def test_len(self):
         byte_buffer = ByteBuffer.from_hex('09af')
 
@@ -60,6 +82,39 @@ class TestByteBuffer(unittest.TestCase):
 
         self.assertEqual('bbcc', actual_result)
 
+    @parameterized.expand([
+        ('big-endian byte buffer', ByteOrder.BIG_ENDIAN, 'ccddeeff'),
+        ('little-endian byte buffer', ByteOrder.LITTLE_ENDIAN, 'ffeeddcc'),
+    ])
+    def test_getitem_slice_get_word32(self, _, order: ByteOrder, word: str):
+        byte_buffer = ByteBuffer.from_hex('aabbccddeeff', order=order)
+
+        actual_result: str = byte_buffer[2:6].get_word32().hex()
+
+        self.assertEqual(word, actual_result)
+
+    def test_getitem_slice_own_read_position(self):
+        byte_buffer = ByteBuffer.from_hex('aabbccdd')
+        byte_buffer.get_byte()
+
+        actual_result: str = byte_buffer[2:].get_byte().hex()
+
+        self.assertEqual('cc', actual_result)
+
+    def test_getitem_slice_read_only(self):
+        byte_buffer = ByteBuffer.from_hex('aabbccdd')
+
+        self.assertRaises(ValueError, byte_buffer[1:3].put_byte, 0xee)
+
+    def test_getitem_slice_put_after_slicing(self):
+        byte_buffer = ByteBuffer.from_hex('aabbccdd')
+        view = byte_buffer[1:3]
+        byte_buffer.put_byte(0xee)
+
+        actual_result: tuple = (byte_buffer.hex(), view.hex())
+
+        self.assertEqual(('aabbccddee', 'bbcc'), actual_result)
+
     def test_get_byte(self):
         byte_buffer = ByteBuffer.from_hex('aabb')
 
@@ -196,6 +251,20 @@ class TestByteBuffer(unittest.TestCase):
 
         self.assertEqual('3f', actual_result)
 
+    def test_put_byte_out_of_range(self):
+        bytebuffer = ByteBuffer()
+
+        self.assertRaises(ValueError, bytebuffer.put_byte, 256)
+
+    def test_put_byte_many(self):
+        bytebuffer = ByteBuffer()
+        for i in range(100000):
+            bytebuffer.put_byte(i % 256)
+
+        actual_result: bytes = bytebuffer.bytes()
+
+        self.assertEqual(bytes(i % 256 for i in range(100000)), actual_result)
+
     def test_put_word16_big_endian(self):
         bytebuffer = ByteBuffer(order=ByteOrder.BIG_ENDIAN)
         bytebuffer.put_word16(BitStream.from_unsigned_int(10, zfill=16))
@@ -0,0 +1,71 @@
+import asyncio
+import unittest
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from understandingbitcoin.hash.aio import AsyncHasher
+from understandingbitcoin.hash.sha256 import Sha256
+
+
+def _create_reader(data: bytes) -> asyncio.StreamReader:
+    reader = asyncio.StreamReader()
+    reader.feed_data(data)
+    reader.feed_eof()
+    return reader
+
+
+class TestAsyncHasher(unittest.IsolatedAsyncioTestCase):
+
+    """Unit test for the AsyncHasher class"""
+
+    async def test_consume(self):
+        message: bytes = bytes(range(256)) * 10
+        hasher = AsyncHasher(blocks_per_batch=2)
+
+        num_bytes: int = await hasher.consume(_create_reader(message), chunk_size=1000)
+
+        self.assertEqual((len(message), Sha256.hash(message)), (num_bytes, hasher.digest()))
+
+    async def test_consume_limit(self):
+        message: bytes = bytes(range(256)) * 10
+        reader: asyncio.StreamReader = _create_reader(message)
+        hasher = AsyncHasher()
+
+        num_bytes: int = await hasher.consume(reader, 1000, chunk_size=300)
+
+        self.assertEqual((1000, Sha256.hash(message[:1000]), message[1000:]),
+                         (num_bytes, hasher.digest(), await reader.read()))
+
+    async def test_update_yields_to_event_loop(self):
+        events: list = []
+
+        async def other_task():
+            events.append('other task')
+
+        hasher = AsyncHasher(blocks_per_batch=1)
+        task: asyncio.Task = asyncio.create_task(other_task())
+        await hasher.update(bytes(64 * 3))
+        events.append('hashed')
+        await task
+
+        self.assertEqual(['other task', 'hashed'], events)
+
+    async def test_update_offload(self):
+        message: bytes = bytes(range(256)) * 10
+        with ThreadPoolExecutor(1) as executor:
+            hasher = AsyncHasher(executor=executor, offload_size=1024)
+            await hasher.update(message[:100])
+            await hasher.update(message[100:])
+
+        self.assertEqual(Sha256.hash(message), hasher.digest())
+
+    async def test_update_offload_process(self):
+        message: bytes = bytes(range(256)) * 10
+        with ProcessPoolExecutor(1) as executor:
+            hasher = AsyncHasher(executor=executor, offload_size=1024)
+            await hasher.update(message[:100])
+            await hasher.update(message[100:])
+
+        self.assertEqual(Sha256.hash(message), hasher.digest())
+
+    def test_invalid_blocks_per_batch(self):
+        self.assertRaises(ValueError, AsyncHasher, blocks_per_batch=0)
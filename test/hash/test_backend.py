@@ -0,0 +1,106 @@
+import os
+import threading
+import unittest
+from unittest import mock
+
+from parameterized import parameterized
+
+from understandingbitcoin.hash import backend
+from understandingbitcoin.hash.ripemd160 import Ripemd160
+from understandingbitcoin.hash.sha224 import Sha224
+from understandingbitcoin.hash.sha256 import Sha256
+from understandingbitcoin.hash.sha512 import Sha512
+
+MESSAGES: tuple = (b'', b'Satoshi Nakamoto', b'a' * 55, bytes(range(256)) * 3)
+
+
+class TestBackend(unittest.TestCase):
+
+    """Unit test for the registry of hash backends"""
+
+    @parameterized.expand([
+        ('sha224', Sha224),
+        ('sha256', Sha256),
+        ('sha512', Sha512),
+        ('ripemd160', Ripemd160),
+    ])
+    def test_backends_equal(self, _, algorithm):
+        if not backend.hashlib_supports(algorithm.name):
+            self.skipTest(f'hashlib does not support {algorithm.name}')
+
+        expected: list = [algorithm.hash(message, backend.HASHLIB) for message in MESSAGES]
+
+        actual_result: dict = {name: [algorithm.hash(message, name) for message in MESSAGES]
+                               for name in backend.available_backends()}
+
+        self.assertEqual({name: expected for name in backend.available_backends()}, actual_result)
+
+    @parameterized.expand([(name,) for name in (backend.DIDACTIC, backend.OPTIMIZED, backend.HASHLIB)])
+    def test_hash256_backend(self, name):
+        with backend.use_backend(name):
+            actual_result: list = [Sha256.hash256(message) for message in MESSAGES]
+
+        self.assertEqual([Sha256.hash(Sha256.hash(message), backend.DIDACTIC) for message in MESSAGES], actual_result)
+
+    @parameterized.expand([(name,) for name in (backend.DIDACTIC, backend.OPTIMIZED, backend.HASHLIB)])
+    def test_hash160_backend(self, name):
+        with backend.use_backend(name):
+            actual_result: list = [Ripemd160.hash160(message) for message in MESSAGES]
+
+        self.assertEqual([Ripemd160.hash(Sha256.hash(message, backend.DIDACTIC), backend.DIDACTIC) for message in MESSAGES], actual_result)
+
+    def test_hash256_use_backend(self):
+        calls: list = []
+        # the backend is only registered in this test
+        with mock.patch.dict(backend._BACKENDS):  # pylint: disable=protected-access
+            backend.register_backend('recording', lambda algorithm, message: calls.append(message) or bytes(32))
+            with backend.use_backend('recording'):
+                Sha256.hash256(b'message')
+
+        self.assertEqual([b'message', bytes(32)], calls)
+
+    def test_default_backend(self):
+        with mock.patch.dict(os.environ, clear=True):
+            actual_result: str = backend.current_backend()
+
+        self.assertEqual(backend.DIDACTIC, actual_result)
+
+    def test_environment_variable(self):
+        with mock.patch.dict(os.environ, {backend.ENVIRONMENT_VARIABLE: backend.OPTIMIZED}):
+            actual_result: str = backend.current_backend()
+
+        self.assertEqual(backend.OPTIMIZED, actual_result)
+
+    def test_use_backend(self):
+        calls: list = []
+        # the backend is only registered in this test
+        with mock.patch.dict(backend._BACKENDS):  # pylint: disable=protected-access
+            backend.register_backend('recording', lambda algorithm, message: calls.append(message) or b'')
+            with backend.use_backend('recording'):
+                Sha256.hash(b'message')
+
+            Sha256.hash(b'other message', backend.DIDACTIC)
+
+        self.assertEqual([b'message'], calls)
+
+    def test_use_backend_other_thread(self):
+        actual_result: list = []
+        with mock.patch.dict(os.environ, clear=True), backend.use_backend(backend.HASHLIB):
+            thread = threading.Thread(target=lambda: actual_result.append(backend.current_backend()))
+            thread.start()
+            thread.join()
+            actual_result.append(backend.current_backend())
+
+        self.assertEqual([backend.DIDACTIC, backend.HASHLIB], actual_result)
+
+    def test_hashlib_unsupported(self):
+        with mock.patch.object(backend, 'hashlib_supports', return_value=False):
+            actual_result: bytes = Ripemd160.hash(b'message', backend.HASHLIB)
+
+        self.assertEqual(Ripemd160.hash(b'message', backend.DIDACTIC), actual_result)
+
+    def test_unknown_backend(self):
+        self.assertRaises(ValueError, Sha256.hash, b'', 'unknown')
+
+    def test_replace_didactic_backend(self):
+        self.assertRaises(ValueError, backend.register_backend, backend.DIDACTIC, lambda algorithm, message: b'')
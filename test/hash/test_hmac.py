@@ -0,0 +1,48 @@
+import hashlib
+import hmac
+import unittest
+
+from parameterized import parameterized
+
+from understandingbitcoin.hash.hmac import Hmac
+from understandingbitcoin.hash.ripemd160 import Ripemd160
+from understandingbitcoin.hash.sha512 import Sha512
+
+
+class TestHmac(unittest.TestCase):
+
+    """Unit test for the Hmac class"""
+
+    @parameterized.expand([
+        ('rfc 4231 case 1', '0b' * 20, b'Hi There', 'b0344c61d8db38535ca8afceaf0bf12b881dc200c9833da726e9376c2e32cff7'),
+        ('rfc 4231 case 2', b'Jefe'.hex(), b'what do ya want for nothing?', '5bdcc146bf60754e6a042426089575c75a003f089d2739839dec58b964ec3843'),
+        ('rfc 4231 case 6', 'aa' * 131, b'Test Using Larger Than Block-Size Key - Hash Key First',
+         '60e431591ee0b67f0d8a26aacbf5b77f8e0bc6213728c5140546040f0ee37f54'),
+    ])
+    def test_equals(self, _, key, message, mac):
+        actual_result: str = Hmac(bytes.fromhex(key)).hexdigest(message)
+
+        self.assertEqual(mac, actual_result)
+
+    def test_reused_key(self):
+        key: bytes = b'key'
+        messages: list = [bytes(range(n)) for n in (0, 1, 55, 64, 100)]
+        mac = Hmac(key)
+
+        actual_result: list = [mac.digest(message) for message in messages]
+
+        self.assertEqual([hmac.new(key, message, hashlib.sha256).digest() for message in messages], actual_result)
+
+    def test_ripemd160(self):
+        key: bytes = bytes(range(80))
+
+        actual_result: bytes = Hmac(key, Ripemd160).digest(b'message')
+
+        self.assertEqual(hmac.new(key, b'message', 'ripemd160').digest(), actual_result)
+
+    def test_sha512(self):
+        key: bytes = bytes(range(200))
+
+        actual_result: bytes = Hmac(key, Sha512).digest(b'message')
+
+        self.assertEqual(hmac.new(key, b'message', hashlib.sha512).digest(), actual_result)
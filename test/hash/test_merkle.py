@@ -0,0 +1,135 @@
+import unittest
+
+from parameterized import parameterized
+
+from understandingbitcoin.hash.merkle import MerkleProof, MerkleTree
+from understandingbitcoin.hash.sha256 import Sha256
+
+# transaction ids of the block 100000 and its Merkle root, as displayed
+BLOCK_100000_TXIDS: tuple = (
+    '8c14f0db3df150123e6f3dbbf30f8b955a8249b62ac1d1ff16284aefa3d06d87',
+    'fff2525b8931402dd09222c50775608f75787bd2b87e56995a7bdd30f79702c4',
+    '6359f0868171b1d194cbee1af2f16ea598ae8fad666d9b012c8ed2b79a236ec4',
+    'e9a66845e05d5abc0ad04ec80f774a7e585c6e8db975962d069a522137b80c1d',
+)
+BLOCK_100000_MERKLE_ROOT: str = 'f3e94742aca4b5ef85488dc37c06c3282295ffec960994b2c0d5ac2a25a95766'
+
+
+def txid(n: int) -> bytes:
+    return Sha256.hash256(n.to_bytes(4, byteorder='little'))
+
+
+class TestMerkleTree(unittest.TestCase):
+
+    """Unit test for the MerkleTree class"""
+
+    def test_root(self):
+        txids: list = [bytes.fromhex(t)[::-1] for t in BLOCK_100000_TXIDS]
+
+        actual_result: str = MerkleTree(txids).root[::-1].hex()
+
+        self.assertEqual(BLOCK_100000_MERKLE_ROOT, actual_result)
+
+    def test_root_single_leaf(self):
+        actual_result: bytes = MerkleTree([txid(0)]).root
+
+        self.assertEqual(txid(0), actual_result)
+
+    def test_root_odd_leaves(self):
+        expected_result: bytes = Sha256.hash256(Sha256.hash256(txid(0) + txid(1)) + Sha256.hash256(txid(2) + txid(2)))
+
+        actual_result: bytes = MerkleTree([txid(0), txid(1), txid(2)]).root
+
+        self.assertEqual(expected_result, actual_result)
+
+    def test_empty(self):
+        self.assertRaises(ValueError, MerkleTree, [])
+
+    def test_invalid_txid(self):
+        self.assertRaises(ValueError, MerkleTree, [bytes(31)])
+
+    @parameterized.expand([(str(n), n) for n in (1, 2, 3, 5, 8)])
+    def test_replace(self, _, num_leaves):
+        txids: list = [txid(i) for i in range(num_leaves)]
+        tree = MerkleTree(txids)
+        tree.replace(0, txid(100))
+        tree.replace(-1, txid(101))
+
+        actual_result: tuple = tree.levels
+
+        self.assertEqual(MerkleTree([txid(100)] + txids[1:-1] + [txid(101)] if num_leaves > 1 else [txid(101)]).levels, actual_result)
+
+    def test_replace_out_of_range(self):
+        tree = MerkleTree([txid(0)])
+
+        self.assertRaises(IndexError, tree.replace, 1, txid(1))
+
+    def test_append(self):
+        tree = MerkleTree([txid(0)])
+        for i in range(1, 9):
+            tree.append(txid(i))
+
+            actual_result: tuple = tree.levels
+
+            self.assertEqual(MerkleTree([txid(j) for j in range(i + 1)]).levels, actual_result)
+
+    @parameterized.expand([(str(n), n) for n in (1, 2, 3, 5, 8)])
+    def test_prove_verify(self, _, num_leaves):
+        tree = MerkleTree([txid(i) for i in range(num_leaves)])
+
+        actual_result: list = [MerkleTree.verify(tree.prove(i), txid(i), tree.root) for i in range(num_leaves)]
+
+        self.assertEqual([True] * num_leaves, actual_result)
+
+    def test_prove(self):
+        txids: list = [txid(i) for i in range(3)]
+        tree = MerkleTree(txids)
+
+        actual_result: MerkleProof = tree.prove(2)
+
+        self.assertEqual(MerkleProof(2, (txids[2], Sha256.hash256(txids[0] + txids[1]))), actual_result)
+
+    @parameterized.expand([
+        ('wrong leaf', 1, txid(0)),
+        ('wrong position', 0, txid(1)),
+        ('position out of range', 5, txid(1)),
+    ])
+    def test_verify_invalid(self, _, index, leaf):
+        tree = MerkleTree([txid(i) for i in range(3)])
+        proof = MerkleProof(index, tree.prove(1).siblings)
+
+        actual_result: bool = MerkleTree.verify(proof, leaf, tree.root)
+
+        self.assertFalse(actual_result)
+
+    def test_verify_many(self):
+        tree = MerkleTree([txid(i) for i in range(7)])
+        proofs: list = [(tree.prove(i), txid(i)) for i in range(7)]
+        proofs.insert(3, (tree.prove(3), txid(4)))
+        proofs.insert(0, (tree.prove(6), txid(0)))
+        proofs.append((MerkleProof(1, tree.prove(1).siblings[:-1]), txid(1)))
+
+        actual_result: list = MerkleTree.verify_many(proofs, tree.root)
+
+        self.assertEqual([MerkleTree.verify(proof, leaf, tree.root) for proof, leaf in proofs], actual_result)
+
+    @parameterized.expand([
+        ('forged siblings', 1, 1, (b'\xff' * 32, b'\xee' * 32)),
+        ('forged higher sibling', 0, 1, (txid(0), b'\xee' * 32)),
+        ('forged sibling of a verified node', 0, 0, (txid(1), b'\xee' * 32)),
+    ])
+    def test_verify_many_forged(self, _, index, forged_index, forged_siblings):
+        tree = MerkleTree([txid(i) for i in range(4)])
+        proofs: list = [(tree.prove(index), txid(index)), (MerkleProof(forged_index, forged_siblings), txid(forged_index))]
+
+        actual_result: list = MerkleTree.verify_many(proofs, tree.root)
+
+        self.assertEqual([True, False], actual_result)
+
+    def test_verify_many_wrong_root(self):
+        tree = MerkleTree([txid(i) for i in range(4)])
+        proofs: list = [(tree.prove(i), txid(i)) for i in range(4)]
+
+        actual_result: list = MerkleTree.verify_many(proofs, txid(0))
+
+        self.assertEqual([False] * 4, actual_result)
@@ -0,0 +1,38 @@
+import unittest
+
+from understandingbitcoin.hash import parallel
+from understandingbitcoin.hash.sha256 import Sha256
+
+
+class TestParallel(unittest.TestCase):
+
+    """Unit test for the parallel module"""
+
+    def test_hash_many(self):
+        messages: list = [bytes([n]) * n for n in range(20)]
+
+        actual_result: list = parallel.hash_many(messages, chunk_size=3, max_workers=2)
+
+        self.assertEqual([Sha256.hash(message) for message in messages], actual_result)
+
+    def test_hash_many_iterator(self):
+        messages = (bytes([n]) * n for n in range(5))
+
+        actual_result: list = parallel.hash_many(messages, Sha256.hash256, chunk_size=2, max_workers=2)
+
+        self.assertEqual([Sha256.hash256(bytes([n]) * n) for n in range(5)], actual_result)
+
+    def test_hash_many_empty(self):
+        actual_result: list = parallel.hash_many([], max_workers=2)
+
+        self.assertEqual([], actual_result)
+
+    def test_hash_as_completed(self):
+        messages: list = [bytes([n]) * n for n in range(10)]
+
+        actual_result: dict = dict(parallel.hash_as_completed(messages, chunk_size=4, max_workers=2))
+
+        self.assertEqual(dict(enumerate(map(Sha256.hash, messages))), actual_result)
+
+    def test_hash_as_completed_invalid_chunk_size(self):
+        self.assertRaises(ValueError, list, parallel.hash_as_completed([b''], chunk_size=0))
@@ -0,0 +1,47 @@
+import hashlib
+import unittest
+
+from parameterized import parameterized
+
+from understandingbitcoin.hash import backend
+from understandingbitcoin.hash.pbkdf2 import pbkdf2_hmac, pbkdf2_hmac_many
+from understandingbitcoin.hash.ripemd160 import Ripemd160
+from understandingbitcoin.hash.sha512 import Sha512
+
+
+class TestPbkdf2(unittest.TestCase):
+
+    """Unit test for the PBKDF2 key derivation function"""
+
+    @parameterized.expand([
+        ('one iteration', (b'password', b'salt', 1, None), '120fb6cffcf8b32c43e7225256c4f837a86548c92ccc35480805987cb70be17b'),
+        ('two iterations', (b'password', b'salt', 2, None), 'ae4d0c95af6b46d32d0adff928f06dd02a303f8ef3c251dfd6e2d85a95474c43'),
+        ('several blocks', (b'passwordPASSWORDpassword', b'saltSALTsaltSALTsaltSALTsaltSALTsalt', 3, 40),
+         hashlib.pbkdf2_hmac('sha256', b'passwordPASSWORDpassword', b'saltSALTsaltSALTsaltSALTsaltSALTsalt', 3, 40).hex()),
+    ])
+    def test_equals(self, _, arguments, key):
+        actual_result: str = pbkdf2_hmac(*arguments).hex()
+
+        self.assertEqual(key, actual_result)
+
+    @unittest.skipUnless(backend.hashlib_supports('ripemd160'), 'hashlib does not support ripemd160')
+    def test_ripemd160(self):
+        actual_result: bytes = pbkdf2_hmac(b'password', b'salt', 3, algorithm=Ripemd160)
+
+        self.assertEqual(hashlib.pbkdf2_hmac('ripemd160', b'password', b'salt', 3), actual_result)
+
+    def test_zero_iterations(self):
+        self.assertRaises(ValueError, pbkdf2_hmac, b'password', b'salt', 0)
+
+    def test_pbkdf2_hmac_many(self):
+        passwords_and_salts: list = [(b'first', b'salt1'), (b'second', b'salt2'), (b'third', b'salt3')]
+
+        actual_result: list = pbkdf2_hmac_many(passwords_and_salts, 2, max_workers=2)
+
+        self.assertEqual([hashlib.pbkdf2_hmac('sha256', password, salt, 2) for password, salt in passwords_and_salts],
+                         actual_result)
+
+    def test_sha512(self):
+        actual_result: bytes = pbkdf2_hmac(b'password', b'salt', 3, 100, Sha512)
+
+        self.assertEqual(hashlib.pbkdf2_hmac('sha512', b'password', b'salt', 3, 100), actual_result)
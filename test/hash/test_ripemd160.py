@@ -0,0 +1,76 @@
+import unittest
+
+from parameterized import parameterized
+
+from understandingbitcoin.hash.ripemd160 import Ripemd160
+from understandingbitcoin.hash.sha256 import Sha256
+
+
+class TestRipemd160(unittest.TestCase):
+
+    """Unit test for the Ripemd160 class"""
+
+    @parameterized.expand([
+        ('empty string', '', '9c1185a5c5e9fc54612808977ee8f548b2258d31'),
+        ('only ascii', 'abc', '8eb208f7e05d987a9b044a8e98c6b087f15a0bfc'),
+        ('message digest', 'message digest', '5d0689ef49d2fae572b881b123a85ffa21595f36'),
+        ('two blocks', 'abcdbcdecdefdefgefghfghighijhijkijkljklmklmnlmnomnopnopq', '12a053384a9c0c88e405a06c27dcf49ada62eb2b'),
+        ('special chars', 'a¢€𐍈', 'dc772dff7e13893b43b0f0ae9d1bf69fa957e2ee'),
+    ])
+    def test_equals(self, _, message, digest):
+        message_bytes = bytearray(message, 'utf-8')
+
+        actual_result: str = Ripemd160.hash(message_bytes).hex()
+
+        self.assertEqual(digest, actual_result)
+
+    def test_update(self):
+        message: bytes = bytes(range(200))
+        hasher = Ripemd160(message[:10])
+        hasher.update(message[10:130])
+        hasher.update(message[130:])
+
+        actual_result: str = hasher.hexdigest()
+
+        self.assertEqual(Ripemd160.hash(message).hex(), actual_result)
+
+    def test_copy(self):
+        prefix = Ripemd160(b'a' * 70)
+        fork = prefix.copy()
+        fork.update(b'b')
+
+        actual_result: tuple = (prefix.digest(), fork.digest())
+
+        self.assertEqual((Ripemd160.hash(b'a' * 70), Ripemd160.hash(b'a' * 70 + b'b')), actual_result)
+
+    def test_hash_from_midstate(self):
+        message: bytes = bytes(range(100))
+        midstate: bytes = Ripemd160(message[:64]).midstate()
+
+        actual_result: bytes = Ripemd160.hash_from_midstate(midstate, message[64:], 64)
+
+        self.assertEqual(Ripemd160.hash(message), actual_result)
+
+    def test_hash_many(self):
+        messages: list = [bytes(range(n % 256)) * (n // 256 + 1) for n in range(0, 300, 11)]
+
+        actual_result: list = Ripemd160.hash_many(messages)
+
+        self.assertEqual([Ripemd160.hash(message) for message in messages], actual_result)
+
+    @parameterized.expand([
+        ('empty string', b'', 'b472a266d0bd89c13706a4132ccfb16f7c3b9fcb'),
+        ('compressed public key', bytes.fromhex('0250863ad64a87ae8a2fe83c1af1a8403cb53f53e486d8511dad8a04887e5b2352'),
+         'f54a5851e9372b87810a8e60cdd2e7cfd80b6e31'),
+    ])
+    def test_hash160(self, _, message, digest):
+        actual_result: str = Ripemd160.hash160(message).hex()
+
+        self.assertEqual(digest, actual_result)
+
+    def test_hash160_many(self):
+        messages: list = [bytes([n]) * 33 for n in range(20)] + [b'', bytes(range(100))]
+
+        actual_result: list = Ripemd160.hash160_many(messages)
+
+        self.assertEqual([Ripemd160.hash(Sha256.hash(message)) for message in messages], actual_result)
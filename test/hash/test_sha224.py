@@ -0,0 +1,34 @@
+import unittest
+
+from parameterized import parameterized
+
+from understandingbitcoin.hash.sha224 import Sha224
+
+
+class TestSha224(unittest.TestCase):
+
+    """Unit test for the Sha224 class"""
+
+    @parameterized.expand([
+        ('empty string', '', 'd14a028c2a3a2bc9476102bb288234c415a2b01f828ea62ac5b3e42f'),
+        ('only ascii', 'abc', '23097d223405d8228642a477bda255b32aadbce4bda0b3f7e36c9da7'),
+        ('special chars', 'a¢€𐍈', 'e6704a4f67db1a349bd38d07b10f2a5bdb6bf2c7bfc73d17c88a876b'),
+    ])
+    def test_equals(self, _, message, digest):
+        message_bytes = bytearray(message, 'utf-8')
+
+        actual_result: str = Sha224.hash(message_bytes).hex()
+
+        self.assertEqual(digest, actual_result)
+
+    def test_hash256(self):
+        actual_result: bytes = Sha224.hash256(b'abc')
+
+        self.assertEqual(Sha224.hash(Sha224.hash(b'abc')), actual_result)
+
+    def test_hash_many(self):
+        messages: list = [bytes(range(n % 256)) * (n // 256 + 1) for n in range(0, 300, 11)]
+
+        actual_result: list = Sha224.hash_many(messages)
+
+        self.assertEqual([Sha224.hash(message) for message in messages], actual_result)
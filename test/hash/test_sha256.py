@@ -1,9 +1,15 @@
+import os
+import subprocess
+import sys
+import tempfile
 import unittest
 
 from parameterized import parameterized
 
 from understandingbitcoin.hash.sha256 import Sha256
 
+GENESIS_HEADER: str = '0100000000000000000000000000000000000000000000000000000000000000000000003ba3edfd7a7b12b27ac72c3e67768f617fc81bc3888a51323a9fb8aa4b1e5e4a29ab5f49ffff001d1dac2b7c'
+
 
 class TestSha256(unittest.TestCase):
 
@@ -23,3 +29,155 @@ class TestSha256(unittest.TestCase):
         actual_result: str = Sha256.hash(message_bytes).hex()
 
         self.assertEqual(digest, actual_result)
+
+    def test_hash_message_length_congruent_to_55(self):
+        message: bytes = b'a' * 55
+
+        actual_result: str = Sha256.hash(message).hex()
+
+        self.assertEqual('9f4390f8d30c2dd92ec9f095b65e2b9ae9b0a925a5258e241c9f1e910f734318', actual_result)
+
+    @parameterized.expand([
+        ('one chunk', (b'Satoshi Nakamoto',)),
+        ('empty chunks', (b'', b'Satoshi', b'', b' Nakamoto', b'')),
+        ('byte by byte', tuple(bytes((b,)) for b in b'Satoshi Nakamoto')),
+    ])
+    def test_update(self, _, chunks):
+        hasher = Sha256()
+        for chunk in chunks:
+            hasher.update(chunk)
+
+        actual_result: str = hasher.hexdigest()
+
+        self.assertEqual('a0dc65ffca799873cbea0ac274015b9526505daaaed385155425f7337704883e', actual_result)
+
+    def test_update_several_blocks(self):
+        message: bytes = bytes(range(256)) * 2
+        hasher = Sha256(message[:100])
+        hasher.update(message[100:])
+
+        actual_result: bytes = hasher.digest()
+
+        self.assertEqual(Sha256.hash(message), actual_result)
+
+    def test_digest_does_not_finalize(self):
+        hasher = Sha256(b'Satoshi')
+        hasher.digest()
+        hasher.update(b' Nakamoto')
+
+        actual_result: str = hasher.hexdigest()
+
+        self.assertEqual('a0dc65ffca799873cbea0ac274015b9526505daaaed385155425f7337704883e', actual_result)
+
+    def test_copy(self):
+        prefix = Sha256(b'a' * 70)
+        fork = prefix.copy()
+        prefix.update(b'b')
+        fork.update(b'c')
+
+        actual_result: tuple = (prefix.digest(), fork.digest())
+
+        self.assertEqual((Sha256.hash(b'a' * 70 + b'b'), Sha256.hash(b'a' * 70 + b'c')), actual_result)
+
+    def test_hash_from_midstate(self):
+        header: bytes = bytes.fromhex(GENESIS_HEADER)
+        midstate: bytes = Sha256(header[:64]).midstate()
+
+        actual_result: bytes = Sha256.hash_from_midstate(midstate, header[64:], 64)
+
+        self.assertEqual(Sha256.hash(header), actual_result)
+
+    def test_midstate_pending_bytes(self):
+        hasher = Sha256(b'a' * 65)
+
+        self.assertRaises(ValueError, hasher.midstate)
+
+    def test_from_midstate_invalid_length(self):
+        midstate: bytes = Sha256(b'a' * 64).midstate()
+
+        self.assertRaises(ValueError, Sha256.from_midstate, midstate, 63)
+
+    @parameterized.expand([
+        ('empty string', '', '5df6e0e2761359d30a8275058e299fcc0381534545f55cf43e41983f5d4c9456'),
+        ('genesis block header', GENESIS_HEADER, '6fe28c0ab6f1b372c1a6a246ae63f74f931e8365e15a089c68d6190000000000'),
+    ])
+    def test_hash256(self, _, message, digest):
+        message_bytes: bytes = bytes.fromhex(message)
+
+        actual_result: str = Sha256.hash256(message_bytes).hex()
+
+        self.assertEqual(digest, actual_result)
+
+    def test_hash256_equals_hash_twice(self):
+        message: bytes = b'Satoshi Nakamoto' * 5
+
+        actual_result: bytes = Sha256.hash256(message)
+
+        self.assertEqual(Sha256.hash(Sha256.hash(message)), actual_result)
+
+    def test_hash_many(self):
+        messages: list = [bytes(range(n % 256)) * (n // 256 + 1) for n in range(0, 300, 11)]
+
+        actual_result: list = Sha256.hash_many(messages)
+
+        self.assertEqual([Sha256.hash(message) for message in messages], actual_result)
+
+    def test_hash_many_empty(self):
+        actual_result: list = Sha256.hash_many([])
+
+        self.assertEqual([], actual_result)
+
+    def test_update_memoryview(self):
+        message: bytes = bytes(range(256)) * 2
+        hasher = Sha256(message[:10])
+        hasher.update(memoryview(message)[10:])
+
+        actual_result: bytes = hasher.digest()
+
+        self.assertEqual(Sha256.hash(message), actual_result)
+
+    def test_hash_file(self):
+        content: bytes = bytes(range(256)) * 20
+        with tempfile.TemporaryDirectory() as directory:
+            path: str = os.path.join(directory, 'blk00000.dat')
+            with open(path, 'wb') as file:
+                file.write(content)
+
+            actual_result: bytes = Sha256.hash_file(path)
+
+        self.assertEqual(Sha256.hash(content), actual_result)
+
+    @parameterized.expand([
+        ('middle range', 1000, 3000),
+        ('up to the end', 4000, None),
+        ('empty range', 10, 0),
+    ])
+    def test_hash_file_range(self, _, offset, length):
+        content: bytes = bytes(range(256)) * 20
+        with tempfile.TemporaryDirectory() as directory:
+            path: str = os.path.join(directory, 'blk00000.dat')
+            with open(path, 'wb') as file:
+                file.write(content)
+
+            actual_result: bytes = Sha256.hash_file_range(path, offset, length)
+
+        end: int = len(content) if length is None else offset + length
+        self.assertEqual(Sha256.hash(content[offset:end]), actual_result)
+
+    def test_hash_file_range_out_of_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path: str = os.path.join(directory, 'blk00000.dat')
+            with open(path, 'wb') as file:
+                file.write(bytes(100))
+
+            self.assertRaises(ValueError, Sha256.hash_file_range, path, 50, 51)
+
+    def test_hash_without_numpy(self):
+        # NumPy is blocked, so importing it raises ImportError
+        code: str = "import sys; sys.modules['numpy'] = None; " \
+                    "from understandingbitcoin.hash.sha256 import Sha256; print(Sha256.hash(b'abc').hex())"
+
+        actual_result: str = subprocess.run([sys.executable, '-c', code], capture_output=True, check=True,
+                                            text=True).stdout.strip()
+
+        self.assertEqual('ba7816bf8f01cfea414140de5dae2223b00361a396177a9cb410ff61f20015ad', actual_result)
@@ -0,0 +1,61 @@
+import unittest
+
+from parameterized import parameterized
+
+from understandingbitcoin.hash.sha512 import Sha512
+
+
+class TestSha512(unittest.TestCase):
+
+    """Unit test for the Sha512 class"""
+
+    @parameterized.expand([
+        ('empty string', '',
+         'cf83e1357eefb8bdf1542850d66d8007d620e4050b5715dc83f4a921d36ce9ce47d0d13c5d85f2b0ff8318d2877eec2f63b931bd47417a81a538327af927da3e'),
+        ('only ascii', 'abc',
+         'ddaf35a193617abacc417349ae20413112e6fa4e89a97ea20a9eeee64b55d39a2192992a274fc1a836ba3c23a3feebbd454d4423643ce80e2a9ac94fa54ca49f'),
+        ('special chars', 'a¢€𐍈',
+         'ebd1b2606ba77990c2e4153b9beefca5d11f688a9d9ae80fe4a38a426026b8b1240109b4f1d818696dece5a724509075a8cbcbcc7161933dabc32170a55a22c9'),
+        ('two blocks',
+         'abcdefghbcdefghicdefghijdefghijkefghijklfghijklmghijklmnhijklmnoijklmnopjklmnopqklmnopqrlmnopqrsmnopqrstnopqrstu',
+         '8e959b75dae313da8cf4f72814fc143f8f7779c6eb9f7fa17299aeadb6889018501d289e4900f7e4331b99dec4b5433ac7d329eeb6dd26545e96e55b874be909'),
+    ])
+    def test_equals(self, _, message, digest):
+        message_bytes = bytearray(message, 'utf-8')
+
+        actual_result: str = Sha512.hash(message_bytes).hex()
+
+        self.assertEqual(digest, actual_result)
+
+    def test_hash_message_length_congruent_to_111(self):
+        message: bytes = b'a' * 111
+
+        actual_result: str = Sha512.hash(message).hex()
+
+        self.assertEqual('fa9121c7b32b9e01733d034cfc78cbf67f926c7ed83e82200ef86818196921760b4beff48404df811b953828274461673c68d04e297b0eb7b2b4d60fc6b566a2',
+                         actual_result)
+
+    def test_update(self):
+        message: bytes = bytes(range(256)) * 2
+        hasher = Sha512(message[:100])
+        hasher.update(message[100:300])
+        hasher.update(message[300:])
+
+        actual_result: bytes = hasher.digest()
+
+        self.assertEqual(Sha512.hash(message), actual_result)
+
+    def test_hash_from_midstate(self):
+        message: bytes = bytes(range(200))
+        midstate: bytes = Sha512(message[:128]).midstate()
+
+        actual_result: bytes = Sha512.hash_from_midstate(midstate, message[128:], 128)
+
+        self.assertEqual(Sha512.hash(message), actual_result)
+
+    def test_hash_many(self):
+        messages: list = [bytes(range(n % 256)) * (n // 256 + 1) for n in range(0, 300, 11)]
+
+        actual_result: list = Sha512.hash_many(messages)
+
+        self.assertEqual([Sha512.hash(message) for message in messages], actual_result)
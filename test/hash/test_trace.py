@@ -0,0 +1,63 @@
+import hashlib
+import io
+import unittest
+
+from parameterized import parameterized
+
+from understandingbitcoin.hash import backend
+from understandingbitcoin.hash.ripemd160 import Ripemd160
+from understandingbitcoin.hash.sha224 import Sha224
+from understandingbitcoin.hash.sha256 import Sha256
+from understandingbitcoin.hash.sha512 import Sha512
+from understandingbitcoin.hash.trace import PrintingTracer, RecordingTracer, Tracer
+
+
+class TestTrace(unittest.TestCase):
+
+    """Unit test for the tracers of the hash functions"""
+
+    @parameterized.expand([
+        ('sha224', Sha224, 64),
+        ('sha256', Sha256, 64),
+        ('sha512', Sha512, 80),
+    ])
+    def test_hash_traced(self, name, algorithm, rounds):
+        message: bytes = b'a' * 200
+        tracer: RecordingTracer = RecordingTracer()
+
+        actual_result: bytes = algorithm.hash(message, tracer=tracer)
+
+        self.assertEqual(hashlib.new(name, message).digest(), actual_result)
+        self.assertEqual(len(tracer.schedules), len(tracer.hash_values))
+        self.assertTrue(all(len(words) == rounds for words in tracer.schedules))
+        self.assertTrue(all(len(registers) == rounds for registers in tracer.rounds))
+
+    def test_recording_tracer(self):
+        tracer: RecordingTracer = RecordingTracer()
+
+        Sha256.hash(b'abc', tracer=tracer)
+
+        # intermediate values of the example of FIPS 180-2, appendix B.1
+        self.assertEqual(0x61626380, tracer.schedules[0][0])
+        self.assertEqual((0x5d6aebcd, 0x6a09e667, 0xbb67ae85, 0x3c6ef372,
+                          0xfa2a4622, 0x510e527f, 0x9b05688c, 0x1f83d9ab), tracer.rounds[0][0])
+        self.assertEqual((0x506e3058, 0xd39a2165, 0x04d24d6c, 0xb85e2ce9,
+                          0x5ef50f24, 0xfb121210, 0x948d25b6, 0x961f4894), tracer.rounds[0][63])
+        self.assertEqual([(0xba7816bf, 0x8f01cfea, 0x414140de, 0x5dae2223,
+                           0xb00361a3, 0x96177a9c, 0xb410ff61, 0xf20015ad)], tracer.hash_values)
+
+    def test_printing_tracer(self):
+        file: io.StringIO = io.StringIO()
+
+        Sha256.hash(b'abc', tracer=PrintingTracer(file))
+
+        lines: list = file.getvalue().splitlines()
+        self.assertEqual('block 0', lines[0])
+        self.assertEqual('  t= 0 5d6aebcd 6a09e667 bb67ae85 3c6ef372 fa2a4622 510e527f 9b05688c 1f83d9ab', lines[9])
+        self.assertEqual('  H ba7816bf 8f01cfea 414140de 5dae2223 b00361a3 96177a9c b410ff61 f20015ad', lines[-1])
+
+    def test_traced_backend(self):
+        self.assertRaises(ValueError, Sha256.hash, b'', backend.HASHLIB, Tracer())
+
+    def test_untraceable_hash_function(self):
+        self.assertRaises(ValueError, Ripemd160.hash, b'', tracer=Tracer())
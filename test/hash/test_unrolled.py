@@ -0,0 +1,43 @@
+import hashlib
+import unittest
+
+from parameterized import parameterized
+
+from understandingbitcoin.hash import unrolled
+from understandingbitcoin.hash.ripemd160 import Ripemd160
+from understandingbitcoin.hash.sha224 import Sha224
+from understandingbitcoin.hash.sha256 import Sha256
+from understandingbitcoin.hash.sha512 import Sha512
+
+
+class TestUnrolled(unittest.TestCase):
+
+    """Unit test for the generated compression functions"""
+
+    @parameterized.expand([
+        ('sha224', Sha224),
+        ('sha256', Sha256),
+        ('sha512', Sha512),
+    ])
+    def test_check_compression(self, _, algorithm):
+        actual_result: bool = unrolled.check_compression(algorithm, 8, seed=0)
+
+        self.assertTrue(actual_result)
+
+    @parameterized.expand([
+        ('sha224', Sha224),
+        ('sha256', Sha256),
+        ('sha512', Sha512),
+    ])
+    def test_hash_message(self, name, algorithm):
+        messages: list = [bytes(range(n % 256)) * (n // 256 + 1) for n in range(0, 300, 37)]
+
+        actual_result: list = [unrolled.hash_message(message, algorithm) for message in messages]
+
+        self.assertEqual([hashlib.new(name, message).digest() for message in messages], actual_result)
+
+    def test_compression_function_is_cached(self):
+        self.assertIs(unrolled.compression_function(Sha256), unrolled.compression_function(Sha256))
+
+    def test_not_sha2(self):
+        self.assertRaises(ValueError, unrolled.compression_source, Ripemd160)
@@ -0,0 +1 @@
+"""Test collection for the mining modules."""
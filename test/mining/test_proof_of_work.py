@@ -0,0 +1,62 @@
+import unittest
+
+from parameterized import parameterized
+
+from understandingbitcoin.mining import proof_of_work
+from understandingbitcoin.mining.proof_of_work import NonceSearchResult
+
+GENESIS_HEADER: bytes = bytes.fromhex('0100000000000000000000000000000000000000000000000000000000000000000000003ba3edfd7a7b12b27ac72c3e67768f617fc81bc3888a51323a9fb8aa4b1e5e4a29ab5f49ffff001d1dac2b7c')
+REGTEST_GENESIS_HEADER: bytes = bytes.fromhex('0100000000000000000000000000000000000000000000000000000000000000000000003ba3edfd7a7b12b27ac72c3e67768f617fc81bc3888a51323a9fb8aa4b1e5e4adae5494dffff7f2002000000')
+
+
+class TestProofOfWork(unittest.TestCase):
+
+    """Unit test for the proof_of_work module"""
+
+    @parameterized.expand([
+        ('mainnet genesis', 0x1d00ffff, 0x00000000ffff0000000000000000000000000000000000000000000000000000),
+        ('regtest', 0x207fffff, 0x7fffff0000000000000000000000000000000000000000000000000000000000),
+        ('small exponent', 0x03123456, 0x123456),
+        ('exponent lower than three', 0x02123456, 0x1234),
+    ])
+    def test_bits_to_target(self, _, bits, target):
+        actual_result: int = proof_of_work.bits_to_target(bits)
+
+        self.assertEqual(target, actual_result)
+
+    def test_bits_to_target_negative(self):
+        self.assertRaises(ValueError, proof_of_work.bits_to_target, 0x04923456)
+
+    @parameterized.expand([
+        ('mainnet genesis', GENESIS_HEADER, True),
+        ('regtest genesis', REGTEST_GENESIS_HEADER, True),
+        ('wrong nonce', GENESIS_HEADER[:76] + bytes(4), False),
+    ])
+    def test_check_proof_of_work(self, _, header, expected_result):
+        actual_result: bool = proof_of_work.check_proof_of_work(header)
+
+        self.assertEqual(expected_result, actual_result)
+
+    def test_check_proof_of_work_invalid_header(self):
+        self.assertRaises(ValueError, proof_of_work.check_proof_of_work, bytes(79))
+
+    def test_search_nonce(self):
+        template: bytes = REGTEST_GENESIS_HEADER[:76] + bytes(4)
+
+        actual_result: NonceSearchResult = proof_of_work.search_nonce(template, nonces=range(16), max_workers=2, chunk_size=1)
+
+        self.assertTrue(proof_of_work.check_proof_of_work(actual_result.header))
+
+    def test_search_nonce_bits(self):
+        template: bytes = GENESIS_HEADER[:76] + bytes(4)
+
+        actual_result: NonceSearchResult = proof_of_work.search_nonce(template, 0x207fffff, range(16), max_workers=2, chunk_size=2)
+
+        self.assertEqual(bytes.fromhex('ffff7f20'), actual_result.header[72:76])
+
+    def test_search_nonce_not_found(self):
+        template: bytes = GENESIS_HEADER[:76] + bytes(4)
+
+        actual_result: NonceSearchResult = proof_of_work.search_nonce(template, nonces=range(4), max_workers=2, chunk_size=2)
+
+        self.assertEqual((None, 4), (actual_result.nonce, actual_result.hashes))
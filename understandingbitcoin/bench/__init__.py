@@ -0,0 +1,2 @@
+"""The modules contained in this package measure the performance of the
+algorithms implemented in the rest of the packages."""
@@ -0,0 +1,91 @@
+"""
+Runs the benchmark suite of the hash functions, with every backend, and of
+the bit and byte primitives, prints its results in JSON and compares them
+with a baseline and the allocation budgets, exiting with a non-zero status
+on regressions or when there is no baseline.
+
+The stored baseline, baseline.json, is measured on one machine; store a new
+one with --save before comparing results of another machine.
+
+Usage: python -m understandingbitcoin.bench [-b BASELINE] [--save]
+                                            [--skip-allocations]
+"""
+import argparse
+import json
+import os
+import sys
+
+from understandingbitcoin.bench import suite
+
+# baseline used by default, stored next to the benchmark suite
+_DEFAULT_BASELINE: str = os.path.join(os.path.dirname(__file__),
+                                      'baseline.json')
+
+
+def main() -> int:
+    """
+    Prints the results of the benchmark suite and the regressions against
+    the baseline.
+
+    :return: The exit status, 1 if any case regressed and 0 otherwise
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-s', '--sizes', type=int, nargs='+',
+                        default=list(suite.MESSAGE_SIZES),
+                        help='sizes in bytes of the messages to hash')
+    parser.add_argument('-t', '--time', type=float, default=0.5,
+                        help='minimum seconds spent measuring each case')
+    parser.add_argument('-k', '--filter', default='',
+                        help='measure only the cases whose name contains it')
+    parser.add_argument('-b', '--baseline', default=_DEFAULT_BASELINE,
+                        help='JSON file with the results taken as baseline')
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help='fraction of the baseline time a case can exceed')
+    parser.add_argument('--save', action='store_true',
+                        help='store the results as the new baseline')
+    parser.add_argument('--skip-allocations', action='store_true',
+                        help='do not check the allocation budgets')
+    args = parser.parse_args()
+
+    cases: dict = {name: function
+                   for name, function in suite.cases(args.sizes).items()
+                   if args.filter in name}
+    results: dict = suite.run(cases, args.time)
+    exceeded: dict = {}
+    if not args.skip_allocations:
+        results['allocations'] = {
+            name: allocations
+            for name, allocations in suite.account(args.sizes).items()
+            if args.filter in name}
+        exceeded = suite.check_budgets(results['allocations'])
+    print(json.dumps(results, indent=2, sort_keys=True))
+
+    name: str
+    counters: dict
+    for name, counters in sorted(exceeded.items()):
+        for counter, (value, budget) in sorted(counters.items()):
+            print(f'over budget: {name} {counter} is {value:.1f} per block, '
+                  f'over {budget}', file=sys.stderr)
+
+    if args.save:
+        suite.save(results, args.baseline)
+        return 1 if exceeded else 0
+
+    # without a baseline no regression can be found, so it is an error
+    if not os.path.exists(args.baseline):
+        print(f'no baseline found in {args.baseline}, store one with --save',
+              file=sys.stderr)
+        return 1
+
+    regressions: dict = suite.compare(results, suite.load(args.baseline),
+                                      args.tolerance)
+    ratio: float
+    for name, ratio in sorted(regressions.items()):
+        print(f'regression: {name} is {ratio:.2f}x slower than the baseline',
+              file=sys.stderr)
+
+    return 1 if regressions or exceeded else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
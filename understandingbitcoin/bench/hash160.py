@@ -0,0 +1,54 @@
+"""
+Measures the HASH160 of compressed public keys, RIPEMD-160(SHA-256(x)),
+composing both hash functions, with the fused function and with the batch
+of lanes.
+
+Usage: python -m understandingbitcoin.bench.hash160 [-n KEYS]
+"""
+import argparse
+import os
+import time
+
+from understandingbitcoin.hash.ripemd160 import Ripemd160
+from understandingbitcoin.hash.sha256 import Sha256
+
+# size in bytes of a compressed public key
+_PUBLIC_KEY_SIZE_BYTES: int = 33
+
+
+def main():
+    """Prints the time and speedup of every way of computing HASH160."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-n', '--keys', type=int, default=1000,
+                        help='number of public keys to hash')
+    args = parser.parse_args()
+
+    public_keys: list = [os.urandom(_PUBLIC_KEY_SIZE_BYTES)
+                         for _ in range(args.keys)]
+    cases: dict = {
+        'naive': lambda: [Ripemd160.hash(Sha256.hash(public_key))
+                          for public_key in public_keys],
+        'fused': lambda: [Ripemd160.hash160(public_key)
+                          for public_key in public_keys],
+        'batch': lambda: Ripemd160.hash160_many(public_keys),
+    }
+
+    print(f'{"mode":>6} {"seconds":>9} {"hashes/s":>10} {"speedup":>8}')
+    expected: list = None
+    naive_time: float = None
+    mode: str
+    for mode, function in cases.items():
+        start: float = time.perf_counter()
+        digests: list = function()
+        elapsed: float = time.perf_counter() - start
+        if expected is None:
+            (expected, naive_time) = (digests, elapsed)
+        elif digests != expected:
+            raise AssertionError(f'{mode} hash values differ from naive')
+
+        print(f'{mode:>6} {elapsed:9.3f} {args.keys / elapsed:10.1f} '
+              f'{naive_time / elapsed:8.2f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,40 @@
+"""
+Measures the hashes per second, in total and per process, of the nonce
+search of a block header whose target cannot be reached.
+
+Usage: python -m understandingbitcoin.bench.mining [-n NONCES]
+"""
+import argparse
+import os
+
+from understandingbitcoin.mining import proof_of_work
+from understandingbitcoin.mining.proof_of_work import NonceSearchResult
+
+# header of the genesis block with a target that no nonce can reach
+_HEADER: bytes = bytes.fromhex(
+    '0100000000000000000000000000000000000000000000000000000000000000000000'
+    '003ba3edfd7a7b12b27ac72c3e67768f617fc81bc3888a51323a9fb8aa4b1e5e4a29ab'
+    '5f49') + bytes(8)
+
+
+def main():
+    """Prints the hashing throughput of every number of processes."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-n', '--nonces', type=int, default=2048,
+                        help='number of nonces to search per process')
+    args = parser.parse_args()
+
+    print(f'{"processes":>9} {"hashes":>8} {"seconds":>9} {"hashes/s":>10} '
+          f'{"per process":>11}')
+    max_workers: int
+    for max_workers in range(1, (os.cpu_count() or 1) + 1):
+        result: NonceSearchResult = proof_of_work.search_nonce(
+            _HEADER, nonces=range(args.nonces * max_workers),
+            max_workers=max_workers, chunk_size=256)
+        print(f'{max_workers:>9} {result.hashes:>8} {result.seconds:9.3f} '
+              f'{result.hashes_per_second:10.1f} '
+              f'{result.hashes_per_second_per_worker:11.1f}')
+
+
+if __name__ == '__main__':
+    main()
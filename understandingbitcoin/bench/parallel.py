@@ -0,0 +1,62 @@
+"""
+Measures how parallel hashing scales with the number of processes compared
+with hashing serially with Sha256.hash.
+
+Usage: python -m understandingbitcoin.bench.parallel [-n MESSAGES] [-s SIZE]
+"""
+import argparse
+import os
+import time
+
+from understandingbitcoin.hash import parallel
+from understandingbitcoin.hash.sha256 import Sha256
+
+
+def main():
+    """Prints the time and speedup of every number of processes."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-n', '--messages', type=int, default=512,
+                        help='number of messages to hash')
+    parser.add_argument('-s', '--size', type=int, default=250,
+                        help='size in bytes of every message')
+    parser.add_argument('-c', '--chunk-size', type=int, default=16,
+                        help='number of messages sent to a process at once')
+    args = parser.parse_args()
+
+    messages: list = [os.urandom(args.size) for _ in range(args.messages)]
+
+    start: float = time.perf_counter()
+    expected: list = [Sha256.hash(message) for message in messages]
+    serial_time: float = time.perf_counter() - start
+    print(f'{"processes":>9} {"seconds":>9} {"hashes/s":>10} {"speedup":>8}')
+    print(f'{"serial":>9} {serial_time:9.3f} '
+          f'{args.messages / serial_time:10.1f} {1:8.2f}')
+
+    max_workers: int
+    for max_workers in _worker_counts(os.cpu_count() or 1):
+        start = time.perf_counter()
+        digests: list = parallel.hash_many(messages,
+                                           chunk_size=args.chunk_size,
+                                           max_workers=max_workers)
+        elapsed: float = time.perf_counter() - start
+        if digests != expected:
+            raise AssertionError('parallel hash values differ from serial')
+
+        print(f'{max_workers:>9} {elapsed:9.3f} '
+              f'{args.messages / elapsed:10.1f} {serial_time / elapsed:8.2f}')
+
+
+def _worker_counts(num_cpus: int) -> list:
+    # powers of two up to the number of processors, and the processors
+    counts: list = [1]
+    while counts[-1] * 2 < num_cpus:
+        counts.append(counts[-1] * 2)
+
+    if counts[-1] != num_cpus:
+        counts.append(num_cpus)
+
+    return counts
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+"""
+Profiles the call graph of the didactic SHA-256 and prints the functions
+where most of the time is spent, to find the bit and byte primitives worth
+optimizing.
+
+Usage: python -m understandingbitcoin.bench.profile [-s SIZE] [-n CALLS]
+"""
+import argparse
+import cProfile
+import os
+import pstats
+
+from understandingbitcoin.hash.backend import DIDACTIC
+from understandingbitcoin.hash.sha256 import Sha256
+
+
+def main():
+    """Prints the profile of hashing a message several times."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-s', '--size', type=int, default=1024,
+                        help='size in bytes of the message to hash')
+    parser.add_argument('-n', '--calls', type=int, default=10,
+                        help='number of times the message is hashed')
+    parser.add_argument('-l', '--limit', type=int, default=20,
+                        help='number of functions printed')
+    parser.add_argument('--sort', default='tottime',
+                        choices=('tottime', 'cumulative', 'ncalls'),
+                        help='order of the functions printed')
+    parser.add_argument('-o', '--output',
+                        help='file where the profile is stored, to be '
+                             'compared with another one using pstats')
+    args = parser.parse_args()
+
+    message: bytes = os.urandom(args.size)
+    profile = cProfile.Profile()
+    profile.enable()
+    for _ in range(args.calls):
+        Sha256.hash(message, DIDACTIC)
+    profile.disable()
+
+    if args.output:
+        profile.dump_stats(args.output)
+
+    statistics = pstats.Stats(profile).strip_dirs().sort_stats(args.sort)
+    statistics.print_stats(args.limit)
+
+
+if __name__ == '__main__':
+    main()
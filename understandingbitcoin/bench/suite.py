@@ -0,0 +1,231 @@
+"""Defines the benchmark suite of the hash functions, with every backend,
+and of the bit and byte primitives, and compares its results with a
+baseline."""
+from __future__ import annotations
+
+import json
+import os
+import platform
+
+from understandingbitcoin.bench.throughput import measure
+from understandingbitcoin.common import alloc
+from understandingbitcoin.common.bit import BitStream
+from understandingbitcoin.common.byte import ByteBuffer, ByteOrder
+from understandingbitcoin.hash import backend
+from understandingbitcoin.hash.sha256 import Sha256
+
+# sizes in bytes of the messages hashed: empty, the largest message of a
+# single block, exactly one block, and multiple blocks
+MESSAGE_SIZES: tuple = (0, 55, 64, 1024, 1024 * 1024)
+
+# objects allowed to be created per block of the extended message in a call
+# to Sha256.hash, by backend
+ALLOCATION_BUDGETS: dict = {
+    backend.DIDACTIC: {'bitstreams': 2600, 'bytebuffers': 3},
+    backend.OPTIMIZED: {'bitstreams': 0, 'bytebuffers': 0},
+    backend.HASHLIB: {'bitstreams': 0, 'bytebuffers': 0},
+}
+
+# size in bytes of the largest message whose allocations are counted; the
+# objects created per block do not depend on the size, and counting them in
+# larger messages with tracemalloc takes minutes
+MAX_ACCOUNTED_SIZE: int = 64 * 1024
+
+# number of 32-bit words written and read in the byte buffer cases
+_NUM_WORDS: int = 16
+
+
+def cases(sizes: tuple | list = MESSAGE_SIZES) -> dict:
+    """
+    Returns the cases of the benchmark suite by name, that is, the hashing
+    with every backend and size, and the bit stream and byte buffer
+    operations.
+
+    :param sizes: The sizes in bytes of the messages hashed
+    :return: The functions to measure, without parameters, by name
+    """
+    suite: dict = {}
+    size: int
+    for size in sizes:
+        message: bytes = os.urandom(size)
+        name: str
+        for name in backend.available_backends():
+            suite[f'sha256.hash[{name}]/{size}'] = \
+                lambda m=message, b=name: Sha256.hash(m, b)
+
+    suite.update(_bit_stream_cases())
+    suite.update(_byte_buffer_cases())
+    return suite
+
+
+def run(suite: dict, min_seconds: float = 0.5) -> dict:
+    """
+    Measures every case of the given benchmark suite.
+
+    :param suite: The functions to measure, without parameters, by name
+    :param min_seconds: The minimum time spent measuring each case
+    :return: The results, that is, the platform and the mean time in seconds
+    of a call to every case
+    """
+    return {
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'seconds': {name: measure(function, min_seconds)
+                    for name, function in suite.items()},
+    }
+
+
+def account(sizes: tuple | list = MESSAGE_SIZES) -> dict:
+    """
+    Returns the allocations of a call to Sha256.hash with every backend that
+    has a budget and every size up to MAX_ACCOUNTED_SIZE: the objects
+    created per block of the extended message and the peak of memory of the
+    call.
+
+    :param sizes: The sizes in bytes of the messages hashed
+    :return: The allocations, by name of the case and counter
+    """
+    allocations: dict = {}
+    size: int
+    for size in (size for size in sizes if size <= MAX_ACCOUNTED_SIZE):
+        message: bytes = os.urandom(size)
+        num_blocks: int = _num_blocks(size)
+        name: str
+        for name in ALLOCATION_BUDGETS:
+            # the first call can initialize the backend
+            Sha256.hash(message, name)
+            with alloc.accounting() as counters:
+                Sha256.hash(message, name)
+
+            allocations[f'sha256.hash[{name}]/{size}'] = {
+                'bitstreams': counters.bitstreams / num_blocks,
+                'bytebuffers': counters.bytebuffers / num_blocks,
+                'peak_bytes': counters.peak_bytes,
+            }
+
+    return allocations
+
+
+def check_budgets(allocations: dict) -> dict:
+    """
+    Returns the counters of the given allocations over their budget.
+
+    :param allocations: The allocations, by name of the case and counter
+    :return: The value and budget of the counters over budget, by name of the
+    case and counter
+    """
+    exceeded: dict = {}
+    name: str
+    counters: dict
+    for name, counters in allocations.items():
+        budget: dict = ALLOCATION_BUDGETS[name[name.index('[') + 1:
+                                               name.index(']')]]
+        over: dict = {counter: (counters[counter], limit)
+                      for counter, limit in budget.items()
+                      if counters[counter] > limit}
+        if over:
+            exceeded[name] = over
+
+    return exceeded
+
+
+def compare(results: dict, baseline: dict, tolerance: float = 0.25) -> dict:
+    """
+    Returns the cases slower than in the baseline beyond the given
+    tolerance. Cases missing in the baseline are not compared.
+
+    :param results: The results of the benchmark suite
+    :param baseline: The results taken as baseline
+    :param tolerance: The fraction of the baseline time a case can exceed
+    :return: The ratio between the current and baseline time of the
+    regressed cases, by name
+    """
+    if tolerance < 0:
+        raise ValueError('the given tolerance is negative')
+
+    regressions: dict = {}
+    name: str
+    seconds: float
+    for name, seconds in results['seconds'].items():
+        baseline_seconds: float | None = baseline['seconds'].get(name)
+        if baseline_seconds and seconds > baseline_seconds * (1 + tolerance):
+            regressions[name] = seconds / baseline_seconds
+
+    return regressions
+
+
+def load(path: str) -> dict:
+    """
+    Reads the results of the benchmark suite stored in a JSON file.
+
+    :param path: The path of the file
+    :return: The results
+    """
+    with open(path, encoding='utf-8') as file:
+        return json.load(file)
+
+
+def save(results: dict, path: str):
+    """
+    Stores the results of the benchmark suite in a JSON file.
+
+    :param results: The results
+    :param path: The path of the file
+    """
+    with open(path, 'w', encoding='utf-8') as file:
+        json.dump(results, file, indent=2, sort_keys=True)
+        file.write('\n')
+
+
+def _num_blocks(size: int) -> int:
+    # pylint: disable=protected-access
+    extended_size: int = size + 1 + Sha256._MESSAGE_LENGTH_SIZE_BYTES
+    return -(-extended_size // Sha256._BLOCK_SIZE_BYTES)
+
+
+def _bit_stream_cases() -> dict:
+    x: BitStream = BitStream.from_unsigned_int(0x6a09e667, zfill=32)
+    y: BitStream = BitStream.from_unsigned_int(0xbb67ae85, zfill=32)
+    return {
+        'bitstream.from_unsigned_int': lambda:
+            BitStream.from_unsigned_int(0x6a09e667, zfill=32),
+        'bitstream.add': lambda: (x + y).mod(2 ** 32),
+        'bitstream.and': lambda: x & y,
+        'bitstream.or': lambda: x | y,
+        'bitstream.xor': lambda: x ^ y,
+        'bitstream.invert': lambda: ~x,
+        'bitstream.rshift': lambda: x >> 7,
+        'bitstream.rotate_right': lambda: x.rotate_right(7),
+        'bitstream.getitem': lambda: x[8:24],
+        'bitstream.bytes': x.bytes,
+    }
+
+
+def _byte_buffer_cases() -> dict:
+    words: list = [BitStream.from_unsigned_int(i, zfill=32)
+                   for i in range(_NUM_WORDS)]
+    suite: dict = {}
+    order: ByteOrder
+    for order in ByteOrder:
+        buffer: ByteBuffer = _put_words(words, order)
+        suite[f'bytebuffer.put_word32[{order.name.lower()}]'] = \
+            lambda o=order: _put_words(words, o)
+        suite[f'bytebuffer.get_word32[{order.name.lower()}]'] = \
+            lambda b=buffer: _get_words(b)
+
+    return suite
+
+
+def _put_words(words: list, order: ByteOrder) -> ByteBuffer:
+    buffer: ByteBuffer = ByteBuffer(order)
+    word: BitStream
+    for word in words:
+        buffer.put_word32(word)
+
+    return buffer
+
+
+def _get_words(buffer: ByteBuffer) -> list:
+    # a view of the whole buffer reads from its start every time
+    view: ByteBuffer = buffer[:]
+    return [view.get_word32() for _ in range(_NUM_WORDS)]
@@ -0,0 +1,97 @@
+"""
+Measures the throughput of the one-shot and the streaming hashing of every
+hash function for several message sizes, and of the generated compression
+functions of SHA-2.
+
+Usage: python -m understandingbitcoin.bench.throughput [-s SIZE ...]
+"""
+import argparse
+import os
+import time
+from typing import Callable
+
+from understandingbitcoin.hash import unrolled
+from understandingbitcoin.hash.ripemd160 import Ripemd160
+from understandingbitcoin.hash.sha2 import Sha2
+from understandingbitcoin.hash.sha224 import Sha224
+from understandingbitcoin.hash.sha256 import Sha256
+from understandingbitcoin.hash.sha512 import Sha512
+
+# hash functions measured, by name
+HASH_FUNCTIONS: dict = {
+    'sha224': Sha224,
+    'sha256': Sha256,
+    'sha512': Sha512,
+    'ripemd160': Ripemd160,
+}
+
+
+def measure(function: Callable, min_seconds: float = 0.5) -> float:
+    """
+    Returns the mean time in seconds of a call to the given function,
+    calling it repeatedly for at least the given time.
+
+    :param function: The function to measure, without parameters
+    :param min_seconds: The minimum time spent calling the function
+    :return: The mean time in seconds of a call
+    """
+    calls: int = 0
+    start: float = time.perf_counter()
+    elapsed: float = 0.0
+    while calls == 0 or elapsed < min_seconds:
+        function()
+        calls += 1
+        elapsed = time.perf_counter() - start
+
+    return elapsed / calls
+
+
+def main():
+    """Prints the throughput of every hash function and message size."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-s', '--sizes', type=int, nargs='+',
+                        default=[0, 55, 64, 1024, 16384],
+                        help='sizes in bytes of the messages to hash')
+    parser.add_argument('-a', '--algorithms', nargs='+',
+                        choices=sorted(HASH_FUNCTIONS),
+                        default=list(HASH_FUNCTIONS),
+                        help='hash functions to measure')
+    parser.add_argument('-t', '--time', type=float, default=0.5,
+                        help='minimum seconds spent measuring each case')
+    args = parser.parse_args()
+
+    print(f'{"algorithm":>10} {"mode":>9} {"bytes":>7} {"hashes/s":>10} '
+          f'{"KiB/s":>9}')
+    name: str
+    for name in args.algorithms:
+        hash_function = HASH_FUNCTIONS[name]
+        size: int
+        for size in args.sizes:
+            message: bytes = os.urandom(size)
+            cases: dict = {
+                'one-shot': lambda h=hash_function, m=message: h.hash(m),
+                'streaming': lambda h=hash_function, m=message:
+                    _hash_in_chunks(h, m),
+            }
+            if issubclass(hash_function, Sha2):
+                cases['unrolled'] = lambda h=hash_function, m=message: \
+                    unrolled.hash_message(m, h)
+
+            mode: str
+            for mode, function in cases.items():
+                seconds: float = measure(function, args.time)
+                print(f'{name:>10} {mode:>9} {size:>7} {1 / seconds:10.1f} '
+                      f'{size / seconds / 1024:9.1f}')
+
+
+def _hash_in_chunks(hash_function, message: bytes,
+                    chunk_size: int = 1000) -> bytes:
+    hasher = hash_function()
+    for i in range(0, len(message), chunk_size):
+        hasher.update(message[i:i + chunk_size])
+
+    return hasher.digest()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+"""
+Measures the cost of tracing SHA-256: hashing without a tracer against the
+bare loop of blocks it runs, which shows that the untraced path pays nothing
+for tracing, and hashing with tracers that ignore or record the values.
+
+Usage: python -m understandingbitcoin.bench.tracing [-s SIZE ...]
+"""
+import argparse
+import os
+
+from understandingbitcoin.bench.throughput import measure
+from understandingbitcoin.hash.backend import DIDACTIC
+from understandingbitcoin.hash.sha256 import Sha256
+from understandingbitcoin.hash.trace import RecordingTracer, Tracer
+
+
+def main():
+    """Prints the time of every way of hashing relative to the bare loop."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-s', '--sizes', type=int, nargs='+',
+                        default=[0, 64, 1024],
+                        help='sizes in bytes of the messages to hash')
+    parser.add_argument('-t', '--time', type=float, default=0.5,
+                        help='minimum seconds spent measuring each case')
+    args = parser.parse_args()
+
+    print(f'{"mode":>9} {"bytes":>7} {"hashes/s":>10} {"relative":>9}')
+    size: int
+    for size in args.sizes:
+        message: bytes = os.urandom(size)
+        cases: dict = {
+            'bare': lambda m=message: _hash_bare(m),
+            'untraced': lambda m=message: Sha256.hash(m, DIDACTIC),
+            'no-op': lambda m=message: Sha256.hash(m, tracer=Tracer()),
+            'recording': lambda m=message:
+                Sha256.hash(m, tracer=RecordingTracer()),
+        }
+
+        bare_time: float = None
+        mode: str
+        for mode, function in cases.items():
+            seconds: float = measure(function, args.time)
+            bare_time = bare_time or seconds
+            print(f'{mode:>9} {size:>7} {1 / seconds:10.1f} '
+                  f'{seconds / bare_time:9.3f}')
+
+
+def _hash_bare(message: bytes) -> bytes:
+    # the steps of Sha256.hash without the selection of backend or tracer
+    # pylint: disable=protected-access
+    hash_values: list = Sha256._init_hash()
+    for block in Sha256._split_extended_message(
+            Sha256._extend_message(message)):
+        Sha256._process_block(hash_values, block)
+
+    return Sha256._generate_digest(hash_values)
+
+
+if __name__ == '__main__':
+    main()
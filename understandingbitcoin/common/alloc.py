@@ -0,0 +1,183 @@
+"""Implements an accounting mode of the binary sequences and byte buffers
+created, and of the memory allocated, while it is active."""
+from __future__ import annotations
+
+import gc
+import tracemalloc
+from contextlib import contextmanager
+from typing import Iterator
+
+from understandingbitcoin.common.bit import BitStream
+from understandingbitcoin.common.byte import ByteBuffer
+
+
+class AllocationCounters:
+    """
+    Counts the binary sequences and byte buffers created while the
+    accounting mode is active, how many more of them are alive at its end,
+    and the memory allocated according to tracemalloc.
+    """
+
+    def __init__(self):
+        """Constructs the counters with nothing counted."""
+        # objects created in the accounting mode
+        self.bitstreams: int = 0
+        self.bytebuffers: int = 0
+        # increase of the objects alive from the start to the end of the
+        # accounting mode
+        self.retained_bitstreams: int = 0
+        self.retained_bytebuffers: int = 0
+        # highest memory in use and memory still in use at the end, in bytes,
+        # over the memory in use when the accounting mode started
+        self.peak_bytes: int = 0
+        self.retained_bytes: int = 0
+        # memory still in use at the end by file, in bytes
+        self.retained_bytes_by_file: dict = {}
+
+    @property
+    def temporary_bitstreams(self) -> int:
+        """The binary sequences created and released again."""
+        return self.bitstreams - self.retained_bitstreams
+
+    @property
+    def temporary_bytebuffers(self) -> int:
+        """The byte buffers created and released again."""
+        return self.bytebuffers - self.retained_bytebuffers
+
+    def per_call(self, calls: int = 1) -> dict:
+        """
+        Returns the counters divided by the number of calls made in the
+        accounting mode.
+
+        :param calls: The number of calls made
+        :return: The value of every counter per call, by name
+        """
+        if calls <= 0:
+            raise ValueError('the given number of calls is not greater than '
+                             + 'zero')
+
+        return {name: getattr(self, name) / calls for name in (
+            'bitstreams', 'temporary_bitstreams', 'bytebuffers',
+            'temporary_bytebuffers', 'peak_bytes', 'retained_bytes')}
+
+
+@contextmanager
+def accounting() -> Iterator[AllocationCounters]:
+    """
+    Activates the accounting mode until the end of the with block. The
+    constructors of BitStream and ByteBuffer are replaced by counting ones
+    only in the meantime, so the code outside the mode pays nothing for it.
+
+    The accounting mode is not thread-safe: objects created by other threads
+    are counted as well.
+
+    :return: The counters, complete at the end of the with block
+    """
+    counters: AllocationCounters = AllocationCounters()
+    alive: tuple = _count_alive()
+    originals: dict = _replace_constructors(counters)
+
+    was_tracing: bool = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    start_bytes: int = tracemalloc.get_traced_memory()[0]
+    start: tracemalloc.Snapshot = tracemalloc.take_snapshot()
+    try:
+        yield counters
+    finally:
+        (end_bytes, peak_bytes) = tracemalloc.get_traced_memory()
+        end: tracemalloc.Snapshot = tracemalloc.take_snapshot()
+        if not was_tracing:
+            tracemalloc.stop()
+        _restore_constructors(originals)
+
+        counters.peak_bytes = peak_bytes - start_bytes
+        counters.retained_bytes = end_bytes - start_bytes
+        counters.retained_bytes_by_file = _retained_bytes_by_file(start, end)
+        (counters.retained_bitstreams, counters.retained_bytebuffers) = (
+            end_alive - start_alive
+            for end_alive, start_alive in zip(_count_alive(), alive))
+
+
+def report(counters: AllocationCounters, calls: int = 1,
+           top: int = 5) -> str:
+    """
+    Returns a printable report of the given counters per call, with the
+    files that retain the most memory.
+
+    :param counters: The counters of an accounting mode
+    :param calls: The number of calls made in the accounting mode
+    :param top: The number of files listed
+    :return: The report
+    """
+    lines: list = [f'{name:>22} {value:12.1f}'
+                   for name, value in counters.per_call(calls).items()]
+    file: str
+    size: int
+    for file, size in sorted(counters.retained_bytes_by_file.items(),
+                             key=lambda item: -item[1])[:top]:
+        lines.append(f'{size / calls:12.1f} B retained by {file}')
+
+    return '\n'.join(lines)
+
+
+def _count_alive() -> tuple:
+    # objects alive, found through the garbage collector instead of keeping
+    # a reference to every object created, which would be counted as
+    # allocated memory
+    objects: list = gc.get_objects()
+    return (sum(1 for o in objects if isinstance(o, BitStream)),
+            sum(1 for o in objects if isinstance(o, ByteBuffer)))
+
+
+def _replace_constructors(counters: AllocationCounters) -> dict:
+    # pylint: disable=protected-access
+    originals: dict = {
+        (BitStream, '__init__'): BitStream.__dict__['__init__'],
+        (BitStream, '_new'): BitStream.__dict__['_new'],
+        (ByteBuffer, '__init__'): ByteBuffer.__dict__['__init__'],
+        (ByteBuffer, '_from_memory'): ByteBuffer.__dict__['_from_memory'],
+    }
+    init_bitstream = BitStream.__init__
+    new_bitstream = BitStream._new
+    init_bytebuffer = ByteBuffer.__init__
+    from_memory = ByteBuffer._from_memory
+
+    def counting_init_bitstream(self, *args, **kwargs):
+        counters.bitstreams += 1
+        init_bitstream(self, *args, **kwargs)
+
+    def counting_new_bitstream(_, value: int, num_bits: int) -> BitStream:
+        counters.bitstreams += 1
+        return new_bitstream(value, num_bits)
+
+    def counting_init_bytebuffer(self, *args, **kwargs):
+        counters.bytebuffers += 1
+        init_bytebuffer(self, *args, **kwargs)
+
+    def counting_from_memory(_, memory, order) -> ByteBuffer:
+        counters.bytebuffers += 1
+        return from_memory(memory, order)
+
+    BitStream.__init__ = counting_init_bitstream
+    BitStream._new = classmethod(counting_new_bitstream)
+    ByteBuffer.__init__ = counting_init_bytebuffer
+    ByteBuffer._from_memory = classmethod(counting_from_memory)
+    return originals
+
+
+def _restore_constructors(originals: dict):
+    for (cls, name), function in originals.items():
+        setattr(cls, name, function)
+
+
+def _retained_bytes_by_file(start: tracemalloc.Snapshot,
+                            end: tracemalloc.Snapshot) -> dict:
+    # the bookkeeping of the accounting mode itself is not reported
+    filters: list = [tracemalloc.Filter(False, __file__),
+                     tracemalloc.Filter(False, tracemalloc.__file__)]
+    statistics: list = end.filter_traces(filters).compare_to(
+        start.filter_traces(filters), 'filename')
+    return {statistic.traceback[0].filename: statistic.size_diff
+            for statistic in statistics if statistic.size_diff > 0}
@@ -7,26 +7,44 @@ import string
 class BitStream:
 
     """
-    Implements an immutable binary sequence, backed by a string
-    representation.
+    Implements an immutable binary sequence, backed by an unsigned integer
+    and an explicit number of bits.
 
-    Note that this is not the most efficient way to implement such class, but
-    for didactic and debugging purposes, it is a very convenient and
-    user-friendly option.
+    All the operations are performed as integer arithmetic over the value,
+    masked to the number of bits of the sequence. For didactic and debugging
+    purposes, the string binary representation of the sequence, including
+    its leading zeros, is still available through str().
     """
     BIT_0: str = '0'
     BIT_1: str = '1'
 
+    # characters of a hexadecimal string
+    _HEX_DIGITS: frozenset = frozenset(string.hexdigits)
+
     @classmethod
     def from_bytes(cls, byte_value: bytes) -> BitStream:
         """
-        Returns a binary sequence represented by the given array of bytes.
+        Returns a binary sequence represented by the given array of bytes,
+        eight bits per byte, including leading zero bytes.
 
         :param byte_value: The array of bytes to convert
         :return: The binary sequence representation
         """
-        return BitStream.from_unsigned_int(int.from_bytes(byte_value,
-                                                          byteorder='big'))
+        return BitStream._new(int.from_bytes(byte_value, byteorder='big'),
+                              len(byte_value) * 8)
+
+    @classmethod
+    def from_buffer(cls, buffer) -> BitStream:
+        """
+        Returns a binary sequence represented by the bytes of the given
+        object, such as a bytearray, a memoryview or a memory-mapped file,
+        read in one step without copying them first.
+
+        :param buffer: The object that supports the buffer protocol
+        :return: The binary sequence representation
+        """
+        with memoryview(buffer) as view, view.cast('B') as byte_view:
+            return BitStream.from_bytes(byte_view)
 
     @classmethod
     def from_char(cls, char: str) -> BitStream:
@@ -51,14 +69,13 @@ class BitStream:
         string.
 
         :param hex_string: The hexadecimal string to convert
-        :return: The binary sequence representation
+        :return: The binary sequence representation, four bits per digit
         """
-        if not all(c in string.hexdigits for c in hex_string):
+        if not cls._HEX_DIGITS.issuperset(hex_string):
             raise ValueError('the given parameter is not a hexadecimal string')
 
-        return BitStream.parse_str(''.join(tuple(
-            map(lambda i: str(BitStream.from_unsigned_int(i, zfill=4)),
-                map(lambda h: int(h, 16), hex_string)))))
+        return BitStream._new(int(hex_string, 16) if hex_string else 0,
+                              len(hex_string) * 4)
 
     @classmethod
     def from_unsigned_int(cls, integer: int, zfill=0) -> BitStream:
@@ -76,7 +93,7 @@ class BitStream:
             raise ValueError('the given parameter is not greater than or '
                              + 'equal to zero')
 
-        return BitStream(format(integer, 'b'), zfill)
+        return BitStream._new(integer, max(integer.bit_length() or 1, zfill))
 
     @classmethod
     def parse_str(cls, binary_string: str) -> BitStream:
@@ -89,6 +106,16 @@ class BitStream:
         """
         return BitStream(binary_string)
 
+    @classmethod
+    def _new(cls, value: int, num_bits: int) -> BitStream:
+        # builds a binary sequence from an integer value that is already
+        # known to fit in the given number of bits, without any validation,
+        # for the results computed inside the library
+        bitstream: BitStream = object.__new__(BitStream)
+        bitstream._value = value
+        bitstream._num_bits = num_bits
+        return bitstream
+
     def join(self, *others: BitStream | tuple | list | str):
         """
         Returns a new binary sequence whose value is the binary concatenation
@@ -101,8 +128,16 @@ class BitStream:
         if len(others) == 1 and isinstance(others[0], (list, tuple)):
             others = others[0]
 
-        return BitStream.parse_str(self._value
-                                   + ''.join(list(map(str, others))))
+        value: int = self._value
+        num_bits: int = self._num_bits
+        for other in others:
+            if not isinstance(other, BitStream):
+                other = BitStream.parse_str(str(other))
+
+            value = (value << len(other)) | int(other)
+            num_bits += len(other)
+
+        return BitStream._new(value, num_bits)
 
     def __init__(self, binary_value: str = '', zfill=0):
         """
@@ -117,19 +152,29 @@ class BitStream:
         if not all(char in (self.BIT_0, self.BIT_1) for char in binary_value):
             raise ValueError('the given parameter is not a binary number')
 
-        self._value: str = binary_value.zfill(zfill)
+        self._value: int = int(binary_value, 2) if binary_value else 0
+        self._num_bits: int = max(len(binary_value), zfill)
 
     def __eq__(self, other: BitStream | str) -> bool:
         """Returns true if the value of this is equal to the value of other."""
+        if isinstance(other, BitStream):
+            return self._num_bits == other._num_bits \
+                and self._value == other._value
+
         return str(self) == str(other)
 
+    def __int__(self) -> int:
+        """Returns the unsigned integer value of the binary sequence."""
+        return self._value
+
     def __len__(self) -> int:
         """Returns the number of bits in the binary sequence."""
-        return len(self._value)
+        return self._num_bits
 
     def __str__(self) -> str:
         """Returns the string binary representation of the binary sequence."""
-        return self._value
+        return format(self._value, f'0{self._num_bits}b') \
+            if self._num_bits > 0 else ''
 
     def __add__(self, other: BitStream | str | int) -> BitStream:
         """
@@ -140,14 +185,16 @@ class BitStream:
         of a binary number to add
         :return: A new binary sequence with the binary addition
         """
-        if isinstance(other, (BitStream, str)):
-            result: int = int(str(self) or self.BIT_0, 2) \
-                          + int(str(other) or self.BIT_0, 2)
-            return BitStream.from_unsigned_int(result, max(len(self),
-                                                           len(other)))
+        if isinstance(other, str):
+            other = BitStream.parse_str(other)
 
-        return BitStream.from_unsigned_int(int(self._value or self.BIT_0, 2)
-                                           + other)
+        if isinstance(other, BitStream):
+            # the sum of two valid sequences is valid, so it is not checked
+            result: int = self._value + other._value
+            return BitStream._new(result, max(result.bit_length() or 1,
+                                              self._num_bits, other._num_bits))
+
+        return BitStream.from_unsigned_int(self._value + other)
 
     def __and__(self, other: BitStream):
         """
@@ -157,20 +204,8 @@ class BitStream:
         :param other: The binary sequence with which to apply the operation
         :return: A new binary sequence with the result of the operation
         """
-        value: str = ''
-        num_bits, operand1, operand2 = self._normalize_operands(self, other)
-        for i in range(num_bits):
-            value += self.BIT_1 if self.BIT_1 == operand1[i] == operand2[i] \
-                else self.BIT_0
-
-        return BitStream.parse_str(value)
-
-    @staticmethod
-    def _normalize_operands(operand1, operand2) -> tuple:
-        num_bits: int = max(len(operand1), len(operand2))
-        operand1: str = str(operand1).zfill(num_bits)
-        operand2: str = str(operand2).zfill(num_bits)
-        return num_bits, operand1, operand2
+        return BitStream._new(self._value & other._value,
+                              max(self._num_bits, other._num_bits))
 
     def __getitem__(self, item: int | slice) -> BitStream:
         """
@@ -180,7 +215,23 @@ class BitStream:
         :param item: The index or slice of the subset
         :return: The specified binary sequence subset
         """
-        return BitStream.parse_str(self._value[item])
+        if isinstance(item, int):
+            if not -self._num_bits <= item < self._num_bits:
+                raise IndexError('the given index is out of range')
+
+            item %= self._num_bits
+            return BitStream._new(
+                (self._value >> (self._num_bits - 1 - item)) & 1, 1)
+
+        start, stop, step = item.indices(self._num_bits)
+        if step != 1:
+            bits: str = str(self)[item]
+            return BitStream._new(int(bits, 2) if bits else 0, len(bits))
+
+        num_bits: int = max(0, stop - start)
+        value: int = (self._value >> (self._num_bits - stop)) \
+            & ((1 << num_bits) - 1) if num_bits > 0 else 0
+        return BitStream._new(value, num_bits)
 
     def __invert__(self):
         """
@@ -189,11 +240,8 @@ class BitStream:
 
         :return: A new binary sequence with the result of the operation
         """
-        complement: str = ''
-        for bit in self._value:
-            complement += self.BIT_1 if bit == self.BIT_0 else self.BIT_0
-
-        return BitStream.parse_str(complement)
+        return BitStream._new(self._value ^ ((1 << self._num_bits) - 1),
+                              self._num_bits)
 
     def __or__(self, other: BitStream):
         """
@@ -203,13 +251,8 @@ class BitStream:
         :param other: The binary sequence with which to apply the operation
         :return: A new binary sequence with the result of the operation
         """
-        value: str = ''
-        num_bits, operand1, operand2 = self._normalize_operands(self, other)
-        for i in range(num_bits):
-            value += self.BIT_1 if self.BIT_1 in ([operand1[i], operand2[i]]) \
-                else self.BIT_0
-
-        return self.parse_str(value)
+        return BitStream._new(self._value | other._value,
+                              max(self._num_bits, other._num_bits))
 
     def __radd__(self, other: BitStream | str | int):
         """
@@ -233,9 +276,7 @@ class BitStream:
         if shifts < 1:
             raise ValueError('the given parameter is not greater than zero')
 
-        value: str = self.BIT_0 * min(
-            len(self._value), shifts) + self._value[0:-shifts]
-        return BitStream.parse_str(value)
+        return BitStream._new(self._value >> shifts, self._num_bits)
 
     def __xor__(self, other: BitStream):
         """
@@ -245,14 +286,8 @@ class BitStream:
         :param other: The binary sequence with which to apply the operation
         :return: A new binary sequence with the result of the operation
         """
-        value: str = ''
-        num_bits, operand1, operand2 = self._normalize_operands(self, other)
-        for i in range(num_bits):
-            value += self.BIT_1 \
-                if [operand1[i], operand2[i]].count(self.BIT_1) == 1 \
-                else self.BIT_0
-
-        return self.parse_str(value)
+        return BitStream._new(self._value ^ other._value,
+                              max(self._num_bits, other._num_bits))
 
     def mod(self, divisor: int) -> BitStream:
         """
@@ -265,7 +300,27 @@ class BitStream:
         if divisor <= 0:
             raise ValueError('the given parameter must be greater than zero')
 
-        return BitStream.parse_str(self._value[-divisor::])
+        if self._num_bits <= divisor:
+            return self
+
+        return BitStream._new(self._value & ((1 << divisor) - 1), divisor)
+
+    def reverse_bytes(self) -> BitStream:
+        """
+        Returns a new binary sequence with the same bytes in the opposite
+        order, that is, the same word in the opposite byte order.
+
+        :return: A new binary sequence with the result of the operation
+        """
+        if len(self) % 8 != 0:
+            raise ValueError('the length of the binary sequence is not '
+                             + 'multiple of eight')
+
+        num_bytes: int = self._num_bits // 8
+        value: int = int.from_bytes(
+            self._value.to_bytes(num_bytes, byteorder='big'),
+            byteorder='little')
+        return BitStream._new(value, self._num_bits)
 
     def rotate_left(self, shifts: int) -> BitStream:
         """
@@ -279,11 +334,14 @@ class BitStream:
         if shifts <= 0:
             raise ValueError('the given parameter must be greater than zero')
 
-        if 0 < len(self) < shifts:
-            shifts %= len(self)
+        if self._num_bits == 0:
+            return self
 
-        value: str = self._value[shifts:] + self._value[:shifts]
-        return self.parse_str(value)
+        shifts %= self._num_bits
+        value: int = ((self._value << shifts)
+                      | (self._value >> (self._num_bits - shifts))) \
+            & ((1 << self._num_bits) - 1)
+        return BitStream._new(value, self._num_bits)
 
     def rotate_right(self, shifts: int) -> BitStream:
         """
@@ -297,12 +355,14 @@ class BitStream:
         if shifts <= 0:
             raise ValueError('the given parameter must be greater than zero')
 
-        if 0 < len(self) < shifts:
-            shifts %= len(self)
+        if self._num_bits == 0:
+            return self
 
-        value: str = self._value[len(
-            self._value) - shifts:] + self._value[:-shifts]
-        return self.parse_str(value)
+        shifts %= self._num_bits
+        value: int = ((self._value >> shifts)
+                      | (self._value << (self._num_bits - shifts))) \
+            & ((1 << self._num_bits) - 1)
+        return BitStream._new(value, self._num_bits)
 
     def bytes(self) -> bytes:
         """
@@ -312,11 +372,11 @@ class BitStream:
             raise ValueError('the length of the binary sequence is not '
                              + 'multiple of eight')
 
-        return bytes.fromhex(self.hex())
+        return self._value.to_bytes(self._num_bits // 8, byteorder='big')
 
     def hex(self) -> str:
         """
         Returns a hexadecimal string representation of the binary sequence.
         """
-        return f'{hex(int(self._value, 2))[2:]:0>{len(self._value) // 4}}' \
+        return format(self._value, 'x').zfill(self._num_bits // 4) \
             if len(self) > 0 else ''
@@ -3,7 +3,7 @@ from __future__ import annotations
 
 import enum
 import string
-from abc import ABC, abstractmethod
+from abc import ABC
 
 from understandingbitcoin.common.bit import BitStream
 
@@ -29,9 +29,13 @@ class ByteBuffer:
 
     The buffer has an unlimited capacity and all write operations are performed
     at the end of the buffer. Read operations are limited to buffer contents
-    and can be done through an absolute or relative position.
+    and can be done through an absolute or relative position. Subsets of the
+    buffer are read-only views that share its memory.
     """
 
+    # characters of a hexadecimal string
+    _HEX_DIGITS: frozenset = frozenset(string.hexdigits)
+
     @classmethod
     def from_hex(cls, hex_string: str,
                  order: ByteOrder = ByteOrder.BIG_ENDIAN):
@@ -44,18 +48,43 @@ class ByteBuffer:
         :param order: The byte order used for the byte buffer
         :return: The byte buffer
         """
-        if not all(c in string.hexdigits for c in hex_string):
+        if not cls._HEX_DIGITS.issuperset(hex_string):
             raise ValueError('the given parameter is not a hexadecimal string')
 
         if len(hex_string) % 2 != 0:
             raise ValueError('the given parameter has an odd number of digits')
 
-        byte_buffer: ByteBuffer = ByteBuffer(order)
-        for i in range(0, len(hex_string), 2):
-            byte: int = int(hex_string[i:i + 2], 16)
-            byte_buffer.put_byte(byte)
+        return cls.from_bytes(bytes.fromhex(hex_string), order)
 
-        return byte_buffer
+    @classmethod
+    def from_bytes(cls, data: bytes,
+                   order: ByteOrder = ByteOrder.BIG_ENDIAN) -> ByteBuffer:
+        """
+        Returns a byte buffer with a copy of the given bytes, written in one
+        step.
+
+        :param data: The data to store, any bytes-like object
+        :param order: The byte order used for the byte buffer
+        :return: The byte buffer
+        """
+        return cls._from_memory(cls._create_memory(order, bytearray(data)),
+                                order)
+
+    @classmethod
+    def from_buffer(cls, buffer,
+                    order: ByteOrder = ByteOrder.BIG_ENDIAN) -> ByteBuffer:
+        """
+        Returns a read-only byte buffer over the bytes of the given object,
+        such as a bytearray or a memory-mapped file, without copying them.
+        As for subsets of a byte buffer, any write operation on it raises an
+        error.
+
+        :param buffer: The object that supports the buffer protocol
+        :param order: The byte order used for the byte buffer
+        :return: The read-only byte buffer
+        """
+        data: memoryview = memoryview(buffer).cast('B').toreadonly()
+        return cls._from_memory(cls._create_memory(order, data), order)
 
     def __init__(self, order: ByteOrder = ByteOrder.BIG_ENDIAN):
         """
@@ -67,11 +96,13 @@ class ByteBuffer:
         self._memory: _ByteBufferMemory = self._create_memory(order)
 
     @staticmethod
-    def _create_memory(order: ByteOrder) -> _ByteBufferMemory:
+    def _create_memory(order: ByteOrder,
+                       data: bytearray | memoryview | None = None) \
+            -> _ByteBufferMemory:
         if ByteOrder.BIG_ENDIAN == order:
-            memory = _BigEndianByteBufferMemory()
+            memory = _BigEndianByteBufferMemory(data)
         else:
-            memory = _LittleEndianByteBufferMemory()
+            memory = _LittleEndianByteBufferMemory(data)
 
         return memory
 
@@ -85,18 +116,24 @@ class ByteBuffer:
 
     def __getitem__(self, item) -> ByteBuffer:
         """
-        Returns a new byte buffer as a subset of this byte buffer.
+        Returns a read-only byte buffer as a subset of this byte buffer.
+
+        The subset is a view over the memory of this byte buffer, so no data
+        is copied. It has its own read position and any write operation on it
+        raises an error.
 
         :param item: The index or slice of the subset
         :return: The specified byte buffer subset
         """
-        if not isinstance(item, int) \
-                and not isinstance(item, slice) and item.step is None:
-            raise ValueError('the given parameter ist not a valid index or '
-                             + 'slice')
+        return ByteBuffer._from_memory(self._memory.view(item), self._order)
 
-        data: BitStream = self._memory[item]
-        return ByteBuffer.from_hex(data.hex(), self._order)
+    @classmethod
+    def _from_memory(cls, memory: _ByteBufferMemory,
+                     order: ByteOrder) -> ByteBuffer:
+        byte_buffer: ByteBuffer = object.__new__(ByteBuffer)
+        byte_buffer._order = order
+        byte_buffer._memory = memory
+        return byte_buffer
 
     def get_byte(self) -> BitStream:
         """Returns the next relative byte."""
@@ -124,10 +161,10 @@ class ByteBuffer:
 
         :param byte: The byte value to write
         """
-        if 0 > byte > 255:
+        if not 0 <= byte <= 255:
             raise ValueError('the given parameter is not between 0 and 255')
 
-        self._memory.write(BitStream.from_unsigned_int(byte, zfill=8))
+        self._memory.write_byte(byte)
 
     def put_word16(self, word: BitStream):
         """
@@ -180,24 +217,40 @@ class ByteBuffer:
     def bytes(self) -> bytes:
         """Returns an immutable byte array representation of the binary
         buffer. """
-        return bytes.fromhex(self.hex())
+        return self._memory.bytes()
 
 
 class _ByteBufferMemory(ABC):
-    """Defines an abstract byte buffer memory with common logic."""
+    """
+    Defines an abstract byte buffer memory with common logic.
+
+    The data is stored as real bytes in a growable byte array, so writes at
+    the end of the memory are amortized constant time and reads slice the
+    stored bytes directly. A memory can also be a read-only view over the
+    data of another memory.
+    """
 
-    def __init__(self):
-        """Constructs a memory and initialize the internal read index."""
+    # name of the byte order used to convert words from and to bytes
+    _BYTE_ORDER: str
+
+    def __init__(self, data: bytearray | memoryview | None = None):
+        """
+        Constructs a memory and initialize the internal read index.
+
+        :param data: The data of the memory. If it is a memory view, the
+        memory is read-only
+        """
         self._index: int = 0
-        self._data: BitStream = BitStream()
+        self._data: bytearray | memoryview = bytearray() \
+            if data is None else data
 
     def __len__(self) -> int:
         """Returns the size in bytes of the data stored ."""
-        return len(self._data) // 8
+        return len(self._data)
 
     def __str__(self) -> str:
         """Returns the string binary representation of the data stored."""
-        return str(self._data)
+        return str(self._to_bitstream(self._data, 'big'))
 
     def __getitem__(self, item: int | slice) -> BitStream:
         """
@@ -207,104 +260,106 @@ class _ByteBufferMemory(ABC):
         :param item: The index or slice of the data
         :return: The specified binary sequence of the data
         """
+        return self._to_bitstream(self._data[self._to_slice(item)], 'big')
+
+    def view(self, item: int | slice) -> _ByteBufferMemory:
+        """
+        Returns a read-only memory over the data stored for the specified
+        index or slice, without copying it.
+
+        :param item: The index or slice of the data
+        :return: The read-only memory of the data
+        """
+        data: memoryview = memoryview(self._data)[self._to_slice(item)]
+        return type(self)(data.toreadonly())
+
+    @staticmethod
+    def _to_slice(item: int | slice) -> slice:
         if not isinstance(item, int) \
                 and not (isinstance(item, slice) and item.step is None):
             raise ValueError('the given parameter ist not a valid index or '
                              + 'slice')
 
-        if isinstance(item, int):
-            item: slice = slice(item, None)
-
-        start: int = item.start * 8 if isinstance(item.start, int) else None
-        stop: int = item.stop * 8 if isinstance(item.stop, int) else None
+        return slice(item, None) if isinstance(item, int) else item
 
-        return self._data[start:stop]
+    def bytes(self) -> bytes:
+        """Returns an immutable byte array with the data stored."""
+        return bytes(self._data)
 
     def hex(self) -> str:
-        """..."""
+        """Returns a hexadecimal string representation of the data stored."""
         return self._data.hex()
 
-    @abstractmethod
-    def read(self, num_bytes) -> BitStream:
-        """..."""
-
-    @abstractmethod
-    def write(self, data: BitStream):
-        """..."""
-
-
-class _BigEndianByteBufferMemory(_ByteBufferMemory):
-
-    """Concrete implementation for the big-endian byte buffer memory."""
-
-    def read(self, num_bytes: int) -> BitStream | None:
+    def read(self, num_bytes: int) -> BitStream:
         """
         Reads the specified number of bytes from the memory.
 
         :param num_bytes: The number of bytes to read
         """
-
         if num_bytes < 0:
             raise ValueError('the given parameter is not greater than or '
                              + 'equal to zero')
 
-        if self._index >= len(self._data):
-            return BitStream()
-
         start: int = self._index
-        end: int = self._index + (num_bytes * 8)
-        self._index += num_bytes * 8
+        self._index += num_bytes
 
-        return self._data[start:end]
+        return self._to_bitstream(self._data[start:self._index],
+                                  self._BYTE_ORDER)
 
     def write(self, data: BitStream):
         """
-        Writes the specified data at the end of the memory. The most
-        significant byte is stored in the smallest memory address and the
-        least significant byte at the largest memory address.
+        Writes the specified data at the end of the memory.
 
         :param data: The binary sequences to write
         """
-        self._data = BitStream.join(self._data, data)
+        self._append(int(data).to_bytes(len(data) // 8,
+                                        byteorder=self._BYTE_ORDER))
 
+    def write_byte(self, byte: int):
+        """
+        Writes a single byte at the end of the memory.
 
-class _LittleEndianByteBufferMemory(_ByteBufferMemory):
+        :param byte: The byte value to write
+        """
+        self._append(bytes((byte,)))
 
-    """Concrete implementation for the little-endian byte buffer memory."""
+    def _append(self, data: bytes):
+        if isinstance(self._data, memoryview):
+            raise ValueError('the byte buffer is a read-only view')
 
-    def read(self, num_bytes: int) -> BitStream:
-        """
-        Reads the specified number of bytes from the memory.
+        try:
+            self._data += data
+        except BufferError:
+            # the byte array cannot be resized while it is shared with views,
+            # so the memory continues in a copy and the views keep the
+            # current data, which is never modified since writes only append
+            self._data = self._data + data
 
-        :param num_bytes: The number of bytes to read
-        """
-        if num_bytes < 0:
-            raise ValueError('the given parameter is not greater than or '
-                             + 'equal to zero')
+    @staticmethod
+    def _to_bitstream(data: bytes | bytearray, byte_order: str) -> BitStream:
+        # the width of the binary sequence is always the number of bytes read,
+        # so leading zero bytes are kept; bytes are always a valid value
+        return BitStream._new(  # pylint: disable=protected-access
+            int.from_bytes(data, byteorder=byte_order), len(data) * 8)
 
-        if self._index >= len(self._data):
-            return BitStream()
 
-        word: str = ''
-        for i in range(num_bytes * 8, 0, -8):
-            end: int = self._index + i
-            start: int = end - 8
-            word += str(self._data[start:end])
+class _BigEndianByteBufferMemory(_ByteBufferMemory):
 
-        self._index += num_bytes * 8
+    """
+    Concrete implementation for the big-endian byte buffer memory. The most
+    significant byte is stored in the smallest memory address and the least
+    significant byte at the largest memory address.
+    """
 
-        return BitStream.parse_str(word)
+    _BYTE_ORDER: str = 'big'
 
-    def write(self, data: BitStream):
-        """
-        Writes the specified data at the end of the memory. The most
-        significant byte is stored in the largest memory address and the least
-        significant at the smallest memory address.
 
-        :param data: The binary sequences to write
-        """
-        word: str = ''
-        for i in range(len(data), 0, -8):
-            word += str(data[i - 8:i])
+class _LittleEndianByteBufferMemory(_ByteBufferMemory):
+
+    """
+    Concrete implementation for the little-endian byte buffer memory. The
+    most significant byte is stored in the largest memory address and the
+    least significant at the smallest memory address.
+    """
 
-        self._data = BitStream.join(self._data, word)
+    _BYTE_ORDER: str = 'little'
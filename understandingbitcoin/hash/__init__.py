@@ -1,2 +1,5 @@
 """The modules contained in this package define the different hash algorithms
 used in Bitcoin."""
+
+# registers the optimized backend, which depends on the hash functions
+from understandingbitcoin.hash import unrolled
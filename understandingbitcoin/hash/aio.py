@@ -0,0 +1,116 @@
+"""Implements the hashing of messages read from asyncio streams."""
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import Executor
+
+from understandingbitcoin.hash.merkle_damgard import MerkleDamgardHash
+from understandingbitcoin.hash.sha256 import Sha256
+
+
+class AsyncHasher:
+    """
+    Hashes a message as it is read from an asyncio stream, without keeping
+    the whole message in memory.
+
+    The compression is done in batches of blocks and the event loop runs
+    other tasks between batches, so a large message does not block it.
+    Chunks larger than a threshold can be hashed in an executor instead.
+    """
+
+    def __init__(self, algorithm=Sha256, blocks_per_batch: int = 64,
+                 executor: Executor | None = None,
+                 offload_size: int | None = None):
+        """
+        Constructs a hasher with the initial hash values.
+
+        :param algorithm: The hash function, a subclass of MerkleDamgardHash
+        :param blocks_per_batch: The number of blocks compressed before
+        letting the event loop run other tasks
+        :param executor: The executor where large chunks are hashed, of
+        threads or processes. By default, the default executor of the event
+        loop
+        :param offload_size: The size in bytes from which a chunk is hashed
+        in the executor. By default, chunks are never offloaded
+        """
+        if blocks_per_batch < 1:
+            raise ValueError('the given number of blocks per batch must be '
+                             + 'greater than zero')
+
+        self._hasher: MerkleDamgardHash = algorithm()
+        self._batch_size: int = blocks_per_batch * self._hasher.block_size
+        self._executor: Executor | None = executor
+        self._offload_size: int | None = offload_size
+
+    async def update(self, message: bytes):
+        """
+        Hashes the next part of the message, in batches of blocks or in the
+        executor if the message is large enough.
+
+        :param message: The next part of the message to be hashed
+        """
+        if self._offload_size is not None \
+                and len(message) >= self._offload_size:
+            # the updated hasher is returned instead of updated in place,
+            # since a process executor only updates a copy of it
+            self._hasher = await asyncio.get_running_loop().run_in_executor(
+                self._executor, _update, self._hasher, bytes(message))
+            return
+
+        view: memoryview = memoryview(message)
+        batch_start: int
+        for batch_start in range(0, len(view), self._batch_size):
+            self._hasher.update(
+                view[batch_start:batch_start + self._batch_size])
+
+            # other tasks of the event loop run between batches
+            await asyncio.sleep(0)
+
+    async def consume(self, reader: asyncio.StreamReader,
+                      limit: int | None = None,
+                      chunk_size: int = 65536) -> int:
+        """
+        Reads the stream and hashes every chunk as soon as it is received,
+        until the end of the stream or the given number of bytes.
+
+        :param reader: The stream to read
+        :param limit: The maximum number of bytes to read. By default, the
+        stream is read until its end
+        :param chunk_size: The maximum number of bytes read at once
+        :return: The number of bytes read and hashed
+        """
+        num_bytes: int = 0
+        while limit is None or num_bytes < limit:
+            size: int = chunk_size if limit is None \
+                else min(chunk_size, limit - num_bytes)
+            chunk: bytes = await reader.read(size)
+            if not chunk:
+                break
+
+            await self.update(chunk)
+            num_bytes += len(chunk)
+
+        return num_bytes
+
+    def digest(self) -> bytes:
+        """
+        Returns the hash value in bytes of the message received so far.
+
+        :return: The hash value in bytes
+        """
+        return self._hasher.digest()
+
+    def hexdigest(self) -> str:
+        """
+        Returns the hash value in a hexadecimal string of the message
+        received so far.
+
+        :return: The hash value in a hexadecimal string
+        """
+        return self._hasher.hexdigest()
+
+
+def _update(hasher: MerkleDamgardHash,
+            message: bytes) -> MerkleDamgardHash:
+    hasher.update(message)
+    return hasher
@@ -0,0 +1,136 @@
+"""Implements the registry of the implementations (backends) that compute
+the hash values of the hash functions.
+
+The backend is used by hash() and by the hash256 and hash160 functions and
+everything built on them, such as the Merkle trees and the proof of work.
+The incremental hashers and what is built on them, such as hash_file(), the
+midstates, HMAC and PBKDF2, as well as hash_many(), always run the didactic
+implementation."""
+from __future__ import annotations
+
+import hashlib
+import os
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import Callable, Iterator
+
+# didactic implementation of the hash functions, built on BitStream words
+DIDACTIC: str = 'didactic'
+# fast implementation on integers, where available
+OPTIMIZED: str = 'optimized'
+# reference implementation of the standard library
+HASHLIB: str = 'hashlib'
+
+# environment variable with the backend used by default
+ENVIRONMENT_VARIABLE: str = 'UNDERSTANDINGBITCOIN_HASH_BACKEND'
+
+# functions that hash a message with a hash function, by backend; the
+# didactic backend is the code of the hash functions themselves
+_BACKENDS: dict = {DIDACTIC: None}
+
+# backend selected in the current thread or task
+_selected_backend: ContextVar = ContextVar('selected_backend', default=None)
+
+
+def register_backend(name: str,
+                     function: Callable[[type, bytes], bytes]):
+    """
+    Registers a backend, replacing any backend with the same name.
+
+    :param name: The name of the backend
+    :param function: The function that receives the hash function, a
+    subclass of MerkleDamgardHash, and the message, and returns the hash
+    value in bytes
+    """
+    if name == DIDACTIC:
+        raise ValueError('the didactic backend cannot be replaced')
+
+    _BACKENDS[name] = function
+
+
+def available_backends() -> tuple:
+    """Returns the names of the registered backends."""
+    return tuple(_BACKENDS)
+
+
+def current_backend() -> str:
+    """
+    Returns the name of the backend used in the current thread: the one
+    selected with use_backend(), or else the one in the environment variable,
+    or else the didactic one.
+
+    :return: The name of the backend
+    """
+    name: str = _selected_backend.get() \
+        or os.environ.get(ENVIRONMENT_VARIABLE) or DIDACTIC
+    _check_backend(name)
+    return name
+
+
+@contextmanager
+def use_backend(name: str) -> Iterator[str]:
+    """
+    Selects the backend used by the hash functions in the current thread,
+    or asyncio task, until the end of the with block.
+
+    :param name: The name of the backend
+    :return: The name of the backend
+    """
+    _check_backend(name)
+    token = _selected_backend.set(name)
+    try:
+        yield name
+    finally:
+        _selected_backend.reset(token)
+
+
+def get_backend(name: str | None = None) -> Callable | None:
+    """
+    Returns the function of the given backend, or of the current one.
+
+    :param name: The name of the backend. By default, the current one
+    :return: The function of the backend, or None for the didactic backend
+    """
+    name = name or current_backend()
+    _check_backend(name)
+    return _BACKENDS[name]
+
+
+@lru_cache(maxsize=None)
+def hashlib_supports(name: str) -> bool:
+    """
+    Returns whether hashlib can compute the given hash function. Some of
+    them, such as RIPEMD-160, depend on the OpenSSL build and are missing in
+    some versions even if listed as available.
+
+    :param name: The name of the hash function, as in hashlib
+    :return: True if hashlib computes the hash function, False otherwise
+    """
+    if name not in hashlib.algorithms_available:
+        return False
+
+    try:
+        hashlib.new(name)
+    except ValueError:
+        return False
+
+    return True
+
+
+def _check_backend(name: str):
+    if name not in _BACKENDS:
+        raise ValueError(f'the hash backend {name} does not exist')
+
+
+def _hash_hashlib(algorithm: type, message: bytes) -> bytes:
+    # hash functions missing in the OpenSSL build are not computed by hashlib
+    if not hashlib_supports(algorithm.name):
+        return algorithm.hash(message, backend=DIDACTIC)
+
+    return hashlib.new(algorithm.name, message).digest()
+
+
+# the optimized backend is registered by the unrolled module, which is
+# imported with the package, since it depends on the hash functions
+register_backend(HASHLIB, _hash_hashlib)
@@ -0,0 +1,106 @@
+"""Implements the HMAC message authentication code over the hash
+functions."""
+from __future__ import annotations
+
+from understandingbitcoin.hash.merkle_damgard import MerkleDamgardHash
+from understandingbitcoin.hash.sha256 import Sha256
+
+
+class Hmac:
+    """
+    Computes the HMAC of messages under a key: H((K ^ opad) || H((K ^ ipad)
+    || m)), where K is the key padded to the block size of the hash function.
+
+    The blocks K ^ ipad and K ^ opad only depend on the key, so they are
+    compressed once when the object is constructed and the hashers with
+    their hash values are copied for every message. Each MAC then only
+    compresses the blocks of the message and the final block of the outer
+    hash.
+    """
+
+    # bytes repeated along the block to derive the inner and outer keys
+    _IPAD: int = 0x36
+    _OPAD: int = 0x5c
+
+    def __init__(self, key: bytes, algorithm=Sha256):
+        """
+        Constructs the keyed object with the inner and outer blocks already
+        compressed.
+
+        :param key: The secret key, hashed first if longer than a block
+        :param algorithm: The hash function, a subclass of MerkleDamgardHash
+        """
+        self._algorithm = algorithm
+        self._inner: MerkleDamgardHash = algorithm()
+        self._outer: MerkleDamgardHash = algorithm()
+
+        # keys longer than a block are replaced by their hash value, and all
+        # of them are padded with zeros up to the block size
+        block_size: int = self._inner.block_size
+        if len(key) > block_size:
+            key = algorithm.hash(key)
+        key = key.ljust(block_size, b'\x00')
+
+        self._inner.update(bytes(byte ^ self._IPAD for byte in key))
+        self._outer.update(bytes(byte ^ self._OPAD for byte in key))
+
+        # the inner and outer messages of a MAC of a hash value always have
+        # the same length, so their last block ends with the same padding,
+        # written once in a block whose first words are replaced by every MAC
+        # of a hash value, so those MACs cannot run concurrently on an object
+        padding: tuple = \
+            algorithm._digest_padding()  # pylint: disable=protected-access
+        num_block_words: int = block_size * 8 \
+            // algorithm._WORD_SIZE_BITS  # pylint: disable=protected-access
+        self._digest_block: list = \
+            [None] * (num_block_words - len(padding)) + list(padding)
+
+    @property
+    def algorithm(self):
+        """The hash function used to compute the MAC."""
+        return self._algorithm
+
+    @property
+    def digest_size(self) -> int:
+        """The size in bytes of the MAC."""
+        return self._inner.digest_size
+
+    def digest(self, message: bytes) -> bytes:
+        """
+        Returns the MAC in bytes of the given message.
+
+        :param message: The message to be authenticated
+        :return: The MAC in bytes
+        """
+        inner: MerkleDamgardHash = self._inner.copy()
+        inner.update(message)
+
+        outer: MerkleDamgardHash = self._outer.copy()
+        outer.update(inner.digest())
+        return outer.digest()
+
+    def hexdigest(self, message: bytes) -> str:
+        """
+        Returns the MAC in a hexadecimal string of the given message.
+
+        :param message: The message to be authenticated
+        :return: The MAC in a hexadecimal string
+        """
+        return self.digest(message).hex()
+
+    def _digest_words(self, words: list) -> list:
+        # pylint: disable=protected-access
+        # MAC of a message that is a hash value, given and returned as the
+        # words of the hash value: the inner and the outer hashes only
+        # compress a single block made of the words and the padding, and
+        # the hash value can be shorter than the hash values
+        num_words: int = len(words)
+        block: list = self._digest_block
+        inner_values: list = list(self._inner._hash_values)
+        block[:num_words] = words
+        self._algorithm._process_words(inner_values, block)
+
+        outer_values: list = list(self._outer._hash_values)
+        block[:num_words] = inner_values[:num_words]
+        self._algorithm._process_words(outer_values, block)
+        return outer_values[:num_words]
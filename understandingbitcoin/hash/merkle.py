@@ -0,0 +1,258 @@
+"""Implements the Merkle tree of the transactions of a block."""
+from __future__ import annotations
+
+from understandingbitcoin.hash.sha256 import Sha256
+
+
+class MerkleProof:
+    """
+    Defines the proof that a leaf is included in a Merkle tree: the position
+    of the leaf and the sibling of every node on its path to the root.
+    """
+
+    def __init__(self, index: int, siblings: list | tuple):
+        """
+        Constructs a Merkle inclusion proof.
+
+        :param index: The position of the leaf in the tree
+        :param siblings: The 32-byte siblings of the path, from the leaves to
+        the root
+        """
+        self.index: int = index
+        self.siblings: tuple = tuple(siblings)
+
+    def __eq__(self, other: MerkleProof) -> bool:
+        """Returns true if both proofs have the same position and path."""
+        return (self.index, self.siblings) == (other.index, other.siblings)
+
+    def __len__(self) -> int:
+        """Returns the number of siblings, that is, the height of the tree."""
+        return len(self.siblings)
+
+
+class MerkleTree:
+    """
+    A Merkle tree summarizes the transactions of a block in a single 32-byte
+    hash value, the Merkle root. Every node is the double SHA-256 hash of the
+    concatenation of its two children and, when a level has an odd number of
+    nodes, the last one is paired with itself.
+
+    All the levels of the tree are kept, so replacing or appending a leaf
+    only recomputes the nodes on its path to the root.
+    """
+
+    # size in bytes of every node of the tree
+    _NODE_SIZE_BYTES: int = 32
+
+    def __init__(self, txids: list | tuple):
+        """
+        Constructs the Merkle tree of the given transaction ids.
+
+        :param txids: The 32-byte transaction ids in internal byte order, that
+        is, the double SHA-256 hash values of the transactions as they are,
+        not reversed as they are usually displayed
+        """
+        if len(txids) == 0:
+            raise ValueError('the given parameter has no transaction ids')
+
+        leaves: list = [self._check_node(txid) for txid in txids]
+        self._levels: list = [leaves]
+        while len(self._levels[-1]) > 1:
+            level: list = self._levels[-1]
+            self._levels.append([self._hash_children(level, i)
+                                 for i in range(0, len(level), 2)])
+
+    @classmethod
+    def verify(cls, proof: MerkleProof, leaf: bytes, root: bytes) -> bool:
+        """
+        Returns true if the given proof shows that the leaf is included in
+        the tree with the given Merkle root.
+
+        :param proof: The Merkle inclusion proof of the leaf
+        :param leaf: The 32-byte transaction id
+        :param root: The 32-byte Merkle root
+        :return: True if the leaf is included in the tree
+        """
+        if proof.index < 0 or proof.index >> len(proof) != 0:
+            return False
+
+        node: bytes = leaf
+        position: int = proof.index
+        sibling: bytes
+        for sibling in proof.siblings:
+            node = cls._hash_path_node(node, sibling, position)
+            position //= 2
+
+        return node == root
+
+    @classmethod
+    def verify_many(cls, proofs: list | tuple, root: bytes) -> list:
+        """
+        Returns, for every pair of proof and leaf, true if the proof shows
+        that the leaf is included in the tree with the given Merkle root.
+
+        Every node and sibling on the path of a valid proof is known to lead
+        to the root, so the next proofs stop as soon as they reach a known
+        node whose siblings up to the root are all known as well, instead of
+        hashing up to the root again. The results are the same as those of
+        verify.
+
+        :param proofs: The pairs of Merkle inclusion proof and 32-byte leaf
+        :param root: The 32-byte Merkle root
+        :return: The result of the verification of every pair
+        """
+        # nodes by depth and position that are known to lead to the root
+        verified: dict = {}
+        height: int | None = None
+
+        results: list = []
+        proof: MerkleProof
+        leaf: bytes
+        for proof, leaf in proofs:
+            if proof.index < 0 or proof.index >> len(proof) != 0 \
+                    or height not in (None, len(proof)):
+                results.append(False)
+                continue
+
+            known_depth: int = cls._known_siblings_depth(verified, proof)
+            path: list = []
+            node: bytes = leaf
+            position: int = proof.index
+            depth: int
+            for depth, sibling in enumerate(proof.siblings):
+                if depth >= known_depth \
+                        and verified.get((depth, position)) == node:
+                    break
+
+                path.append(((depth, position), node))
+                path.append(((depth, position ^ 1), sibling))
+                node = cls._hash_path_node(node, sibling, position)
+                position //= 2
+            else:
+                if node != root:
+                    results.append(False)
+                    continue
+
+                height = len(proof)
+
+            verified.update(path)
+            results.append(True)
+
+        return results
+
+    def __len__(self) -> int:
+        """Returns the number of leaves of the tree."""
+        return len(self._levels[0])
+
+    def __getitem__(self, index: int) -> bytes:
+        """Returns the transaction id of the leaf at the given position."""
+        return self._levels[0][index]
+
+    @property
+    def root(self) -> bytes:
+        """Returns the Merkle root in internal byte order."""
+        return self._levels[-1][0]
+
+    @property
+    def levels(self) -> tuple:
+        """Returns the nodes of every level, from the leaves to the root."""
+        return tuple(tuple(level) for level in self._levels)
+
+    def prove(self, index: int) -> MerkleProof:
+        """
+        Returns the proof that the leaf at the given position is included in
+        the tree.
+
+        :param index: The position of the leaf
+        :return: The Merkle inclusion proof of the leaf
+        """
+        if not -len(self) <= index < len(self):
+            raise IndexError('the given index is out of range')
+
+        index %= len(self)
+        siblings: list = []
+        position: int = index
+        level: list
+        for level in self._levels[:-1]:
+            sibling: int = position ^ 1
+            siblings.append(level[sibling if sibling < len(level)
+                                  else position])
+            position //= 2
+
+        return MerkleProof(index, siblings)
+
+    def replace(self, index: int, txid: bytes):
+        """
+        Replaces the leaf at the given position, for example the coinbase
+        transaction, and recomputes its path to the root.
+
+        :param index: The position of the leaf
+        :param txid: The new 32-byte transaction id
+        """
+        if not -len(self) <= index < len(self):
+            raise IndexError('the given index is out of range')
+
+        index %= len(self)
+        self._levels[0][index] = self._check_node(txid)
+        self._update_path(index)
+
+    def append(self, txid: bytes):
+        """
+        Appends a new leaf at the end of the tree and recomputes its path to
+        the root.
+
+        :param txid: The new 32-byte transaction id
+        """
+        self._levels[0].append(self._check_node(txid))
+        self._update_path(len(self) - 1)
+
+    def _update_path(self, index: int):
+        # each level recomputes the parent of the changed node, adding a new
+        # node or a new level when the tree grows
+        depth: int = 0
+        while len(self._levels[depth]) > 1:
+            if depth + 1 == len(self._levels):
+                self._levels.append([])
+
+            level: list = self._levels[depth]
+            parents: list = self._levels[depth + 1]
+            index //= 2
+            parent: bytes = self._hash_children(level, index * 2)
+            if index < len(parents):
+                parents[index] = parent
+            else:
+                parents.append(parent)
+
+            depth += 1
+
+    @classmethod
+    def _hash_children(cls, level: list, left: int) -> bytes:
+        right: int = left + 1 if left + 1 < len(level) else left
+        return Sha256.hash256(level[left] + level[right])
+
+    @staticmethod
+    def _known_siblings_depth(verified: dict, proof: MerkleProof) -> int:
+        # the lowest depth from which every sibling of the proof up to the
+        # root is a known node, going down from the root
+        depth: int = len(proof)
+        while depth > 0 and verified.get(
+                (depth - 1, (proof.index >> (depth - 1)) ^ 1)) \
+                == proof.siblings[depth - 1]:
+            depth -= 1
+
+        return depth
+
+    @staticmethod
+    def _hash_path_node(node: bytes, sibling: bytes, position: int) -> bytes:
+        # even positions are left children and odd positions right children
+        if position % 2 == 0:
+            return Sha256.hash256(node + sibling)
+
+        return Sha256.hash256(sibling + node)
+
+    @classmethod
+    def _check_node(cls, node: bytes) -> bytes:
+        if len(node) != cls._NODE_SIZE_BYTES:
+            raise ValueError('the given parameter is not 32 bytes long')
+
+        return bytes(node)
@@ -0,0 +1,546 @@
+"""Implements the Merkle-Damgård construction shared by the hash functions."""
+from __future__ import annotations
+
+import mmap
+import os
+from abc import ABC, abstractmethod
+from copy import deepcopy
+from typing import TYPE_CHECKING, Callable
+
+from understandingbitcoin.common.bit import BitStream
+from understandingbitcoin.common.byte import ByteBuffer, ByteOrder
+from understandingbitcoin.hash.backend import DIDACTIC, get_backend
+from understandingbitcoin.hash.trace import Tracer
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+class MerkleDamgardHash(ABC):
+    """
+    Defines the common logic of the hash functions built with the
+    Merkle-Damgård construction: the message is extended with a padding and
+    its length, divided into blocks, and every block is compressed together
+    with the hash values of the previous blocks.
+
+    The message can be hashed at once with hash() or incrementally through
+    an instance of this class, that compresses each block as soon as it is
+    complete and only keeps the hash values and the last partial block.
+
+    Many independent messages can also be hashed at once with hash_many(),
+    that processes them in lanes of NumPy arrays.
+
+    Concrete hash functions define the constants below, the initial hash
+    values and how a block is processed, for a single message and for lanes
+    of messages.
+    """
+
+    # size in bytes of a block of data processed in the algorithm
+    _BLOCK_SIZE_BYTES: int
+    # size in bytes of the message length
+    _MESSAGE_LENGTH_SIZE_BYTES: int
+    # size in bits of a word in the algorithm
+    _WORD_SIZE_BITS: int
+    # size in bytes of the hash value
+    _DIGEST_SIZE_BYTES: int
+    # order of the bytes of the words of the message and the hash values
+    _BYTE_ORDER: ByteOrder
+
+    # constant values used to initialize the hash values
+    _H: tuple
+
+    # name of the hash function, as in hashlib
+    name: str
+
+    # whether the compression reports its intermediate values to tracers
+    _TRACEABLE: bool = False
+
+    @classmethod
+    def hash(cls, message: bytes, backend: str | None = None,
+             tracer: Tracer | None = None) -> bytes:
+        """
+        Returns the hash value in bytes of the given message.
+
+        The hash value is computed by the given backend, or by the one
+        selected with understandingbitcoin.hash.backend, which by default is
+        the didactic implementation below. A tracer always runs the didactic
+        implementation, through a copy of the compression that reports its
+        intermediate values. The incremental hashers, and hash_many(), always
+        run the didactic implementation.
+
+        :param message: The message to be hashed.
+        :param backend: The name of the backend. By default, the current one
+        :param tracer: The tracer of the intermediate values, if any
+        :return: The hash value in bytes.
+        """
+        if tracer is not None:
+            if not cls._TRACEABLE:
+                raise ValueError(f'{cls.__name__} cannot be traced')
+
+            if backend not in (None, DIDACTIC):
+                raise ValueError('only the didactic backend can be traced')
+
+            return cls._hash_traced(message, tracer)
+
+        function: Callable | None = get_backend(backend)
+        if function is not None:
+            return function(cls, message)
+
+        # message is extended so that the total length of the message is a
+        # multiple of the block size
+        extended_message: ByteBuffer = cls._extend_message(message)
+
+        # extended message is divided into blocks
+        blocks: tuple = cls._split_extended_message(extended_message)
+
+        # hash values are initialized with the precalculated values in H
+        hash_values: list = cls._init_hash()
+
+        # each block is processed separately using a compression function, and
+        # the output of each block is used to update the hash values
+        block: ByteBuffer
+        for block in blocks:
+            cls._process_block(hash_values, block)
+
+        # final hash output is generated once all blocks of the message have
+        # been processed
+        return cls._generate_digest(hash_values)
+
+    @classmethod
+    def hash_many(cls, messages) -> list:
+        """
+        Returns the hash values in bytes of many independent messages, in the
+        same order.
+
+        Messages that need the same number of blocks once extended are hashed
+        together, each one in a lane of unsigned integer arrays, so every
+        step of the algorithm is applied to all of them at once.
+
+        :param messages: The messages to be hashed.
+        :return: The hash values in bytes.
+        """
+        messages = list(messages)
+        digests: list = [None] * len(messages)
+
+        indexes: list
+        words: np.ndarray
+        for indexes, words in cls._split_in_lanes(messages):
+            cls._store_lanes(digests, indexes, cls._hash_lanes(words))
+
+        return digests
+
+    @classmethod
+    def hash_file(cls, path: str) -> bytes:
+        """
+        Returns the hash value in bytes of the content of a file.
+
+        :param path: The path of the file
+        :return: The hash value in bytes
+        """
+        return cls.hash_file_range(path)
+
+    @classmethod
+    def hash_file_range(cls, path: str, offset: int = 0,
+                        length: int | None = None) -> bytes:
+        """
+        Returns the hash value in bytes of a range of bytes of a file.
+
+        The file is mapped in memory and its blocks are compressed directly
+        from the mapping, so the memory used does not depend on the size of
+        the file.
+
+        :param path: The path of the file
+        :param offset: The position of the first byte of the range
+        :param length: The number of bytes of the range. By default, up to
+        the end of the file
+        :return: The hash value in bytes
+        """
+        with open(path, 'rb') as file:
+            file_size: int = os.fstat(file.fileno()).st_size
+            if length is None:
+                length = file_size - offset
+
+            if offset < 0 or length < 0 or offset + length > file_size:
+                raise ValueError('the given range is out of the file')
+
+            # empty files cannot be mapped
+            if length == 0:
+                return cls.hash(b'')
+
+            # the mapping must start at a multiple of the allocation
+            # granularity
+            map_offset: int = offset - offset % mmap.ALLOCATIONGRANULARITY
+            with mmap.mmap(file.fileno(), offset + length - map_offset,
+                           access=mmap.ACCESS_READ,
+                           offset=map_offset) as mapping, \
+                    memoryview(mapping) as view:
+                hasher: MerkleDamgardHash = cls()
+                hasher.update(view[offset - map_offset:])
+                return hasher.digest()
+
+    @classmethod
+    def hash_from_midstate(cls, midstate: bytes, message: bytes,
+                           length: int) -> bytes:
+        """
+        Returns the hash value in bytes of a message whose first blocks were
+        already processed into the given midstate.
+
+        :param midstate: The hash values after the first blocks
+        :param message: The rest of the message to be hashed
+        :param length: The number of bytes processed into the midstate
+        :return: The hash value in bytes
+        """
+        hasher: MerkleDamgardHash = cls.from_midstate(midstate, length)
+        hasher.update(message)
+        return hasher.digest()
+
+    @classmethod
+    def from_midstate(cls, midstate: bytes, length: int) -> MerkleDamgardHash:
+        """
+        Returns a hasher that resumes from the hash values obtained after
+        processing the first blocks of a message.
+
+        :param midstate: The hash values after the first blocks
+        :param length: The number of bytes processed into the midstate, which
+        must be a multiple of the block size
+        :return: The hasher ready to be updated with the rest of the message
+        """
+        if len(midstate) != len(cls._H) * cls._WORD_SIZE_BITS // 8:
+            raise ValueError('the given midstate does not have the size of '
+                             + 'the hash values')
+
+        if length < 0 or length % cls._BLOCK_SIZE_BYTES != 0:
+            raise ValueError('the given length is not a multiple of the '
+                             + 'block size')
+
+        hasher: MerkleDamgardHash = cls()
+        hasher._hash_values = cls._read_words(midstate)
+        hasher._length = length
+        return hasher
+
+    def __init__(self, message: bytes = b''):
+        """
+        Constructs a hasher with the initial hash values.
+
+        :param message: The first part of the message to be hashed
+        """
+        self._hash_values: list = self._init_hash()
+        # bytes of the message not yet processed, always less than a block
+        self._pending: bytearray = bytearray()
+        # number of bytes of the message received so far
+        self._length: int = 0
+
+        self.update(message)
+
+    @property
+    def block_size(self) -> int:
+        """The size in bytes of a block of the hash function."""
+        return self._BLOCK_SIZE_BYTES
+
+    @property
+    def digest_size(self) -> int:
+        """The size in bytes of the hash value."""
+        return self._DIGEST_SIZE_BYTES
+
+    def update(self, message: bytes):
+        """
+        Hashes the next part of the message. Every complete block is
+        compressed right away, reading its words directly from the given
+        bytes, and only the remaining bytes are kept.
+
+        :param message: The next part of the message to be hashed, any
+        bytes-like object such as bytes or a memoryview
+        """
+        self._length += len(message)
+        view: memoryview = memoryview(message)
+
+        # the pending bytes are completed first with the start of the message
+        if len(self._pending) > 0:
+            num_missing: int = self._BLOCK_SIZE_BYTES - len(self._pending)
+            self._pending += view[:num_missing]
+            view = view[num_missing:]
+            if len(self._pending) < self._BLOCK_SIZE_BYTES:
+                return
+
+            self._process_words(self._hash_values,
+                                self._block_words(bytes(self._pending)))
+            self._pending.clear()
+
+        num_bytes: int = len(view) - len(view) % self._BLOCK_SIZE_BYTES
+        block_start: int
+        for block_start in range(0, num_bytes, self._BLOCK_SIZE_BYTES):
+            block_end: int = block_start + self._BLOCK_SIZE_BYTES
+            self._process_words(self._hash_values,
+                                self._block_words(view[block_start:block_end]))
+
+        self._pending += view[num_bytes:]
+
+    def digest(self) -> bytes:
+        """
+        Returns the hash value in bytes of the message received so far. The
+        hasher can still be updated afterwards.
+
+        :return: The hash value in bytes
+        """
+        return self._generate_digest(self._finalize())
+
+    def midstate(self) -> bytes:
+        """
+        Returns the hash values of the blocks processed so far, without any
+        padding, so the hashing can be resumed later with from_midstate().
+
+        :return: The hash values in bytes
+        """
+        if len(self._pending) > 0:
+            raise ValueError('the message received is not a multiple of the '
+                             + 'block size')
+
+        return self._write_words(self._hash_values)
+
+    def hexdigest(self) -> str:
+        """
+        Returns the hash value in a hexadecimal string of the message
+        received so far.
+
+        :return: The hash value in a hexadecimal string
+        """
+        return self.digest().hex()
+
+    def copy(self) -> MerkleDamgardHash:
+        """
+        Returns an independent copy of this hasher, so that a common prefix
+        of several messages only needs to be hashed once.
+
+        :return: The copy of the hasher
+        """
+        return deepcopy(self)
+
+    def _finalize(self) -> list:
+        hash_values: list = list(self._hash_values)
+
+        # the pending bytes are extended as the end of the whole message
+        extended_message: ByteBuffer = self._extend_message(self._pending,
+                                                            self._length)
+        block: ByteBuffer
+        for block in self._split_extended_message(extended_message):
+            self._process_block(hash_values, block)
+
+        return hash_values
+
+    @classmethod
+    def _process_block(cls, hash_values: list, block: ByteBuffer):
+        # block is divided into words in the byte order of the algorithm
+        num_words: int = cls._BLOCK_SIZE_BYTES * 8 // cls._WORD_SIZE_BITS
+        cls._process_words(hash_values,
+                           tuple(cls._get_word(block) for _ in range(num_words)))
+
+    @classmethod
+    @abstractmethod
+    def _process_words(cls, hash_values: list, block_words: tuple):
+        """Compresses the words of a block and updates the hash values."""
+
+    @classmethod
+    def _hash_traced(cls, message: bytes, tracer: Tracer) -> bytes:
+        # same steps as hash(), reporting the hash values after every block
+        extended_message: ByteBuffer = cls._extend_message(message)
+        hash_values: list = cls._init_hash()
+        num_words: int = cls._BLOCK_SIZE_BYTES * 8 // cls._WORD_SIZE_BITS
+
+        i: int
+        block: ByteBuffer
+        for i, block in enumerate(
+                cls._split_extended_message(extended_message)):
+            block_words: tuple = tuple(cls._get_word(block)
+                                       for _ in range(num_words))
+            cls._process_words_traced(hash_values, block_words, tracer, i)
+            tracer.block(i, tuple(hash_values))
+
+        return cls._generate_digest(hash_values)
+
+    @classmethod
+    def _process_words_traced(cls, hash_values: list, block_words: tuple,
+                              tracer: Tracer, block: int):
+        """Compresses the words of a block as _process_words(), reporting
+        the intermediate values to the tracer. Only called if _TRACEABLE."""
+
+    @classmethod
+    def _extend_message(cls, message: bytes,
+                        message_length: int | None = None) -> ByteBuffer:
+        # the length of the message can be greater than the given bytes when
+        # they are only the end of the message
+        if message_length is None:
+            message_length = len(message)
+
+        # copy the message into the buffer
+        extended_message: ByteBuffer = ByteBuffer(order=cls._BYTE_ORDER)
+        byte: int
+        for byte in message:
+            extended_message.put_byte(byte)
+
+        # padding is performed with a single bit '1' appended to the message
+        # and k bytes 0x00 so that, adding the message length, the length of
+        # the padded message becomes a multiple of the block size
+        extended_message.put_byte(0x80)
+        k: int = -(message_length
+                   + 1  # byte added previously
+                   + cls._MESSAGE_LENGTH_SIZE_BYTES) % cls._BLOCK_SIZE_BYTES
+        for _ in range(k):
+            extended_message.put_byte(0x00)
+
+        # length in bits of the message is appended at the end completing a
+        # multiple of the block size
+        length: BitStream = BitStream.from_unsigned_int(
+            message_length * 8, zfill=cls._MESSAGE_LENGTH_SIZE_BYTES * 8)
+        if cls._MESSAGE_LENGTH_SIZE_BYTES == 16:
+            extended_message.put_word128(length)
+        else:
+            extended_message.put_word64(length)
+
+        return extended_message
+
+    @classmethod
+    def _split_extended_message(cls, extended_message: ByteBuffer) -> tuple:
+        blocks: list = []
+        num_blocks: int = len(extended_message) // cls._BLOCK_SIZE_BYTES
+        for i in range(num_blocks):
+            block_start: int = i * cls._BLOCK_SIZE_BYTES
+            block_end: int = block_start + cls._BLOCK_SIZE_BYTES
+            block: ByteBuffer = extended_message[block_start:block_end]
+            blocks.append(block)
+
+        return tuple(blocks)
+
+    @classmethod
+    def _split_in_lanes(cls, messages: list):
+        # messages are grouped by the size of the extended message
+        groups: dict = {}
+        i: int
+        for i, message in enumerate(messages):
+            num_blocks: int = (len(message) + 1
+                               + cls._MESSAGE_LENGTH_SIZE_BYTES
+                               + cls._BLOCK_SIZE_BYTES - 1) \
+                // cls._BLOCK_SIZE_BYTES
+            groups.setdefault(num_blocks, []).append(i)
+
+        # NumPy is only needed to hash in lanes
+        import numpy as np  # pylint: disable=import-outside-toplevel
+
+        indexes: list
+        for indexes in groups.values():
+            extended_messages: bytes = b''.join(
+                cls._extend_message(messages[i]).bytes() for i in indexes)
+
+            # one row per word of the extended messages and one column (lane)
+            # per message, with the words in the byte order of the machine
+            words: np.ndarray = np.frombuffer(
+                extended_messages, dtype=cls._lane_dtype()) \
+                .astype(np.dtype(cls._lane_dtype()).newbyteorder('=')) \
+                .reshape(len(indexes), -1).T
+            yield indexes, words
+
+    @classmethod
+    def _hash_lanes(cls, words: np.ndarray) -> np.ndarray:
+        # NumPy is only needed to hash in lanes
+        import numpy as np  # pylint: disable=import-outside-toplevel
+
+        num_lanes: int = words.shape[1]
+        hash_values: np.ndarray = np.repeat(
+            np.array(cls._H, dtype=words.dtype)[:, None], num_lanes, axis=1)
+
+        num_words: int = cls._BLOCK_SIZE_BYTES * 8 // cls._WORD_SIZE_BITS
+        block_start: int
+        for block_start in range(0, len(words), num_words):
+            hash_values = cls._process_lanes(
+                hash_values, words[block_start:block_start + num_words])
+
+        return hash_values
+
+    @classmethod
+    @abstractmethod
+    def _process_lanes(cls, hash_values: np.ndarray,
+                       block_words: np.ndarray) -> np.ndarray:
+        """Returns the hash values updated with a block of every lane."""
+
+    @classmethod
+    def _store_lanes(cls, digests: list, indexes: list,
+                     hash_values: np.ndarray):
+        digest: np.ndarray
+        for i, digest in zip(indexes, hash_values.T.astype(cls._lane_dtype())):
+            digests[i] = digest.tobytes()[:cls._DIGEST_SIZE_BYTES]
+
+    @classmethod
+    def _lane_dtype(cls) -> str:
+        # unsigned integer of the word size in the byte order of the message
+        byte_order: str = '>' if cls._BYTE_ORDER == ByteOrder.BIG_ENDIAN \
+            else '<'
+        return f'{byte_order}u{cls._WORD_SIZE_BITS // 8}'
+
+    @classmethod
+    def _block_words(cls, block: bytes) -> tuple:
+        # words of a block read directly from any bytes-like object, in the
+        # byte order of the algorithm
+        word_size: int = cls._WORD_SIZE_BITS // 8
+        byte_order: str = 'big' if cls._BYTE_ORDER == ByteOrder.BIG_ENDIAN \
+            else 'little'
+        # pylint: disable=protected-access
+        return tuple(
+            BitStream._new(int.from_bytes(block[i:i + word_size], byte_order),
+                           cls._WORD_SIZE_BITS)
+            for i in range(0, len(block), word_size))
+
+    @classmethod
+    def _read_words(cls, data: bytes) -> list:
+        # words of the given bytes in the byte order of the algorithm
+        buffer: ByteBuffer = ByteBuffer(order=cls._BYTE_ORDER)
+        byte: int
+        for byte in data:
+            buffer.put_byte(byte)
+
+        return [cls._get_word(buffer)
+                for _ in range(len(data) * 8 // cls._WORD_SIZE_BITS)]
+
+    @classmethod
+    def _digest_padding(cls) -> tuple:
+        # padding words of a message made of a block followed by a hash
+        # value, as the inner and outer messages of HMAC when the message is
+        # a hash value itself
+        digest_size: int = cls._DIGEST_SIZE_BYTES
+        extended_message: ByteBuffer = cls._extend_message(
+            bytes(digest_size), cls._BLOCK_SIZE_BYTES + digest_size)
+        return tuple(cls._read_words(extended_message.bytes()[digest_size:]))
+
+    @classmethod
+    def _init_hash(cls) -> list:
+        init_hash = []
+        n: int
+        for n in cls._H:
+            value = BitStream.from_unsigned_int(n, cls._WORD_SIZE_BITS)
+            init_hash.append(value)
+
+        return init_hash
+
+    @classmethod
+    def _generate_digest(cls, hash_values: list) -> bytes:
+        # the hash value can be shorter than the words of the hash values
+        return cls._write_words(hash_values)[:cls._DIGEST_SIZE_BYTES]
+
+    @classmethod
+    def _write_words(cls, words: list) -> bytes:
+        # bytes of the given words in the byte order of the algorithm
+        buffer: ByteBuffer = ByteBuffer(order=cls._BYTE_ORDER)
+        word: BitStream
+        for word in words:
+            if cls._WORD_SIZE_BITS == 64:
+                buffer.put_word64(word)
+            else:
+                buffer.put_word32(word)
+
+        return buffer.bytes()
+
+    @classmethod
+    def _get_word(cls, buffer: ByteBuffer) -> BitStream:
+        # next word of the buffer with the word size of the algorithm
+        if cls._WORD_SIZE_BITS == 64:
+            return buffer.get_word64()
+
+        return buffer.get_word32()
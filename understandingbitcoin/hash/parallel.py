@@ -0,0 +1,99 @@
+"""Implements the hashing of many messages in parallel across processes."""
+from __future__ import annotations
+
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, \
+    ProcessPoolExecutor, wait
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator
+
+from understandingbitcoin.hash.sha256 import Sha256
+
+
+def hash_many(messages: Iterable,
+              function: Callable[[Any], bytes] = Sha256.hash,
+              chunk_size: int = 64, max_workers: int | None = None) -> list:
+    """
+    Returns the hash values of the given messages, in the same order, hashing
+    them in parallel in a pool of processes.
+
+    :param messages: The list or iterator of messages to be hashed, or of
+    any picklable items the function receives, such as the tuples of
+    password and salt of a key derivation
+    :param function: The hash function applied to every message. It must be
+    picklable, like Sha256.hash or Sha256.hash256
+    :param chunk_size: The number of messages sent to a process at once
+    :param max_workers: The number of processes. By default, the number of
+    processors of the machine
+    :return: The hash values of the messages
+    """
+    digests: dict = dict(hash_as_completed(messages, function, chunk_size,
+                                           max_workers))
+    return [digests[i] for i in range(len(digests))]
+
+
+def hash_as_completed(messages: Iterable,
+                      function: Callable[[Any], bytes] = Sha256.hash,
+                      chunk_size: int = 64,
+                      max_workers: int | None = None) -> Iterator[tuple]:
+    """
+    Hashes the given messages in parallel in a pool of processes and yields
+    every hash value as soon as it is available, together with the position
+    of its message.
+
+    Messages are read from the iterator as processes become free, so only a
+    few chunks per process are held in memory at any time.
+
+    :param messages: The list or iterator of messages to be hashed, or of
+    any picklable items the function receives, such as the tuples of
+    password and salt of a key derivation
+    :param function: The hash function applied to every message. It must be
+    picklable, like Sha256.hash or Sha256.hash256
+    :param chunk_size: The number of messages sent to a process at once
+    :param max_workers: The number of processes. By default, the number of
+    processors of the machine
+    :return: An iterator of tuples with the position of the message and its
+    hash value
+    """
+    if chunk_size < 1:
+        raise ValueError('the given chunk size must be greater than zero')
+
+    max_workers = max_workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers) as executor:
+        pending: set[Future] = set()
+        start: int
+        chunk: list
+        for start, chunk in _split_in_chunks(messages, chunk_size):
+            pending.add(executor.submit(_hash_chunk, function, start, chunk))
+
+            # keep the processes busy without reading all the messages
+            if len(pending) >= 2 * max_workers:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                yield from _get_results(done)
+
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            yield from _get_results(done)
+
+
+def _split_in_chunks(messages: Iterable,
+                     chunk_size: int) -> Iterator[tuple]:
+    iterator: Iterator = iter(messages)
+    start: int = 0
+    chunk: list = list(islice(iterator, chunk_size))
+    while chunk:
+        yield start, chunk
+        start += len(chunk)
+        chunk = list(islice(iterator, chunk_size))
+
+
+def _hash_chunk(function: Callable[[Any], bytes], start: int,
+                chunk: list) -> tuple:
+    return start, [function(message) for message in chunk]
+
+
+def _get_results(done: set[Future]) -> Iterator[tuple]:
+    future: Future
+    for future in done:
+        start, digests = future.result()
+        yield from enumerate(digests, start)
@@ -0,0 +1,133 @@
+"""Implements the PBKDF2 key derivation function with HMAC, used to derive
+the seeds of the wallets from the mnemonic sentences."""
+from __future__ import annotations
+
+import unicodedata
+from functools import partial
+from typing import Iterable
+
+from understandingbitcoin.hash import parallel
+from understandingbitcoin.hash.hmac import Hmac
+from understandingbitcoin.hash.sha256 import Sha256
+from understandingbitcoin.hash.sha512 import Sha512
+
+# number of iterations of PBKDF2 to derive a seed from a mnemonic sentence
+MNEMONIC_ITERATIONS: int = 2048
+
+
+def pbkdf2_hmac(password: bytes, salt: bytes, iterations: int,
+                key_length: int | None = None, algorithm=Sha256) -> bytes:
+    """
+    Returns the key derived from the given password and salt with PBKDF2,
+    using HMAC as pseudorandom function.
+
+    Every block of the key is the XOR of the MACs of a chain of iterations,
+    where each MAC authenticates the previous one. The pad blocks of the key
+    are compressed once and, since every MAC of the chain after the first
+    one is a hash value, each iteration only compresses a block with the
+    inner and the outer hash values and a fixed padding.
+
+    :param password: The password
+    :param salt: The salt
+    :param iterations: The number of iterations of every block
+    :param key_length: The size in bytes of the derived key. By default, the
+    size of the hash value
+    :param algorithm: The hash function, a subclass of MerkleDamgardHash
+    :return: The derived key
+    """
+    if iterations < 1:
+        raise ValueError('the given number of iterations must be greater '
+                         + 'than zero')
+
+    mac: Hmac = Hmac(password, algorithm)
+    key_length = key_length or mac.digest_size
+    if key_length < 1:
+        raise ValueError('the given key length must be greater than zero')
+
+    num_blocks: int = -(-key_length // mac.digest_size)
+    key: bytes = b''.join(
+        _derive_block(mac, salt + i.to_bytes(4, byteorder='big'), iterations)
+        for i in range(1, num_blocks + 1))
+    return key[:key_length]
+
+
+def pbkdf2_hmac_many(passwords_and_salts: Iterable[tuple], iterations: int,
+                     key_length: int | None = None, algorithm=Sha256,
+                     max_workers: int | None = None) -> list:
+    """
+    Returns the keys derived from every pair of password and salt, in the
+    same order, deriving them in parallel in a pool of processes.
+
+    :param passwords_and_salts: The tuples of password and salt
+    :param iterations: The number of iterations of every block
+    :param key_length: The size in bytes of the derived keys. By default,
+    the size of the hash value
+    :param algorithm: The hash function, a subclass of MerkleDamgardHash
+    :param max_workers: The number of processes. By default, the number of
+    processors of the machine
+    :return: The derived keys
+    """
+    function: partial = partial(_derive_key, iterations=iterations,
+                                key_length=key_length, algorithm=algorithm)
+    return parallel.hash_many(passwords_and_salts, function, chunk_size=1,
+                              max_workers=max_workers)
+
+
+def mnemonic_to_seed(mnemonic: str, passphrase: str = '') -> bytes:
+    """
+    Returns the 64-byte seed of a wallet derived from its mnemonic sentence
+    as defined in BIP39, with PBKDF2-HMAC-SHA512.
+
+    :param mnemonic: The mnemonic sentence
+    :param passphrase: The optional passphrase that protects the seed
+    :return: The seed
+    """
+    (password, salt) = _mnemonic_password_and_salt(mnemonic, passphrase)
+    return pbkdf2_hmac(password, salt, MNEMONIC_ITERATIONS, algorithm=Sha512)
+
+
+def mnemonics_to_seeds(mnemonics: Iterable[str], passphrase: str = '',
+                       max_workers: int | None = None) -> list:
+    """
+    Returns the seeds derived from many mnemonic sentences with the same
+    passphrase, in the same order, deriving them in parallel in a pool of
+    processes.
+
+    :param mnemonics: The mnemonic sentences
+    :param passphrase: The optional passphrase that protects the seeds
+    :param max_workers: The number of processes. By default, the number of
+    processors of the machine
+    :return: The seeds
+    """
+    return pbkdf2_hmac_many(
+        (_mnemonic_password_and_salt(mnemonic, passphrase)
+         for mnemonic in mnemonics),
+        MNEMONIC_ITERATIONS, algorithm=Sha512, max_workers=max_workers)
+
+
+def _mnemonic_password_and_salt(mnemonic: str, passphrase: str) -> tuple:
+    # both are normalized so that the same sentence always gives the same
+    # seed, whatever the way it was typed
+    password: bytes = unicodedata.normalize('NFKD', mnemonic).encode('utf-8')
+    salt: bytes = unicodedata.normalize('NFKD', 'mnemonic' + passphrase) \
+        .encode('utf-8')
+    return password, salt
+
+
+def _derive_key(password_and_salt: tuple, iterations: int,
+                key_length: int | None, algorithm) -> bytes:
+    (password, salt) = password_and_salt
+    return pbkdf2_hmac(password, salt, iterations, key_length, algorithm)
+
+
+def _derive_block(mac: Hmac, message: bytes, iterations: int) -> bytes:
+    # pylint: disable=protected-access
+    # the first MAC authenticates the salt and the block index, and the rest
+    # are kept as words across the iterations
+    words: list = mac.algorithm._read_words(mac.digest(message))
+    block: list = list(words)
+    for _ in range(iterations - 1):
+        words = mac._digest_words(words)
+        block = [value ^ word for value, word in zip(block, words)]
+
+    return mac.algorithm._generate_digest(block)
@@ -0,0 +1,275 @@
+"""Implements the RIPEMD-160 hash function."""
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+from understandingbitcoin.common.bit import BitStream
+from understandingbitcoin.common.byte import ByteOrder
+from understandingbitcoin.hash.backend import get_backend
+from understandingbitcoin.hash.merkle_damgard import MerkleDamgardHash
+from understandingbitcoin.hash.sha256 import Sha256
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+class Ripemd160(MerkleDamgardHash):
+    """
+    RIPEMD-160 is a cryptographic hash function that generates a 160-bit
+    (20-byte) hash value. Bitcoin uses it together with SHA-256 to derive the
+    addresses from the public keys.
+
+    Unlike SHA-256, the words of the blocks, the message length and the hash
+    values are little-endian, and every block is compressed in two parallel
+    lines of 80 steps whose results are combined at the end.
+    """
+
+    # name of the hash function, as in hashlib
+    name: str = 'ripemd160'
+
+    # size in bytes of a block of data processed in the algorithm
+    _BLOCK_SIZE_BYTES: int = 64  # 512 bits
+    # size in bytes of the message length
+    _MESSAGE_LENGTH_SIZE_BYTES: int = 8  # 64 bits
+    # size in bits of a word in the algorithm
+    _WORD_SIZE_BITS: int = 32  # 4 bytes
+    # size in bytes of the hash value
+    _DIGEST_SIZE_BYTES: int = 20  # 160 bits
+    # order of the bytes of the words of the message and the hash values
+    _BYTE_ORDER: ByteOrder = ByteOrder.LITTLE_ENDIAN
+
+    # constant values used to initialize the five 32-bit registers required
+    # in the hashing process
+    _H: tuple[5] = (0x67452301, 0xefcdab89, 0x98badcfe, 0x10325476, 0xc3d2e1f0)
+
+    # index of the two parallel lines of steps in the constants below
+    _LEFT: int = 0
+    _RIGHT: int = 1
+
+    # constant values added in each group of 16 steps of the left and the
+    # right lines
+    _K: tuple[2] = tuple(
+        tuple(BitStream.from_unsigned_int(n, zfill=32) for n in line) for line
+        in ((0x00000000, 0x5a827999, 0x6ed9eba1, 0x8f1bbcdc, 0xa953fd4e),
+            (0x50a28be6, 0x5c4dd124, 0x6d703ef3, 0x7a6d76e9, 0x00000000)))
+
+    # index of the word of the block selected in each step of the left and
+    # the right lines
+    _R: tuple[2] = ((
+        0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15,
+        7, 4, 13, 1, 10, 6, 15, 3, 12, 0, 9, 5, 2, 14, 11, 8,
+        3, 10, 14, 4, 9, 15, 8, 1, 2, 7, 0, 6, 13, 11, 5, 12,
+        1, 9, 11, 10, 0, 8, 12, 4, 13, 3, 7, 15, 14, 5, 6, 2,
+        4, 0, 5, 9, 7, 12, 2, 10, 14, 1, 3, 8, 11, 6, 15, 13), (
+        5, 14, 7, 0, 9, 2, 11, 4, 13, 6, 15, 8, 1, 10, 3, 12,
+        6, 11, 3, 7, 0, 13, 5, 10, 14, 15, 8, 12, 4, 9, 1, 2,
+        15, 5, 1, 3, 7, 14, 6, 9, 11, 8, 12, 2, 10, 0, 4, 13,
+        8, 6, 4, 1, 3, 11, 15, 0, 5, 12, 2, 13, 9, 7, 10, 14,
+        12, 15, 10, 4, 1, 5, 8, 7, 6, 2, 13, 14, 0, 3, 9, 11))
+
+    # number of left rotations applied in each step of the left and the right
+    # lines
+    _S: tuple[2] = ((
+        11, 14, 15, 12, 5, 8, 7, 9, 11, 13, 14, 15, 6, 7, 9, 8,
+        7, 6, 8, 13, 11, 9, 7, 15, 7, 12, 15, 9, 11, 7, 13, 12,
+        11, 13, 6, 7, 14, 9, 13, 15, 14, 8, 13, 6, 5, 12, 7, 5,
+        11, 12, 14, 15, 14, 15, 9, 8, 9, 14, 5, 6, 8, 6, 5, 12,
+        9, 15, 5, 11, 6, 8, 13, 12, 5, 12, 13, 14, 11, 8, 5, 6), (
+        8, 9, 9, 11, 13, 15, 15, 5, 7, 7, 8, 11, 14, 14, 12, 6,
+        9, 13, 15, 7, 12, 8, 9, 11, 7, 7, 12, 7, 6, 15, 13, 11,
+        9, 7, 15, 11, 8, 6, 6, 14, 12, 13, 5, 14, 13, 13, 7, 5,
+        15, 5, 8, 11, 14, 14, 6, 14, 6, 9, 12, 9, 12, 5, 15, 8,
+        8, 5, 12, 9, 12, 5, 14, 6, 8, 13, 6, 5, 15, 13, 11, 11))
+
+    # padding of a 256-bit message, that is, the eight 32-bit little-endian
+    # words that complete a single block when a SHA-256 hash value is hashed:
+    # the bit '1' appended to the message, zeros and the message length in
+    # bits
+    _DIGEST_PADDING: tuple[8] = tuple(
+        BitStream.from_unsigned_int(n, zfill=32) for n in (
+            0x00000080, 0, 0, 0, 0, 0, 256, 0))
+
+    @classmethod
+    def hash160(cls, message: bytes) -> bytes:
+        """
+        Returns the HASH160 value in bytes, RIPEMD-160(SHA-256(x)), used to
+        derive the addresses from the public keys.
+
+        The SHA-256 hash values are compressed directly as the words of a
+        single block, in little-endian order, with a precomputed padding.
+        With a backend other than the didactic one, both hashes are computed
+        by the backend instead.
+
+        :param message: The message to be hashed.
+        :return: The HASH160 value in bytes.
+        """
+        if get_backend() is not None:
+            return cls.hash(Sha256.hash(message))
+
+        # pylint: disable=protected-access
+        sha256_values: list[8] = Sha256(message)._finalize()
+
+        # the big-endian words of SHA-256 are read in little-endian order
+        words: tuple[16] = tuple(value.reverse_bytes()
+                                 for value in sha256_values) \
+            + cls._DIGEST_PADDING
+
+        hash_values: list[5] = cls._init_hash()
+        cls._process_words(hash_values, words)
+        return cls._generate_digest(hash_values)
+
+    @classmethod
+    def hash160_many(cls, messages) -> list:
+        """
+        Returns the HASH160 values in bytes of many independent messages, in
+        the same order.
+
+        Both hash functions are applied in lanes of NumPy arrays and the
+        SHA-256 hash values of every lane become the words of the RIPEMD-160
+        block without leaving the arrays.
+
+        :param messages: The messages to be hashed.
+        :return: The HASH160 values in bytes.
+        """
+        # pylint: disable=protected-access
+        # NumPy is only needed to hash in lanes
+        import numpy as np  # pylint: disable=import-outside-toplevel
+
+        messages = list(messages)
+        digests: list = [None] * len(messages)
+
+        padding: np.ndarray = np.array(
+            [int(word) for word in cls._DIGEST_PADDING], dtype=np.uint32)
+
+        indexes: list
+        words: np.ndarray
+        for indexes, words in Sha256._split_in_lanes(messages):
+            sha256_values: np.ndarray = Sha256._hash_lanes(words)
+
+            # the big-endian words of SHA-256 are read in little-endian order
+            block_words: np.ndarray = np.concatenate((
+                sha256_values.byteswap(),
+                np.repeat(padding[:, None], len(indexes), axis=1)))
+
+            cls._store_lanes(digests, indexes, cls._hash_lanes(block_words))
+
+        return digests
+
+    @classmethod
+    def _process_words(cls, hash_values: list[5], block_words: tuple[16]):
+        # words are processed through the two lines of steps
+        left_output: tuple[5] = cls._compress_words(hash_values, block_words,
+                                                    cls._LEFT)
+        right_output: tuple[5] = cls._compress_words(hash_values, block_words,
+                                                     cls._RIGHT)
+
+        # hash values are updated combining the output of both lines
+        cls._update_hash(hash_values, left_output, right_output)
+
+    @classmethod
+    def _compress_words(cls, hash_values: list[5], words: tuple[16],
+                        line: int) -> tuple[5]:
+        # unpack and copy current hash values
+        (a, b, c, d, e) = hash_values
+        (r, s, k) = (cls._R[line], cls._S[line], cls._K[line])
+
+        # compresses the block in a loop of 80 steps, both lines use the same
+        # nonlinear functions but in opposite order
+        for j in range(80):
+            function_index: int = j if line == cls._LEFT else 79 - j
+            t = (a + cls._f(function_index, b, c, d) + words[r[j]]
+                 + k[j // 16]).mod(cls._WORD_SIZE_BITS)
+            t = (t.rotate_left(s[j]) + e).mod(cls._WORD_SIZE_BITS)
+            a = e
+            e = d
+            d = c.rotate_left(10)
+            c = b
+            b = t
+
+        return a, b, c, d, e
+
+    @classmethod
+    def _process_lanes(cls, hash_values: np.ndarray,
+                       block_words: np.ndarray) -> np.ndarray:
+        # NumPy is only needed to hash in lanes
+        import numpy as np  # pylint: disable=import-outside-toplevel
+
+        # same steps as for a single block, where every word is an array
+        # with a lane per message and additions wrap around modulo 2^32
+        (a, b, c, d, e) = cls._compress_lanes(hash_values, block_words,
+                                              cls._LEFT)
+        (a_, b_, c_, d_, e_) = cls._compress_lanes(hash_values, block_words,
+                                                   cls._RIGHT)
+
+        return np.stack((hash_values[1] + c + d_, hash_values[2] + d + e_,
+                         hash_values[3] + e + a_, hash_values[4] + a + b_,
+                         hash_values[0] + b + c_))
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _constant_lanes(cls, line: int) -> np.ndarray:
+        # the constants of a line in the type of the lanes, built once
+        # NumPy is only needed to hash in lanes
+        import numpy as np  # pylint: disable=import-outside-toplevel
+
+        return np.array([int(n) for n in cls._K[line]], dtype=np.uint32)
+
+    @classmethod
+    def _compress_lanes(cls, hash_values: np.ndarray, words: np.ndarray,
+                        line: int) -> tuple[5]:
+        (a, b, c, d, e) = hash_values
+        (r, s) = (cls._R[line], cls._S[line])
+        k: np.ndarray = cls._constant_lanes(line)
+
+        for j in range(80):
+            function_index: int = j if line == cls._LEFT else 79 - j
+            t = cls._rotate_left_lanes(
+                a + cls._f(function_index, b, c, d) + words[r[j]]
+                + k[j // 16], s[j]) + e
+            a = e
+            e = d
+            d = cls._rotate_left_lanes(c, 10)
+            c = b
+            b = t
+
+        return a, b, c, d, e
+
+    @staticmethod
+    def _rotate_left_lanes(x: np.ndarray, shifts: int) -> np.ndarray:
+        # the shifts are given in the unsigned type of the lanes
+        word = x.dtype.type
+        return (x << word(shifts)) | (x >> word(32 - shifts))
+
+    @staticmethod
+    def _f(j: int, x: BitStream, y: BitStream, z: BitStream) -> BitStream:
+        # the operators are the same for binary sequences and for arrays of
+        # lanes
+        if j < 16:
+            return x ^ y ^ z
+
+        if j < 32:
+            return (x & y) | (~x & z)
+
+        if j < 48:
+            return (x | ~y) ^ z
+
+        if j < 64:
+            return (x & z) | (y & ~z)
+
+        return x ^ (y | ~z)
+
+    @classmethod
+    def _update_hash(cls, hash_values: list[5], left_output: tuple[5],
+                     right_output: tuple[5]):
+        (a, b, c, d, e) = left_output
+        (a_, b_, c_, d_, e_) = right_output
+
+        # update hash values combining each value with the outputs of both
+        # lines in a rotated order
+        t = (hash_values[1] + c + d_).mod(cls._WORD_SIZE_BITS)
+        hash_values[1] = (hash_values[2] + d + e_).mod(cls._WORD_SIZE_BITS)
+        hash_values[2] = (hash_values[3] + e + a_).mod(cls._WORD_SIZE_BITS)
+        hash_values[3] = (hash_values[4] + a + b_).mod(cls._WORD_SIZE_BITS)
+        hash_values[4] = (hash_values[0] + b + c_).mod(cls._WORD_SIZE_BITS)
+        hash_values[0] = t
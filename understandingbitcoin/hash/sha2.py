@@ -0,0 +1,247 @@
+"""Implements the compression shared by the hash functions of the SHA-2
+family."""
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+from understandingbitcoin.common.bit import BitStream
+from understandingbitcoin.common.byte import ByteOrder
+from understandingbitcoin.hash.merkle_damgard import MerkleDamgardHash
+from understandingbitcoin.hash.trace import Tracer
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+class Sha2(MerkleDamgardHash):
+    """
+    Defines the compression of the SHA-2 hash functions. All of them follow
+    the same steps with eight hash values and differ in the word size, the
+    number of rounds, the constants and the rotation amounts of the σ and Σ
+    functions, defined by every concrete hash function.
+
+    The same steps apply to words of any size, both for BitStream words and
+    for lanes of NumPy arrays.
+    """
+
+    # order of the bytes of the words of the message and the hash values
+    _BYTE_ORDER: ByteOrder = ByteOrder.BIG_ENDIAN
+
+    # whether the compression reports its intermediate values to tracers
+    _TRACEABLE: bool = True
+
+    # number of rounds of the compression
+    _ROUNDS: int
+    # constants values used in addition to nonlinear functions in the
+    # compression step to mix the processed data in a different way
+    _K: tuple
+
+    # rotation and shift amounts of the σ0 and σ1 functions, used to expand
+    # the words of the block
+    _σ0_SHIFTS: tuple[3]
+    _σ1_SHIFTS: tuple[3]
+    # rotation amounts of the Σ0 and Σ1 functions, used in the rounds
+    _Σ0_SHIFTS: tuple[3]
+    _Σ1_SHIFTS: tuple[3]
+
+    @classmethod
+    def _process_words(cls, hash_values: list[8], block_words: tuple[16]):
+        # the 16 words of the block are expanded to a word per round
+        words: tuple = cls._expand_words(block_words)
+
+        # words are processed through a series of rounds
+        block_output: tuple[8] = cls._compress_words(hash_values, words)
+
+        # hash values are updated using the output of each block
+        cls._update_hash(hash_values, block_output)
+
+    @classmethod
+    def _expand_words(cls, block_words: tuple[16]) -> tuple:
+        # create an entry per round with the 16 words of the block first
+        words: list = list(block_words) + [None] * (cls._ROUNDS - 16)
+
+        # the rest w[16..] expand the first 16 words
+        for i in range(16, cls._ROUNDS):
+            words[i] = (words[i - 16] + cls._σ0(words[i - 15]) + words[i - 7]
+                        + cls._σ1(words[i - 2])).mod(cls._WORD_SIZE_BITS)
+
+        return tuple(words)
+
+    @classmethod
+    def _compress_words(cls, hash_values: list[8], words: tuple) -> tuple:
+        # unpack and copy current hash values
+        (a, b, c, d, e, f, g, h) = hash_values
+
+        # compresses the chunk in a loop of a round per word
+        for i in range(cls._ROUNDS):
+            t1 = h + cls._Σ1(e) + cls._choice(e, f, g) + cls._K[i] + words[i]
+            t2 = cls._Σ0(a) + cls._majority(a, b, c)
+            h = g
+            g = f
+            f = e
+            e = (d + t1).mod(cls._WORD_SIZE_BITS)
+            d = c
+            c = b
+            b = a
+            a = (t1 + t2).mod(cls._WORD_SIZE_BITS)
+
+        return a, b, c, d, e, f, g, h
+
+    @classmethod
+    def _process_words_traced(cls, hash_values: list[8],
+                              block_words: tuple[16], tracer: Tracer,
+                              block: int):
+        words: tuple = cls._expand_words(block_words)
+        tracer.schedule(block, words)
+        cls._update_hash(hash_values,
+                         cls._compress_words_traced(hash_values, words,
+                                                    tracer, block))
+
+    @classmethod
+    def _compress_words_traced(cls, hash_values: list[8], words: tuple,
+                               tracer: Tracer, block: int) -> tuple:
+        # copy of _compress_words that reports the registers of every round,
+        # so the loop without a tracer has no calls to it
+        registers: tuple[8] = tuple(hash_values)
+
+        i: int
+        for i in range(cls._ROUNDS):
+            registers = cls._compress_round(registers, cls._K[i], words[i])
+            tracer.round(block, i, registers)
+
+        return registers
+
+    @classmethod
+    def _compress_round(cls, registers: tuple[8], k: BitStream,
+                        word: BitStream) -> tuple[8]:
+        # a round of _compress_words on its own, for the traced loop
+        (a, b, c, d, e, f, g, h) = registers
+        t1 = h + cls._Σ1(e) + cls._choice(e, f, g) + k + word
+        t2 = cls._Σ0(a) + cls._majority(a, b, c)
+        return ((t1 + t2).mod(cls._WORD_SIZE_BITS), a, b, c,
+                (d + t1).mod(cls._WORD_SIZE_BITS), e, f, g)
+
+    @classmethod
+    def _process_lanes(cls, hash_values: np.ndarray,
+                       block_words: np.ndarray) -> np.ndarray:
+        # same steps as for a single block, where every word is an array
+        # with a lane per message and additions wrap around modulo the word
+        # size
+        # NumPy is only needed to hash in lanes
+        import numpy as np  # pylint: disable=import-outside-toplevel
+
+        words: list = cls._expand_lanes(block_words)
+        return hash_values + np.stack(cls._compress_lanes(hash_values, words))
+
+    @classmethod
+    def _expand_lanes(cls, block_words: np.ndarray) -> list:
+        words: list = list(block_words)
+        i: int
+        for i in range(16, cls._ROUNDS):
+            words.append(words[i - 16] + cls._σ0_lanes(words[i - 15])
+                         + words[i - 7] + cls._σ1_lanes(words[i - 2]))
+
+        return words
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _constant_lanes(cls, dtype: np.dtype) -> np.ndarray:
+        # the constants in the type of the lanes, built once per hash function
+        # NumPy is only needed to hash in lanes
+        import numpy as np  # pylint: disable=import-outside-toplevel
+
+        return np.array(cls._K, dtype=dtype)
+
+    @classmethod
+    def _compress_lanes(cls, hash_values: np.ndarray,
+                        words: list) -> tuple[8]:
+        k: np.ndarray = cls._constant_lanes(hash_values.dtype)
+        (a, b, c, d, e, f, g, h) = hash_values
+
+        i: int
+        for i in range(cls._ROUNDS):
+            t1 = h + cls._Σ1_lanes(e) + ((e & f) ^ (~e & g)) + k[i] + words[i]
+            t2 = cls._Σ0_lanes(a) + ((a & b) ^ (a & c) ^ (b & c))
+            h = g
+            g = f
+            f = e
+            e = d + t1
+            d = c
+            c = b
+            b = a
+            a = t1 + t2
+
+        return a, b, c, d, e, f, g, h
+
+    @staticmethod
+    def _rotate_right_lanes(x: np.ndarray, shifts: int) -> np.ndarray:
+        # the shifts are given in the unsigned type of the lanes
+        word = x.dtype.type
+        return (x >> word(shifts)) | (x << word(x.dtype.itemsize * 8 - shifts))
+
+    @classmethod
+    def _σ0_lanes(cls, x: np.ndarray) -> np.ndarray:
+        (r1, r2, s) = cls._σ0_SHIFTS
+        return cls._rotate_right_lanes(x, r1) \
+            ^ cls._rotate_right_lanes(x, r2) ^ (x >> x.dtype.type(s))
+
+    @classmethod
+    def _σ1_lanes(cls, x: np.ndarray) -> np.ndarray:
+        (r1, r2, s) = cls._σ1_SHIFTS
+        return cls._rotate_right_lanes(x, r1) \
+            ^ cls._rotate_right_lanes(x, r2) ^ (x >> x.dtype.type(s))
+
+    @classmethod
+    def _Σ0_lanes(cls, x: np.ndarray) -> np.ndarray:
+        (r1, r2, r3) = cls._Σ0_SHIFTS
+        return cls._rotate_right_lanes(x, r1) \
+            ^ cls._rotate_right_lanes(x, r2) ^ cls._rotate_right_lanes(x, r3)
+
+    @classmethod
+    def _Σ1_lanes(cls, x: np.ndarray) -> np.ndarray:
+        (r1, r2, r3) = cls._Σ1_SHIFTS
+        return cls._rotate_right_lanes(x, r1) \
+            ^ cls._rotate_right_lanes(x, r2) ^ cls._rotate_right_lanes(x, r3)
+
+    @classmethod
+    def _σ0(cls, x: BitStream) -> BitStream:
+        (r1, r2, s) = cls._σ0_SHIFTS
+        return x.rotate_right(r1) ^ x.rotate_right(r2) ^ x >> s
+
+    @classmethod
+    def _σ1(cls, x: BitStream) -> BitStream:
+        (r1, r2, s) = cls._σ1_SHIFTS
+        return x.rotate_right(r1) ^ x.rotate_right(r2) ^ x >> s
+
+    @classmethod
+    def _Σ0(cls, x: BitStream) -> BitStream:
+        (r1, r2, r3) = cls._Σ0_SHIFTS
+        return x.rotate_right(r1) ^ x.rotate_right(r2) ^ x.rotate_right(r3)
+
+    @classmethod
+    def _Σ1(cls, x: BitStream) -> BitStream:
+        (r1, r2, r3) = cls._Σ1_SHIFTS
+        return x.rotate_right(r1) ^ x.rotate_right(r2) ^ x.rotate_right(r3)
+
+    @staticmethod
+    def _choice(x: BitStream, y: BitStream, z: BitStream) -> BitStream:
+        return (x & y) ^ (~x & z)
+
+    @staticmethod
+    def _majority(x: BitStream, y: BitStream, z: BitStream) -> BitStream:
+        return (x & y) ^ (x & z) ^ (y & z)
+
+    @classmethod
+    def _update_hash(cls, hash_values: list[8], block_output: tuple):
+        (a, b, c, d, e, f, g, h) = block_output
+
+        # update hash values with the compressed chuck
+        hash_values[0] = (hash_values[0] + a).mod(cls._WORD_SIZE_BITS)
+        hash_values[1] = (hash_values[1] + b).mod(cls._WORD_SIZE_BITS)
+        hash_values[2] = (hash_values[2] + c).mod(cls._WORD_SIZE_BITS)
+        hash_values[3] = (hash_values[3] + d).mod(cls._WORD_SIZE_BITS)
+        hash_values[4] = (hash_values[4] + e).mod(cls._WORD_SIZE_BITS)
+        hash_values[5] = (hash_values[5] + f).mod(cls._WORD_SIZE_BITS)
+        hash_values[6] = (hash_values[6] + g).mod(cls._WORD_SIZE_BITS)
+        hash_values[7] = (hash_values[7] + h).mod(cls._WORD_SIZE_BITS)
@@ -0,0 +1,29 @@
+"""Implements the SHA-224 hash function."""
+from understandingbitcoin.common.bit import BitStream
+from understandingbitcoin.hash.sha256 import Sha256
+
+
+class Sha224(Sha256):
+    """
+    SHA-224 is the SHA-256 hash function with different initial hash values
+    and a hash value truncated to 224 bits (28 bytes).
+    """
+
+    # name of the hash function, as in hashlib
+    name: str = 'sha224'
+
+    # size in bytes of the hash value
+    _DIGEST_SIZE_BYTES: int = 28  # 224 bits
+
+    # constant values used to initialize the eight 32-bit registers required
+    # in the hashing process
+    _H: tuple[8] = (
+        0xc1059ed8, 0x367cd507, 0x3070dd17, 0xf70e5939, 0xffc00b31, 0x68581511,
+        0x64f98fa7, 0xbefa4fa4)
+
+    # padding of a 224-bit message, that is, the nine 32-bit words that
+    # complete a single block when a hash value is hashed again: the bit '1'
+    # appended to the message, zeros and the message length in bits
+    _DIGEST_PADDING: tuple[9] = tuple(
+        BitStream.from_unsigned_int(n, zfill=32) for n in (
+            0x80000000, 0, 0, 0, 0, 0, 0, 0, 224))
@@ -1,21 +1,31 @@
 """Implements the SHA-256 hash function."""
+from __future__ import annotations
+
 from understandingbitcoin.common.bit import BitStream
-from understandingbitcoin.common.byte import ByteBuffer, ByteOrder
+from understandingbitcoin.hash.backend import get_backend
+from understandingbitcoin.hash.sha2 import Sha2
 
 
-class Sha256:
+class Sha256(Sha2):
     """
     SHA-256 is a cryptographic hash function that generates a 256-bit
     (32-byte) hash value and is used for digital signatures, data integrity
     checks, and password hashing.
     """
 
+    # name of the hash function, as in hashlib
+    name: str = 'sha256'
+
     # size in bytes of a block of data processed in the algorithm
     _BLOCK_SIZE_BYTES: int = 64  # 512 bits
     # size in bytes of the message length
     _MESSAGE_LENGTH_SIZE_BYTES: int = 8  # 64 bits
     # size in bits of a word in the algorithm
     _WORD_SIZE_BITS: int = 32  # 4 bytes
+    # size in bytes of the hash value
+    _DIGEST_SIZE_BYTES: int = 32  # 256 bits
+    # number of rounds of the compression
+    _ROUNDS: int = 64
 
     # constant values used to initialize the eight 32-bit registers required
     # in the hashing process
@@ -38,172 +48,61 @@ class Sha256:
         0x5b9cca4f, 0x682e6ff3, 0x748f82ee, 0x78a5636f, 0x84c87814, 0x8cc70208,
         0x90befffa, 0xa4506ceb, 0xbef9a3f7, 0xc67178f2)
 
-    @classmethod
-    def hash(cls, message: bytes) -> bytes:
-        """
-        Returns a 256-bit (32-byte) hash value in bytes using the SHA-256
-        algorithm for the given message.
-
-        :param message: The message to be hashed.
-        :return: The SHA-256 hash value in bytes.
-        """
-        # message is extended so that the total length of the message is a
-        # multiple of 512 bits
-        extended_message: ByteBuffer = cls._extend_message(message)
-
-        # extended message is divided into blocks of 512 bits
-        blocks: tuple = cls._split_extended_message(extended_message)
-
-        # hash values are initialized with the precalculated values in H
-        hash_values: list[8] = cls._init_hash()
-
-        # each block is processed separately using a compression function, and
-        # the output of each block is used to update the hash values
-        block: ByteBuffer
-        for block in blocks:
-            # block is divided into 16 32-bit words and expanded to 64 32-bit
-            # words
-            words: tuple[64] = cls._expand_block(block)
-
-            # words are processed through a series of rounds
-            block_output: tuple[8] = cls._compress_words(hash_values, words)
-
-            # hash values are updated using the output of each block
-            cls._update_hash(hash_values, block_output)
+    # rotation and shift amounts of the σ and Σ functions
+    _σ0_SHIFTS: tuple[3] = (7, 18, 3)
+    _σ1_SHIFTS: tuple[3] = (17, 19, 10)
+    _Σ0_SHIFTS: tuple[3] = (2, 13, 22)
+    _Σ1_SHIFTS: tuple[3] = (6, 11, 25)
 
-        # final hash output is generated once all blocks of the message have
-        # been processed
-        return cls._generate_digest(hash_values)
+    # padding of a 256-bit message, that is, the eight 32-bit words that
+    # complete a single block when a hash value is hashed again: the bit '1'
+    # appended to the message, zeros and the message length in bits
+    _DIGEST_PADDING: tuple[8] = tuple(
+        BitStream.from_unsigned_int(n, zfill=32) for n in (
+            0x80000000, 0, 0, 0, 0, 0, 0, 256))
 
     @classmethod
-    def _extend_message(cls, message: bytes) -> ByteBuffer:
-        # copy the message into the buffer
-        extended_message: ByteBuffer = ByteBuffer(order=ByteOrder.BIG_ENDIAN)
-        byte: int
-        for byte in message:
-            extended_message.put_byte(byte)
-
-        # padding is performed with a single bit '1' appended to the message
-        # and k bytes 0x00 so that the length in bits of the padded message
-        # becomes congruent to 448, modulo 512
-        extended_message.put_byte(0x80)
-        k: int = cls._BLOCK_SIZE_BYTES - ((len(message)
-                                           + 1  # byte added previously
-                                           + cls._MESSAGE_LENGTH_SIZE_BYTES)
-                                          % cls._BLOCK_SIZE_BYTES)
-        for _ in range(k):
-            extended_message.put_byte(0x00)
-
-        # length in bits of the message represented in 64-bit is appended at
-        # the end completing a multiple of 512 bits
-        message_length = BitStream.from_unsigned_int(len(message) * 8,
-                                                     zfill=64)
-        extended_message.put_word64(message_length)
-
-        return extended_message
-
-    @classmethod
-    def _split_extended_message(cls, extended_message: ByteBuffer) -> tuple:
-        blocks: list = []
-        num_blocks: int = len(extended_message) // cls._BLOCK_SIZE_BYTES
-        for i in range(num_blocks):
-            block_start: int = i * cls._BLOCK_SIZE_BYTES
-            block_end: int = block_start + cls._BLOCK_SIZE_BYTES
-            block: ByteBuffer = extended_message[block_start:block_end]
-            blocks.append(block)
+    def hash256(cls, message: bytes) -> bytes:
+        """
+        Returns the double SHA-256 hash value in bytes, SHA-256(SHA-256(x)),
+        used for transaction ids, block hashes and Merkle tree nodes.
 
-        return tuple(blocks)
+        The hash values of the first hash are compressed again directly as
+        the words of a single block with a precomputed padding. With a
+        backend other than the didactic one, both hashes are computed by the
+        backend instead.
 
-    @classmethod
-    def _init_hash(cls) -> list[8]:
-        init_hash = []
-        n: int
-        for n in cls._H:
-            value = BitStream.from_unsigned_int(n, cls._WORD_SIZE_BITS)
-            init_hash.append(value)
+        :param message: The message to be hashed.
+        :return: The double SHA-256 hash value in bytes.
+        """
+        if get_backend() is not None:
+            return cls.hash(cls.hash(message))
 
-        return init_hash
+        hash_values: list[8] = cls(message)._finalize()
+        return cls._generate_digest(cls._rehash(hash_values))
 
     @classmethod
-    def _expand_block(cls, block: ByteBuffer) -> tuple[64]:
-        # create a 64 entry list
-        words: list[64] = [None] * 64
-
-        # w[0..15] is a copy of the block
-        i: int
-        for i in range(16):
-            words[i] = block.get_word32()
-
-        # the rest w[16..63] expand the first 16 words to complete the 48 words
-        for i in range(16, 64):
-            words[i] = (words[i - 16] + cls._σ0(words[i - 15]) + words[i - 7]
-                        + cls._σ1(words[i - 2])).mod(cls._WORD_SIZE_BITS)
-
-        return tuple(words)
+    def hash256_from_midstate(cls, midstate: bytes, message: bytes,
+                              length: int) -> bytes:
+        """
+        Returns the double SHA-256 hash value in bytes of a message whose
+        first blocks were already processed into the given midstate.
 
-    @classmethod
-    def _compress_words(cls, hash_values: list[8], words: tuple[64]) -> tuple:
-        # unpack and copy current hash values
-        (a, b, c, d, e, f, g, h) = hash_values
-
-        # compresses the chunk in a loop of 64 iterations
-        for i in range(64):
-            t1 = h + cls._Σ1(e) + cls._choice(e, f, g) + cls._K[i] + words[i]
-            t2 = cls._Σ0(a) + cls._majority(a, b, c)
-            h = g
-            g = f
-            f = e
-            e = (d + t1).mod(cls._WORD_SIZE_BITS)
-            d = c
-            c = b
-            b = a
-            a = (t1 + t2).mod(cls._WORD_SIZE_BITS)
-
-        return a, b, c, d, e, f, g, h
-
-    @staticmethod
-    def _σ0(x: BitStream) -> BitStream:
-        return x.rotate_right(7) ^ x.rotate_right(18) ^ x >> 3
-
-    @staticmethod
-    def _σ1(x: BitStream) -> BitStream:
-        return x.rotate_right(17) ^ x.rotate_right(19) ^ x >> 10
-
-    @staticmethod
-    def _Σ0(x: BitStream) -> BitStream:
-        return x.rotate_right(2) ^ x.rotate_right(13) ^ x.rotate_right(22)
-
-    @staticmethod
-    def _Σ1(x: BitStream) -> BitStream:
-        return x.rotate_right(6) ^ x.rotate_right(11) ^ x.rotate_right(25)
-
-    @staticmethod
-    def _choice(x: BitStream, y: BitStream, z: BitStream) -> BitStream:
-        return (x & y) ^ (~x & z)
-
-    @staticmethod
-    def _majority(x: BitStream, y: BitStream, z: BitStream) -> BitStream:
-        return (x & y) ^ (x & z) ^ (y & z)
+        :param midstate: The 32-byte hash values after the first blocks
+        :param message: The rest of the message to be hashed
+        :param length: The number of bytes processed into the midstate
+        :return: The double SHA-256 hash value in bytes
+        """
+        hasher: Sha256 = cls.from_midstate(midstate, length)
+        hasher.update(message)
+        return cls._generate_digest(cls._rehash(hasher._finalize()))
 
     @classmethod
-    def _update_hash(cls, hash_values: list[8], block_output: tuple):
-        (a, b, c, d, e, f, g, h) = block_output
-
-        # update hash values with the compressed chuck
-        hash_values[0] = (hash_values[0] + a).mod(cls._WORD_SIZE_BITS)
-        hash_values[1] = (hash_values[1] + b).mod(cls._WORD_SIZE_BITS)
-        hash_values[2] = (hash_values[2] + c).mod(cls._WORD_SIZE_BITS)
-        hash_values[3] = (hash_values[3] + d).mod(cls._WORD_SIZE_BITS)
-        hash_values[4] = (hash_values[4] + e).mod(cls._WORD_SIZE_BITS)
-        hash_values[5] = (hash_values[5] + f).mod(cls._WORD_SIZE_BITS)
-        hash_values[6] = (hash_values[6] + g).mod(cls._WORD_SIZE_BITS)
-        hash_values[7] = (hash_values[7] + h).mod(cls._WORD_SIZE_BITS)
-
-    @staticmethod
-    def _generate_digest(hash_values: list[8]) -> bytes:
-        digest: ByteBuffer = ByteBuffer(order=ByteOrder.BIG_ENDIAN)
-        value: BitStream
-        for value in hash_values:
-            digest.put_word32(value)
-
-        return digest.bytes()
+    def _rehash(cls, hash_values: list[8]) -> list[8]:
+        # the words of the hash value are the first words of the only block
+        # to compress, the rest of the block is always the same padding
+        num_words: int = cls._DIGEST_SIZE_BYTES * 8 // cls._WORD_SIZE_BITS
+        rehash_values: list[8] = cls._init_hash()
+        cls._process_words(rehash_values, tuple(hash_values[:num_words])
+                           + cls._DIGEST_PADDING)
+        return rehash_values
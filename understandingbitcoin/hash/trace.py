@@ -0,0 +1,96 @@
+"""Implements the tracers that receive the intermediate values of the
+compression of the hash functions, to follow how a message is hashed."""
+from __future__ import annotations
+
+import sys
+from typing import TextIO
+
+
+class Tracer:
+    """
+    Receives the intermediate values of a hash computed with a tracer, for
+    instance Sha256.hash(message, tracer=tracer): the message schedule of
+    every block, the registers after every round and the hash values after
+    every block. Every method does nothing by default, so subclasses only
+    override the values they need.
+
+    Tracing always runs the didactic implementation in a separate copy of
+    the compression, so hashing without a tracer does not pay for it.
+    """
+
+    def schedule(self, block: int, words: tuple):
+        """
+        Receives the message schedule of a block, that is, the word W[t] of
+        every round.
+
+        :param block: The index of the block in the extended message
+        :param words: The words of the message schedule
+        """
+
+    def round(self, block: int, round_index: int, registers: tuple):
+        """
+        Receives the registers a..h at the end of a round of a block.
+
+        :param block: The index of the block in the extended message
+        :param round_index: The index of the round
+        :param registers: The registers a, b, c, d, e, f, g and h
+        """
+
+    def block(self, block: int, hash_values: tuple):
+        """
+        Receives the hash values once a block is processed.
+
+        :param block: The index of the block in the extended message
+        :param hash_values: The hash values after the block
+        """
+
+
+class RecordingTracer(Tracer):
+    """
+    Records the intermediate values of a hash as integers, with a list per
+    block of the message schedules, the registers of every round and the
+    hash values.
+    """
+
+    def __init__(self):
+        """Constructs a tracer with nothing recorded."""
+        self.schedules: list = []
+        self.rounds: list = []
+        self.hash_values: list = []
+
+    def schedule(self, block: int, words: tuple):
+        self.schedules.append(tuple(int(word) for word in words))
+        self.rounds.append([])
+
+    def round(self, block: int, round_index: int, registers: tuple):
+        self.rounds[block].append(tuple(int(x) for x in registers))
+
+    def block(self, block: int, hash_values: tuple):
+        self.hash_values.append(tuple(int(x) for x in hash_values))
+
+
+class PrintingTracer(Tracer):
+    """Prints the intermediate values of a hash in hexadecimal."""
+
+    def __init__(self, file: TextIO | None = None):
+        """
+        Constructs a tracer that prints to the given file.
+
+        :param file: The file to print to. By default, the standard output
+        """
+        self._file: TextIO = file or sys.stdout
+
+    def schedule(self, block: int, words: tuple):
+        print(f'block {block}', file=self._file)
+        i: int
+        for i in range(0, len(words), 8):
+            print(f'  W[{i:2}..{i + 7:2}] ' + ' '.join(
+                word.hex() for word in words[i:i + 8]), file=self._file)
+
+    def round(self, block: int, round_index: int, registers: tuple):
+        print(f'  t={round_index:2} ' + ' '.join(
+            register.hex() for register in registers), file=self._file)
+
+    def block(self, block: int, hash_values: tuple):
+        print('  H ' + ' '.join(x.hex() for x in hash_values),
+              file=self._file)
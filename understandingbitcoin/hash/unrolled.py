@@ -0,0 +1,207 @@
+"""Implements a fast version of the SHA-2 hash functions whose compression
+function is generated as straight-line Python code on integers."""
+from __future__ import annotations
+
+import random
+import struct
+from functools import lru_cache
+from typing import Callable
+
+from understandingbitcoin.common.bit import BitStream
+from understandingbitcoin.hash.backend import DIDACTIC, OPTIMIZED, \
+    register_backend
+from understandingbitcoin.hash.sha2 import Sha2
+from understandingbitcoin.hash.sha256 import Sha256
+
+# name of the generated compression function
+_FUNCTION_NAME: str = 'compress'
+
+
+def hash_message(message: bytes, algorithm=Sha256) -> bytes:
+    """
+    Returns the hash value in bytes of the given message, compressing every
+    block with the generated compression function.
+
+    :param message: The message to be hashed
+    :param algorithm: The hash function, a subclass of Sha2
+    :return: The hash value in bytes
+    """
+    # pylint: disable=protected-access
+    compress: Callable = compression_function(algorithm)
+    block_size: int = algorithm._BLOCK_SIZE_BYTES
+    length_size: int = algorithm._MESSAGE_LENGTH_SIZE_BYTES
+    word_format: str = _word_format(algorithm)
+
+    # message is extended with the bit '1', zeros and its length in bits
+    k: int = -(len(message) + 1 + length_size) % block_size
+    extended_message: bytes = bytes(message) + b'\x80' + bytes(k) \
+        + (len(message) * 8).to_bytes(length_size, byteorder='big')
+
+    hash_values: tuple = algorithm._H
+    block_format: str = f'>{block_size * 8 // algorithm._WORD_SIZE_BITS}' \
+        + word_format
+    block_start: int
+    for block_start in range(0, len(extended_message), block_size):
+        hash_values = compress(hash_values, struct.unpack_from(
+            block_format, extended_message, block_start))
+
+    digest: bytes = struct.pack(f'>{len(hash_values)}{word_format}',
+                                *hash_values)
+    return digest[:algorithm._DIGEST_SIZE_BYTES]
+
+
+@lru_cache(maxsize=None)
+def compression_function(algorithm=Sha256) -> Callable:
+    """
+    Returns the compression function of the given hash function, generated
+    and compiled the first time it is requested.
+
+    The function receives the hash values and the words of a block as
+    integers and returns the updated hash values. Its rounds are unrolled,
+    the constants are written in the code and the variables are renamed in
+    every round instead of being shifted.
+
+    :param algorithm: The hash function, a subclass of Sha2
+    :return: The compression function
+    """
+    namespace: dict = {}
+    exec(compile(compression_source(algorithm),  # pylint: disable=exec-used
+                 f'<unrolled {algorithm.__name__}>', 'exec'), namespace)
+    return namespace[_FUNCTION_NAME]
+
+
+def compression_source(algorithm=Sha256) -> str:
+    """
+    Returns the Python source code of the compression function of the given
+    hash function.
+
+    :param algorithm: The hash function, a subclass of Sha2
+    :return: The source code of the compression function
+    """
+    # pylint: disable=protected-access
+    if not issubclass(algorithm, Sha2):
+        raise ValueError('the given hash function is not a SHA-2 function')
+
+    num_words: int = algorithm._BLOCK_SIZE_BYTES * 8 \
+        // algorithm._WORD_SIZE_BITS
+    lines: list = [
+        f'def {_FUNCTION_NAME}(hash_values, block_words):',
+        '    (a, b, c, d, e, f, g, h) = hash_values',
+        '    (' + ', '.join(f'w{i}' for i in range(num_words)) + ',) = '
+        + 'block_words',
+    ]
+    lines += _schedule_lines(algorithm, num_words)
+    lines += _round_lines(algorithm)
+    return '\n'.join(lines) + '\n'
+
+
+def check_compression(algorithm=Sha256, num_samples: int = 32,
+                      seed: int | None = None) -> bool:
+    """
+    Checks that the generated compression function gives the same hash
+    values as the didactic one for random hash values and blocks.
+
+    :param algorithm: The hash function, a subclass of Sha2
+    :param num_samples: The number of random inputs compared
+    :param seed: The seed of the random inputs
+    :return: True if both functions give the same hash values
+    """
+    # pylint: disable=protected-access
+    compress: Callable = compression_function(algorithm)
+    word_size: int = algorithm._WORD_SIZE_BITS
+    num_words: int = algorithm._BLOCK_SIZE_BYTES * 8 // word_size
+    generator: random.Random = random.Random(seed)
+
+    for _ in range(num_samples):
+        hash_values: tuple = tuple(generator.getrandbits(word_size)
+                                   for _ in range(len(algorithm._H)))
+        block_words: tuple = tuple(generator.getrandbits(word_size)
+                                   for _ in range(num_words))
+
+        expected: list = [BitStream.from_unsigned_int(n, zfill=word_size)
+                          for n in hash_values]
+        algorithm._process_words(
+            expected, tuple(BitStream.from_unsigned_int(n, zfill=word_size)
+                            for n in block_words))
+
+        if [int(n) for n in expected] \
+                != list(compress(hash_values, block_words)):
+            return False
+
+    return True
+
+
+def _schedule_lines(algorithm, num_words: int) -> list:
+    # pylint: disable=protected-access
+    # a variable per word of the message schedule
+    word_size: int = algorithm._WORD_SIZE_BITS
+    lines: list = []
+    i: int
+    for i in range(num_words, algorithm._ROUNDS):
+        σ0: str = _sigma(f'w{i - 15}', algorithm._σ0_SHIFTS, word_size, True)
+        σ1: str = _sigma(f'w{i - 2}', algorithm._σ1_SHIFTS, word_size, True)
+        lines.append(f'    w{i} = (w{i - 16} + {σ0} + w{i - 7} + {σ1}) '
+                     f'& {_mask(word_size)}')
+
+    return lines
+
+
+def _round_lines(algorithm) -> list:
+    # pylint: disable=protected-access
+    # the new values of a and e get new names in every round, and the rest
+    # of the variables are renamed instead of being shifted
+    word_size: int = algorithm._WORD_SIZE_BITS
+    mask: str = _mask(word_size)
+    (a, b, c, d, e, f, g, h) = ('a', 'b', 'c', 'd', 'e', 'f', 'g', 'h')
+    lines: list = []
+    i: int
+    for i in range(algorithm._ROUNDS):
+        Σ1: str = _sigma(e, algorithm._Σ1_SHIFTS, word_size, False)
+        Σ0: str = _sigma(a, algorithm._Σ0_SHIFTS, word_size, False)
+        lines += [
+            f'    t = {h} + ({Σ1} & {mask}) + ({g} ^ ({e} & ({f} ^ {g}))) '
+            f'+ {hex(algorithm._K[i])} + w{i}',
+            f'    e{i} = ({d} + t) & {mask}',
+            f'    a{i} = (t + ({Σ0} & {mask}) + ({a} & {b} | {c} & ({a} | {b})))'
+            f' & {mask}',
+        ]
+        (a, b, c, d, e, f, g, h) = (f'a{i}', a, b, c, f'e{i}', e, f, g)
+
+    lines.append('    return (' + ', '.join(
+        f'(hash_values[{j}] + {x}) & {mask}'
+        for j, x in enumerate((a, b, c, d, e, f, g, h))) + ')')
+    return lines
+
+
+def _sigma(x: str, shifts: tuple, word_size: int, last_is_shift: bool) -> str:
+    # expression of a σ or Σ function of the given variable, where the σ
+    # functions shift instead of rotating in the last term
+    (r1, r2, r3) = shifts
+    last: str = f'{x} >> {r3}' if last_is_shift else _rotate(x, r3, word_size)
+    return f'({_rotate(x, r1, word_size)} ^ {_rotate(x, r2, word_size)} ' \
+        f'^ {last})'
+
+
+def _rotate(x: str, shifts: int, word_size: int) -> str:
+    # the bits above the word size are removed later with the mask
+    return f'({x} >> {shifts} | {x} << {word_size - shifts})'
+
+
+def _mask(word_size: int) -> str:
+    return hex((1 << word_size) - 1)
+
+
+def _word_format(algorithm) -> str:
+    # format of struct for the words of the hash function
+    return 'Q' if algorithm._WORD_SIZE_BITS == 64 else 'I'  # pylint: disable=protected-access
+
+
+def _hash_optimized(algorithm: type, message: bytes) -> bytes:
+    # the rest of the hash functions have no optimized implementation yet
+    if not issubclass(algorithm, Sha2):
+        return algorithm.hash(message, backend=DIDACTIC)
+
+    return hash_message(message, algorithm)
+
+
+register_backend(OPTIMIZED, _hash_optimized)
@@ -0,0 +1,2 @@
+"""The modules contained in this package define the mining process of the
+blocks used in Bitcoin."""
@@ -0,0 +1,212 @@
+"""Implements the proof-of-work search and validation of block headers."""
+from __future__ import annotations
+
+import multiprocessing
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, \
+    ProcessPoolExecutor, wait
+
+from understandingbitcoin.hash.sha256 import Sha256
+
+# size in bytes of a serialized block header
+HEADER_SIZE_BYTES: int = 80
+# position in bytes of the fields of the block header that are changed
+_BITS_OFFSET: int = 72
+_NONCE_OFFSET: int = 76
+# number of bytes of the header hashed into the midstate
+_MIDSTATE_SIZE_BYTES: int = 64
+
+# event shared by the worker processes to stop as soon as one of them finds
+# a valid nonce
+_stop_event = None
+
+
+class NonceSearchResult:
+    """
+    Defines the outcome of a nonce search: the valid nonce and header, if
+    any, and the figures to measure the hashing throughput.
+    """
+
+    def __init__(self, header: bytes | None, hashes: int, seconds: float,
+                 workers: int):
+        """
+        Constructs the result of a nonce search.
+
+        :param header: The header with the valid nonce, or None if no nonce
+        in the range is valid
+        :param hashes: The number of headers hashed
+        :param seconds: The elapsed time of the search in seconds
+        :param workers: The number of processes used in the search
+        """
+        self.header: bytes | None = header
+        self.hashes: int = hashes
+        self.seconds: float = seconds
+        self.workers: int = workers
+
+    @property
+    def nonce(self) -> int | None:
+        """Returns the valid nonce, or None if it has not been found."""
+        if self.header is None:
+            return None
+
+        return int.from_bytes(self.header[_NONCE_OFFSET:], byteorder='little')
+
+    @property
+    def block_hash(self) -> bytes | None:
+        """Returns the hash of the valid header in internal byte order."""
+        return None if self.header is None else Sha256.hash256(self.header)
+
+    @property
+    def hashes_per_second(self) -> float:
+        """Returns the number of headers hashed per second."""
+        return self.hashes / self.seconds if self.seconds > 0 else 0.0
+
+    @property
+    def hashes_per_second_per_worker(self) -> float:
+        """Returns the number of headers hashed per second and process."""
+        return self.hashes_per_second / self.workers
+
+
+def bits_to_target(bits: int) -> int:
+    """
+    Returns the target represented by the given compact bits, where the
+    first byte is the exponent and the last three bytes are the mantissa.
+
+    :param bits: The compact representation of the target
+    :return: The target as an unsigned integer
+    """
+    if not 0 <= bits <= 0xffffffff:
+        raise ValueError('the given bits are not a 32-bit unsigned integer')
+
+    if bits & 0x00800000:
+        raise ValueError('the given bits represent a negative target')
+
+    exponent: int = bits >> 24
+    mantissa: int = bits & 0x007fffff
+    if exponent <= 3:
+        return mantissa >> (8 * (3 - exponent))
+
+    return mantissa << (8 * (exponent - 3))
+
+
+def check_proof_of_work(header: bytes) -> bool:
+    """
+    Returns true if the hash of the given header, read as a little-endian
+    number, is not greater than the target of its bits field.
+
+    :param header: The serialized 80-byte block header
+    :return: True if the header has a valid proof of work
+    """
+    _check_header(header)
+    bits: int = int.from_bytes(header[_BITS_OFFSET:_NONCE_OFFSET],
+                               byteorder='little')
+    return int.from_bytes(Sha256.hash256(header),
+                          byteorder='little') <= bits_to_target(bits)
+
+
+def search_nonce(header: bytes, bits: int | None = None,
+                 nonces: range = range(2 ** 32),
+                 max_workers: int | None = None,
+                 chunk_size: int = 1024) -> NonceSearchResult:
+    """
+    Searches a nonce that makes the hash of the given header not greater
+    than the target, splitting the range of nonces across processes.
+
+    The first 64 bytes of the header do not depend on the nonce, so they are
+    hashed once into a midstate and every nonce only compresses the last
+    block of the header and the block of the second hash. All the processes
+    stop as soon as one of them finds a valid nonce.
+
+    :param header: The serialized 80-byte header template
+    :param bits: The compact target, written into the bits field of the
+    header. By default, the bits field of the header
+    :param nonces: The range of nonces to search
+    :param max_workers: The number of processes. By default, the number of
+    processors of the machine
+    :param chunk_size: The number of nonces searched by a process at once
+    :return: The result of the search
+    """
+    _check_header(header)
+    if nonces.step != 1 or not 0 <= nonces.start <= nonces.stop <= 2 ** 32:
+        raise ValueError('the given range of nonces is not valid')
+
+    if bits is not None:
+        header = header[:_BITS_OFFSET] + bits.to_bytes(4, byteorder='little') \
+            + header[_NONCE_OFFSET:]
+
+    max_workers = max_workers or os.cpu_count() or 1
+    stop_event = multiprocessing.Event()
+    started: float = time.perf_counter()
+
+    header_found: bytes | None = None
+    hashes: int = 0
+    with ProcessPoolExecutor(max_workers, initializer=_init_worker,
+                             initargs=(stop_event,)) as executor:
+        ranges = (nonces[i:i + chunk_size]
+                  for i in range(0, len(nonces), chunk_size))
+        nonce_header: bytes | None
+        range_hashes: int
+        for nonce_header, range_hashes in _search_ranges(
+                executor, header, ranges, stop_event, 2 * max_workers):
+            hashes += range_hashes
+            if header_found is None and nonce_header is not None:
+                header_found = nonce_header
+                stop_event.set()
+
+    return NonceSearchResult(header_found, hashes,
+                             time.perf_counter() - started, max_workers)
+
+
+def _search_ranges(executor: ProcessPoolExecutor, header: bytes, ranges,
+                   stop_event, max_pending: int):
+    # submits the ranges of nonces as the processes become free, until a
+    # valid nonce is found, and yields the result of every range
+    pending: set[Future] = set()
+    nonce_range: range
+    for nonce_range in ranges:
+        if stop_event.is_set():
+            break
+
+        pending.add(executor.submit(_search_range, header, nonce_range))
+        if len(pending) >= max_pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            yield from (future.result() for future in done)
+
+    # processes still running stop at the next nonce once the event is set
+    for future in pending:
+        yield future.result()
+
+
+def _check_header(header: bytes):
+    if len(header) != HEADER_SIZE_BYTES:
+        raise ValueError('the given header is not 80 bytes long')
+
+
+def _init_worker(stop_event):
+    global _stop_event  # pylint: disable=global-statement
+    _stop_event = stop_event
+
+
+def _search_range(header: bytes, nonces: range) -> tuple:
+    bits: int = int.from_bytes(header[_BITS_OFFSET:_NONCE_OFFSET],
+                               byteorder='little')
+    target: int = bits_to_target(bits)
+    midstate: bytes = Sha256(header[:_MIDSTATE_SIZE_BYTES]).midstate()
+    tail: bytes = header[_MIDSTATE_SIZE_BYTES:_NONCE_OFFSET]
+
+    hashes: int = 0
+    nonce: int
+    for nonce in nonces:
+        if _stop_event.is_set():
+            break
+
+        nonce_bytes: bytes = nonce.to_bytes(4, byteorder='little')
+        block_hash: bytes = Sha256.hash256_from_midstate(
+            midstate, tail + nonce_bytes, _MIDSTATE_SIZE_BYTES)
+        hashes += 1
+        if int.from_bytes(block_hash, byteorder='little') <= target:
+            _stop_event.set()
+            return header[:_NONCE_OFFSET] + nonce_bytes, hashes
+
+    return None, hashes